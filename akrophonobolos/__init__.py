@@ -6,3 +6,23 @@ function for manipulating instances of this class.
 
 
 from .akrophonobolos import *
+from .scanner import *
+from .standards import *
+from .schedule import *
+from .purse import *
+from .templates import *
+from .reconciliation import *
+from .validation import *
+from .apportionment import *
+from .amount_index import *
+from .linear import *
+from .interval import *
+from .engines import *
+from .editions import *
+from .aggregate import *
+from .editor import *
+from .ledger import *
+
+# batch, parallel, epidoc, and synthetic need file, XML, and process
+# support that most uses do not, so they are not loaded here. Import
+# them as submodules, e.g. ``from akrophonobolos import epidoc``
@@ -0,0 +1,317 @@
+"""
+Totals, extremes, and quantiles of amounts by group, in bounded memory.
+
+"""
+
+from collections import namedtuple
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import Khremata, _quarter_value
+
+__all__ = ["SKETCH_K", "Summary", "QuantileSketch", "AmountStats",
+           "GroupAggregator"]
+
+
+# Default accuracy of quantile sketches. Quantiles are within about
+# 1/SKETCH_K of the true rank
+SKETCH_K = 200
+
+Summary = namedtuple("Summary", ["count", "total", "min", "max", "mean",
+                                 "quantiles"])
+Summary.__doc__ = """Statistics of one group: the number of amounts,
+their exact total, minimum, maximum, and mean (:py:class:`Khremata`),
+and a dictionary of estimated quantiles"""
+
+
+class QuantileSketch:
+    """A mergeable summary of a stream of numbers for estimating
+    quantiles."""
+
+    def __init__(self, k=SKETCH_K):
+        """:param k: Accuracy. Larger values are more accurate and use
+                  more memory
+        :type k: int
+
+        The sketch keeps a few levels of sorted samples (after
+        Karnin, Lang, and Liberty, "Optimal Quantile Approximation in
+        Streams", 2016). When a level is full, every other item is
+        moved up to the next level, where each item stands for twice as
+        many. The number of items kept grows only with the logarithm
+        of the number added.
+
+        """
+        self.k = k
+        self.n = 0
+        self.levels = [[]]
+        self._size = 0
+        self._limit = self._max_size()
+        self._flip = 0
+
+    def __len__(self):
+        return self.n
+
+    def add(self, x):
+        """
+        :param x: Number to add
+        :type x: int, fractions.Fraction
+        """
+        self.levels[0].append(x)
+        self.n += 1
+        self._size += 1
+        if self._size > self._limit:
+            self._compress()
+
+    def merge(self, other):
+        """Add all the numbers summarized by another sketch
+
+        :param other: Sketch to merge into this one
+        :type other: QuantileSketch
+
+        """
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+
+        for level, items in zip(self.levels, other.levels):
+            level.extend(items)
+
+        self.n += other.n
+        self._size += other._size
+        self._limit = self._max_size()
+        self._compress()
+
+    def quantile(self, q):
+        """Estimate a quantile
+
+        :param q: Quantile, from 0 to 1 (0.5 for the median)
+        :type q: float, fractions.Fraction
+        :return: Estimated value, or None if the sketch is empty
+        :rtype: int, fractions.Fraction
+
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs):
+        """Estimate several quantiles at once
+
+        :param qs: Quantiles, from 0 to 1
+        :type qs: iterable of float, fractions.Fraction
+        :rtype: list
+
+        """
+        weighted = sorted((x, 1 << h) for h, level in enumerate(self.levels)
+                          for x in level)
+        total = sum(w for _, w in weighted)
+        results = []
+
+        for q in qs:
+            if not 0 <= q <= 1:
+                raise ValueError(f"Quantile {q} is not between 0 and 1")
+
+            target = q * total
+            seen = 0
+            value = None
+            for x, w in weighted:
+                seen += w
+                value = x
+                if seen >= target:
+                    break
+            results.append(value)
+
+        return results
+
+    def _capacity(self, h):
+        return max(2, int(self.k * (2 / 3) ** (len(self.levels) - h - 1)))
+
+    def _max_size(self):
+        return sum(self._capacity(h) for h in range(len(self.levels)))
+
+    def _compress(self):
+        while self._size > self._limit:
+            for h, items in enumerate(self.levels):
+                if len(items) >= self._capacity(h):
+                    break
+
+            if h + 1 == len(self.levels):
+                self.levels.append([])
+                self._limit = self._max_size()
+
+            items.sort()
+            keep = [items.pop()] if len(items) % 2 else []
+            self._flip ^= 1
+            promoted = items[self._flip::2]
+            self.levels[h + 1].extend(promoted)
+            self.levels[h] = keep
+            self._size -= len(items) - len(promoted)
+
+
+class AmountStats:
+    """Exact count, total, minimum and maximum of a stream of amounts,
+    with a :py:class:`QuantileSketch` for quantiles."""
+
+    def __init__(self, k=SKETCH_K):
+        """:param k: Accuracy of the quantile sketch
+        :type k: int
+
+        Amounts are kept in quarter oboloí, as integers unless they are
+        finer than that.
+
+        """
+        self.count = 0
+        self.q_total = 0
+        self.q_min = None
+        self.q_max = None
+        self.sketch = QuantileSketch(k)
+
+    def add(self, amt):
+        """
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        """
+        q = _quarter_value(amt)
+        self.count += 1
+        self.q_total += q
+        if self.q_min is None or q < self.q_min:
+            self.q_min = q
+        if self.q_max is None or q > self.q_max:
+            self.q_max = q
+        self.sketch.add(q)
+
+    def merge(self, other):
+        """
+        :param other: Statistics to add to these
+        :type other: AmountStats
+        """
+        if not other.count:
+            return
+
+        self.count += other.count
+        self.q_total += other.q_total
+        self.q_min = other.q_min if self.q_min is None \
+            else min(self.q_min, other.q_min)
+        self.q_max = other.q_max if self.q_max is None \
+            else max(self.q_max, other.q_max)
+        self.sketch.merge(other.sketch)
+
+    @property
+    def total(self):
+        """Exact total as :py:class:`Khremata`"""
+        return _amount(self.q_total)
+
+    @property
+    def min(self):
+        """Smallest amount as :py:class:`Khremata`"""
+        return None if self.q_min is None else _amount(self.q_min)
+
+    @property
+    def max(self):
+        """Largest amount as :py:class:`Khremata`"""
+        return None if self.q_max is None else _amount(self.q_max)
+
+    @property
+    def mean(self):
+        """Exact mean as :py:class:`Khremata`"""
+        if not self.count:
+            return None
+
+        return _amount(Fraction(self.q_total, self.count))
+
+    def quantile(self, q):
+        """Estimate a quantile, such as 0.5 for the median
+
+        :param q: Quantile, from 0 to 1
+        :type q: float, fractions.Fraction
+        :rtype: Khremata
+
+        """
+        value = self.sketch.quantile(q)
+        return None if value is None else _amount(value)
+
+    def summary(self, qs=(0.25, 0.5, 0.75)):
+        """
+        :param qs: Quantiles to estimate
+        :type qs: iterable of float, fractions.Fraction
+        :rtype: Summary
+        """
+        qs = tuple(qs)
+        return Summary(self.count, self.total, self.min, self.max, self.mean,
+                       {q: None if v is None else _amount(v)
+                        for q, v in zip(qs, self.sketch.quantiles(qs))})
+
+
+class GroupAggregator:
+    """Statistics of amounts grouped by a key, such as year or city."""
+
+    def __init__(self, k=SKETCH_K):
+        """:param k: Accuracy of the quantile sketches
+        :type k: int
+
+        Each group keeps an :py:class:`AmountStats`, so memory grows
+        with the number of groups but not with the number of amounts.
+        Aggregators built by separate workers over parts of the data can
+        be combined with :py:meth:`merge`.
+
+        >>> agg = obol.GroupAggregator()
+        >>> agg.add_many([("Athens", "ΤΤ"), ("Athens", "Τ"), ("Samos", "Χ")])
+        >>> agg["Athens"].total
+        Khremata (3t [= 108000.0 obols])
+
+        """
+        self.k = k
+        self.groups = {}
+
+    def __len__(self):
+        return len(self.groups)
+
+    def __contains__(self, key):
+        return key in self.groups
+
+    def __getitem__(self, key):
+        """:rtype: AmountStats"""
+        return self.groups[key]
+
+    def keys(self):
+        return self.groups.keys()
+
+    def add(self, key, amt):
+        """
+        :param key: Group
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        """
+        stats = self.groups.get(key)
+        if stats is None:
+            stats = self.groups[key] = AmountStats(self.k)
+        stats.add(amt)
+
+    def add_many(self, pairs):
+        """
+        :param pairs: (group, amount) pairs
+        :type pairs: iterable of tuples
+        """
+        add = self.add
+        for key, amt in pairs:
+            add(key, amt)
+
+    def merge(self, other):
+        """Add the statistics of another aggregator to this one
+
+        :param other: Aggregator to merge
+        :type other: GroupAggregator
+
+        """
+        for key, stats in other.groups.items():
+            if key not in self.groups:
+                self.groups[key] = AmountStats(self.k)
+            self.groups[key].merge(stats)
+
+    def summary(self, qs=(0.25, 0.5, 0.75)):
+        """
+        :param qs: Quantiles to estimate
+        :type qs: iterable of float, fractions.Fraction
+        :return: The summary of each group
+        :rtype: dict
+        """
+        return {key: stats.summary(qs) for key, stats in self.groups.items()}
+
+
+def _amount(q):
+    return Khremata(Fraction(q, 4))
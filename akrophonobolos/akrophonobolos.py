@@ -1,9 +1,22 @@
-from enum import IntFlag
+from contextlib import contextmanager
+from enum import Enum, IntFlag
 from fractions import Fraction
-import math
+import operator
 import re
+import threading
 from akrophonobolos.__version__ import __version__
 
+__all__ = ["UnparseableMonetaryString", "UndefinedMonetaryOperation", "AMT",
+           "GREEK_AMT", "Fmt", "Rounding", "FloatPolicy", "Context",
+           "DEFAULT_CONTEXT", "getcontext", "setcontext", "localcontext",
+           "NUMERALS", "FMT_TDO", "QUARTERS", "QUARTER_NUMERALS", "Khremata",
+           "pack_amounts", "unpack_amounts", "LazyKhremata", "rec_reduce",
+           "valid_greek_amount", "valid_amount_str", "parse_amount",
+           "parse_greek_amount", "format_amount", "interest_rate", "interest",
+           "loan_term", "principal", "roundup_to_quarter_obol",
+           "ROUNDING_RULES", "round_amount", "round_amounts", "greek_quarters",
+           "version"]
+
 
 class UnparseableMonetaryString(Exception):
     pass
@@ -27,6 +40,136 @@ class Fmt(IntFlag):
     FRACTION = 1
 
 
+class Rounding(Enum):
+    """Policies for rounding amounts"""
+
+    CEIL = 1
+    FLOOR = 2
+    NEAREST = 3
+    HALF_EVEN = 4
+    OBOL = 5
+    DRACHMA = 6
+
+
+class FloatPolicy(Enum):
+    """Ways of converting floats into amounts"""
+
+    EXACT = 1
+    SHORTEST = 2
+
+
+class Context:
+    """Settings for arithmetic with amounts."""
+
+    def __init__(self, max_denominator=None, rounding=Rounding.CEIL,
+                 floats=FloatPolicy.EXACT):
+        """:param max_denominator: If given, every amount created is
+                                approximated by the closest fraction with
+                                a denominator no larger than this
+        :type max_denominator: int
+        :param rounding: Default rounding for :py:func:`interest`,
+                         :py:func:`principal`, and other functions that
+                         round their results
+        :type rounding: Rounding
+        :param floats: How floats are converted. With
+                       :py:attr:`FloatPolicy.EXACT` the exact binary
+                       value is used, so that 0.1 becomes
+                       3602879701896397/36028797018963968. With
+                       :py:attr:`FloatPolicy.SHORTEST` the shortest
+                       decimal that rounds to the float is used, so
+                       that 0.1 becomes 1/10
+        :type floats: FloatPolicy
+
+        The current context is kept per thread. Use
+        :py:func:`getcontext`, :py:func:`setcontext`, and
+        :py:func:`localcontext` to change it.
+
+        """
+        self.max_denominator = max_denominator
+        self.rounding = rounding
+        self.floats = floats
+
+    def copy(self):
+        """
+        :rtype: Context
+        """
+        return Context(self.max_denominator, self.rounding, self.floats)
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__} (max_denominator="
+            f"{self.max_denominator}, rounding={self.rounding}, "
+            f"floats={self.floats})"
+        )
+
+
+DEFAULT_CONTEXT = Context()
+
+_local = threading.local()
+
+
+def getcontext():
+    """Return the arithmetic context of the current thread.
+
+    :rtype: Context
+
+    A thread starts with a copy of :py:data:`DEFAULT_CONTEXT`.
+
+    """
+    try:
+        return _local.context
+    except AttributeError:
+        _local.context = DEFAULT_CONTEXT.copy()
+        return _local.context
+
+
+def setcontext(context):
+    """Set the arithmetic context of the current thread.
+
+    :param context: New context
+    :type context: Context
+
+    """
+    _local.context = context
+
+
+# The engine selected with akrophonobolos.engines.set_engine, or None
+# when the reference implementation is in use
+_engine = None
+
+
+def _use_engine(engine):
+    global _engine
+    _engine = engine
+
+
+@contextmanager
+def localcontext(context=None, **kwargs):
+    """Use a different arithmetic context within a ``with`` block.
+
+    :param context: Context to copy, defaults to the current context
+    :type context: Context
+    :param kwargs: Settings to change in the copy, such as ``max_denominator``
+
+    >>> with obol.localcontext(floats=obol.FloatPolicy.SHORTEST):
+    ...     obol.Khremata(0.1).b
+    Fraction(1, 10)
+
+    """
+    saved = getcontext()
+    context = (saved if context is None else context).copy()
+    for name, value in kwargs.items():
+        if not hasattr(context, name):
+            raise AttributeError(f"Context has no setting {name}")
+        setattr(context, name, value)
+
+    setcontext(context)
+    try:
+        yield context
+    finally:
+        setcontext(saved)
+
+
 # Amounts are stored internally obols and can be fractional
 # 1 talent = 36,000 obols
 # 1 drachma = 6 obols
@@ -55,6 +198,12 @@ NUMERALS = {
 
 FMT_TDO = (NUMERALS["Τ"], NUMERALS["𐅂"])
 
+# Values of the numerals in quarter obols
+QUARTERS = {k: int(v * 4) for k, v in NUMERALS.items()}
+
+# Numerals, from largest to smallest, as (value in quarter obols, numeral)
+QUARTER_NUMERALS = tuple((v, k) for k, v in QUARTERS.items())
+
 # # Not used:
 # # 10147 𐅇 GREEK ACROPHONIC ATTIC FIFTY THOUSAND
 
@@ -80,38 +229,18 @@ class Khremata:
         Amounts are stored internally as a possibly fractional amount
         of obols. The ``limit`` parameter can be used to set a maximum
         value of the denominator for fractional values. See
-        fractions.Fraction.limit_denominator.
+        fractions.Fraction.limit_denominator. If it is not given, the
+        ``max_denominator`` of the current :py:class:`Context` is used.
 
         """
 
         self.b = self._parse_amt(amt, limit)
 
     def _parse_amt(self, amt, limit):
-        if isinstance(amt, Fraction):
-            if limit is None:
-                return amt
-            amt.limit_denominator(limit)
-
-        if isinstance(amt, int):
-            return amt * Fraction(4, 4)
+        if _engine is not None and limit is None and isinstance(amt, str):
+            return _engine.parse(amt)
 
-        if isinstance(amt, float):
-            if limit is None:
-                return Fraction.from_float(amt) * Fraction(4, 4)
-            return Fraction.from_float(amt).limit_denominator(limit)
-
-        if isinstance(amt, Khremata):
-            if limit is None:
-                return amt.b
-            return amt.b.limit_denominator(limit)
-
-        if valid_greek_amount(amt):
-            return parse_greek_amount(amt)
-
-        if valid_amount_str(amt):
-            return parse_amount(amt)
-
-        raise UnparseableMonetaryString(f"Cannot parse {amt} as monetary amount")
+        return _parse_khremata(amt, limit)
 
     def as_abbr(self, decimal=False):
         """
@@ -125,13 +254,18 @@ class Khremata:
 
         return format_amount(self.b, Fmt.ABBR)
 
-    def as_greek(self):
+    def as_greek(self, rounding=None):
         """
+        :param rounding: How to round to a quarter obolós (or whole obolós or drakhmḗ). By default the closest quarter obolós is used
+        :type rounding: Rounding
         :return: Monetary amount as Greek acrophonic numerals
         :rtype: str
         """
 
-        return format_amount(self.b.limit_denominator(4), Fmt.GREEK)
+        if rounding is None:
+            return format_amount(self.b.limit_denominator(4), Fmt.GREEK)
+
+        return format_amount(round_amount(self.b, rounding), Fmt.GREEK)
 
     def as_phrase(self, decimal=False):
         """
@@ -202,15 +336,15 @@ class Khremata:
 
     def __add__(self, other):
         if isinstance(other, Khremata):
-            return Khremata(self.b + other.b)
+            return _result(self.b + other.b)
 
-        return Khremata(self.b + Khremata(other).b)
+        return _result(self.b + Khremata(other).b)
 
     def __sub__(self, other):
         if isinstance(other, Khremata):
-            return Khremata(self.b - other.b)
+            return _result(self.b - other.b)
 
-        return Khremata(self.b - Khremata(other).b)
+        return _result(self.b - Khremata(other).b)
 
     def __mul__(self, other):
         """
@@ -222,15 +356,16 @@ class Khremata:
             )
 
         if isinstance(other, Fraction):
-            return Khremata(self.b * other)
+            return _result(self.b * other)
 
         return Khremata(self.b * float(other))
 
     def __truediv__(self, other):
         # The units cancel out when a Khremata id divided by a
-        # Khremata, so return a Fraction
+        # Khremata, so return a Fraction. It is a ratio, not an
+        # amount, so the context's max_denominator does not apply
         if isinstance(other, Khremata):
-            return Khremata(self.b / other.b).b
+            return self.b / other.b
 
         # otherwise treat the divisor as a float and return an Khremata
         return Khremata(self.b / float(other))
@@ -238,12 +373,233 @@ class Khremata:
     def __hash__(self):
         return hash(self.b)
 
+    def __reduce__(self):
+        q = _quarters(self.b)
+        if q is None:
+            return (Khremata, (self.b,))
+
+        return (_from_quarters, (q,))
+
+    def to_bytes(self):
+        """
+        :return: Compact binary encoding of the amount
+        :rtype: bytes
+
+        Whole numbers of quarter oboloí, which includes every amount
+        that can be written in acrophonic numerals, take a few
+        bytes. Other amounts are encoded as a numerator and
+        denominator. See :py:func:`pack_amounts` for encoding many
+        amounts at once.
+
+        """
+        buf = bytearray()
+        _encode_amount(self.b, buf)
+        return bytes(buf)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        :param data: Amount encoded by :py:meth:`to_bytes`
+        :type data: bytes
+        :rtype: Khremata
+        :raise ValueError: If ``data`` is not a single encoded amount
+        """
+        b, pos = _decode_amount(data, 0)
+        if pos != len(data):
+            raise ValueError("Extra data after encoded amount")
+
+        return cls(b)
+
+
+def _from_quarters(q):
+    """Create a Khremata from quarter obols without parsing."""
+    amt = Khremata.__new__(Khremata)
+    amt.b = Fraction(q, 4)
+    return amt
+
+
+def _encode_varint(n, buf):
+    while n > 0x7F:
+        buf.append((n & 0x7F) | 0x80)
+        n >>= 7
+    buf.append(n)
+
+
+def _decode_varint(data, pos):
+    n = 0
+    shift = 0
+    while True:
+        try:
+            byte = data[pos]
+        except IndexError:
+            raise ValueError("Truncated encoded amount") from None
+        pos += 1
+        n |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _encode_amount(b, buf):
+    # The low bit says whether the amount is a (zigzag-encoded)
+    # number of quarter obols or a numerator followed by a denominator
+    if 4 % b.denominator:
+        num = b.numerator
+        _encode_varint(((num << 1 if num >= 0 else (-num << 1) - 1) << 1)
+                       | 1, buf)
+        _encode_varint(b.denominator, buf)
+        return
+
+    q = b.numerator * (4 // b.denominator)
+    _encode_varint((q << 1 if q >= 0 else (-q << 1) - 1) << 1, buf)
+
+
+def _decode_amount(data, pos):
+    n, pos = _decode_varint(data, pos)
+    z = n >> 1
+    value = -((z + 1) >> 1) if z & 1 else z >> 1
+
+    if n & 1:
+        den, pos = _decode_varint(data, pos)
+        return Fraction(value, den), pos
+
+    return Fraction(value, 4), pos
+
+
+def pack_amounts(amts):
+    """Encode a sequence of amounts as bytes.
+
+    :param amts: Amounts to encode
+    :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+    :rtype: bytes
+
+    Each amount is encoded as by :py:meth:`Khremata.to_bytes`, after a
+    count of the amounts.
+
+    """
+    bs = [a.b if isinstance(a, Khremata) else Khremata(a).b for a in amts]
+    buf = bytearray()
+    _encode_varint(len(bs), buf)
+    for b in bs:
+        _encode_amount(b, buf)
+
+    return bytes(buf)
+
+
+def unpack_amounts(data):
+    """Decode amounts encoded by :py:func:`pack_amounts`.
+
+    :param data: Encoded amounts
+    :type data: bytes
+    :rtype: list of Khremata
+    :raise ValueError: If ``data`` is truncated or has extra data
+
+    """
+    count, pos = _decode_varint(data, 0)
+    amts = []
+    for _ in range(count):
+        b, pos = _decode_amount(data, pos)
+        amt = Khremata.__new__(Khremata)
+        amt.b = b
+        amts.append(amt)
+
+    if pos != len(data):
+        raise ValueError("Extra data after encoded amounts")
+
+    return amts
+
+
+class LazyKhremata(Khremata):
+    """A :py:class:`Khremata` that is parsed when it is first used."""
+
+    def __init__(self, amt, limit=None):
+        """:param amt: Monetary amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :param limit: max denominator for fractions
+        :type limit: int
+
+        Takes the same arguments as :py:class:`Khremata`, but only
+        stores them. The amount is parsed the first time its value is
+        needed for arithmetic, comparison, or formatting, so an
+        :py:class:`UnparseableMonetaryString` error is raised then,
+        not here. The original input is always available, unparsed,
+        as :py:attr:`raw`.
+
+        """
+        self.raw = amt
+        self._limit = limit
+        self._b = None
+
+    @property
+    def b(self):
+        """The amount in obols, parsed on first access
+
+        :rtype: fractions.Fraction
+        """
+        if self._b is None:
+            self._b = self._parse_amt(self.raw, self._limit)
+
+        return self._b
+
+    @property
+    def parsed(self):
+        """True if the amount has been parsed
+
+        :rtype: bool
+        """
+        return self._b is not None
+
+    def __reduce__(self):
+        return (LazyKhremata, (self.raw, self._limit))
+
 
 def _qo(*amt):
     """Convert tuple amount to fractional obols."""
     return amt[0] * Fraction(36_000, 1) + amt[1] * Fraction(6, 1) + Fraction(amt[2])
 
 
+def _quarters(amt):
+    """Convert an amount to an integer number of quarter obols.
+
+    Returns None if the amount is not a whole number of quarter obols.
+    """
+    b = amt.b if isinstance(amt, Khremata) else Fraction(amt)
+    if 4 % b.denominator:
+        return None
+
+    return b.numerator * (4 // b.denominator)
+
+
+def _whole_quarters(amt):
+    """Convert an amount to an integer number of quarter obols, raising
+    ValueError if it is not a whole number of them."""
+    q = _quarters(amt if isinstance(amt, Khremata) else Khremata(amt))
+    if q is None:
+        raise ValueError(f"{amt} is not a whole number of quarter obols")
+
+    return q
+
+
+def _quarter_value(amt):
+    """Convert an amount to quarter obols, as an int when it is a whole
+    number of quarter obols and a Fraction otherwise."""
+    b = amt.b if isinstance(amt, Khremata) else Khremata(amt).b
+    q = b * 4
+    return q.numerator if q.denominator == 1 else q
+
+
+def _obols(amt):
+    """Convert an amount to exact obols, without the context's limit on
+    the denominator for ints and Fractions."""
+    if isinstance(amt, Khremata):
+        return amt.b
+
+    if isinstance(amt, (int, Fraction)):
+        return Fraction(amt)
+
+    return Khremata(amt).b
+
+
 def rec_reduce(amt, denominations):
     """Recursively reduce obols to t/d/o."""
     if denominations:
@@ -326,6 +682,69 @@ def parse_greek_amount(amt):
     return sum([NUMERALS[c] for c in list(amt)])
 
 
+def _parse_khremata(amt, limit):
+    if isinstance(amt, int):
+        return amt * Fraction(4, 4)
+
+    try:
+        context = _local.context
+    except AttributeError:
+        context = getcontext()
+
+    if limit is None:
+        limit = context.max_denominator
+
+    if isinstance(amt, Fraction):
+        if limit is None:
+            return amt
+        return amt.limit_denominator(limit)
+
+    if isinstance(amt, float):
+        b = _from_float(amt, context.floats)
+        if limit is None:
+            return b
+        return b.limit_denominator(limit)
+
+    if isinstance(amt, Khremata):
+        if limit is None:
+            return amt.b
+        return amt.b.limit_denominator(limit)
+
+    if valid_greek_amount(amt):
+        return parse_greek_amount(amt)
+
+    if valid_amount_str(amt):
+        if limit is None:
+            return parse_amount(amt)
+        return parse_amount(amt).limit_denominator(limit)
+
+    raise UnparseableMonetaryString(f"Cannot parse {amt} as monetary amount")
+
+
+def _from_float(amt, floats):
+    """Convert a float to a Fraction as a FloatPolicy says."""
+    if floats is FloatPolicy.SHORTEST:
+        return Fraction(repr(amt))
+
+    return Fraction.from_float(amt) * Fraction(4, 4)
+
+
+def _result(b):
+    """Create a Khremata for the result of arithmetic on fractions.
+
+    Only the context's max_denominator applies, so this skips the
+    parsing done by Khremata.
+    """
+    try:
+        limit = _local.context.max_denominator
+    except AttributeError:
+        limit = getcontext().max_denominator
+
+    amt = Khremata.__new__(Khremata)
+    amt.b = b if limit is None else b.limit_denominator(limit)
+    return amt
+
+
 def format_amount(amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
     """Format monetary amount as a string
 
@@ -349,8 +768,18 @@ def format_amount(amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
     :py:flag:mem:`Fmt.GREEK`
 
     """
+    if _engine is not None:
+        return _engine.format(amt, fmt_flags)
+
+    return _format_amount(amt, fmt_flags)
+
+
+def _format_amount(amt, fmt_flags):
     if fmt_flags & Fmt.GREEK:
-        return "".join(_fmt_akrophonic(roundup_to_quarter_obol(amt)))
+        # Round up to a whole number of quarter obols exactly, without
+        # converting to float
+        b = Fraction(amt.b if isinstance(amt, Khremata) else amt)
+        return greek_quarters(_ceil_div(b.numerator * 4, b.denominator))
 
     if fmt_flags & Fmt.ENGLISH:
         return _fmt_tdo(
@@ -400,7 +829,7 @@ def interest_rate(p=Khremata("5t"), d=1, r=Khremata("1d")):
     return r / (p * d)
 
 
-def interest(p, d, r=interest_rate(), roundup=True):
+def interest(p, d, r=interest_rate(), roundup=True, rounding=None):
     """
     Calculate interest on principal p for d days at rate r
 
@@ -412,15 +841,23 @@ def interest(p, d, r=interest_rate(), roundup=True):
     :type r: fractions.Fraction, int, float
     :param roundup: If True, result is rounded up to nearest quarter obolós. If False, the exact amount is returned
     :type roundup: bool
+    :param rounding: How the result is rounded if ``roundup`` is True. Defaults to the rounding of the current :py:class:`Context` (up to the quarter obolós)
+    :type rounding: Rounding
     :rtype: Kremata
 
     """
+    if _engine is not None:
+        return _engine.interest(p, d, r, roundup, rounding)
+
+    return _interest(p, d, r, roundup, rounding)
+
 
+def _interest(p, d, r, roundup, rounding):
     if not isinstance(p, Khremata):
-        return interest(Khremata(p), d, r, roundup)
+        return _interest(Khremata(p), d, r, roundup, rounding)
 
     if roundup:
-        return roundup_to_quarter_obol(p * r * d)
+        return round_amount(p * r * d, rounding or getcontext().rounding)
 
     return p * r * d
 
@@ -449,7 +886,7 @@ def loan_term(p, i, r=interest_rate(), roundoff=True):
     return i / (p * r)
 
 
-def principal(i, d, r=interest_rate(), roundup=True):
+def principal(i, d, r=interest_rate(), roundup=True, rounding=None):
     """
     Calculate the principal if loan returned i interest after d days at rate r
 
@@ -461,14 +898,23 @@ def principal(i, d, r=interest_rate(), roundup=True):
     :type r: fractions.Fraction, int, float
     :param roundup: If True, result is rounded up to nearest quarter obolós. If False, the exact amount is returned
     :type roundup: bool
+    :param rounding: How the result is rounded if ``roundup`` is True. Defaults to the rounding of the current :py:class:`Context` (up to the quarter obolós)
+    :type rounding: Rounding
     :rtype: Khremata
 
     """
+    if _engine is not None:
+        return _engine.principal(i, d, r, roundup, rounding)
+
+    return _principal(i, d, r, roundup, rounding)
+
+
+def _principal(i, d, r, roundup, rounding):
     if not isinstance(i, Khremata):
-        return principal(Khremata(i), d, r, roundup)
+        return _principal(Khremata(i), d, r, roundup, rounding)
 
     if roundup:
-        return roundup_to_quarter_obol(i / (d * r))
+        return round_amount(i / (d * r), rounding or getcontext().rounding)
 
     return i / (d * r)
 
@@ -482,14 +928,131 @@ def roundup_to_quarter_obol(o):
 
     If passed an instance of :py:class:`Khremata`, the return value
     will also be an instance of :py:class:`Khremata`. Otherwise the
-    return value will be a float.
+    return value will be a float. Use :py:func:`round_amount` to get
+    an exact :py:class:`fractions.Fraction` instead.
 
     """
 
     if isinstance(o, Khremata):
-        return Khremata(roundup_to_quarter_obol(o.b))
+        return Khremata(round_amount(o.b))
+
+    return float(round_amount(o))
+
+
+def _ceil_div(n, d):
+    return -(-n // d)
+
+
+def _nearest_div(n, d):
+    return (2 * n + d) // (2 * d)
+
+
+def _half_even_div(n, d):
+    q, r = divmod(n, d)
+    if 2 * r > d or (2 * r == d and q % 2):
+        return q + 1
+
+    return q
+
+
+def _trunc_div(n, d):
+    return n // d if n >= 0 else -(-n // d)
+
+
+# Unit to round to, and how, for each policy
+ROUNDING_RULES = {
+    Rounding.CEIL: (Fraction(1, 4), _ceil_div),
+    Rounding.FLOOR: (Fraction(1, 4), operator.floordiv),
+    Rounding.NEAREST: (Fraction(1, 4), _nearest_div),
+    Rounding.HALF_EVEN: (Fraction(1, 4), _half_even_div),
+    Rounding.OBOL: (Fraction(1), _trunc_div),
+    Rounding.DRACHMA: (Fraction(6), _trunc_div),
+}
+
+
+def round_amount(o, rounding=Rounding.CEIL):
+    """Round a value to a quarter obol, obol, or drachma.
+
+    :param o: Value to be rounded
+    :type o: Khremata, fractions.Fraction, int, float
+    :param rounding: Rounding policy. Defaults to rounding up to the quarter obol
+    :type rounding: Rounding
+    :rtype: Khremata, fractions.Fraction
+
+    :py:attr:`Rounding.CEIL`, :py:attr:`Rounding.FLOOR`,
+    :py:attr:`Rounding.NEAREST` (halves rounded up), and
+    :py:attr:`Rounding.HALF_EVEN` round to a quarter obolós.
+    :py:attr:`Rounding.OBOL` and :py:attr:`Rounding.DRACHMA` truncate to a
+    whole obolós or drakhmḗ.
+
+    The rounding is exact, using only integer arithmetic. If passed
+    an instance of :py:class:`Khremata`, the return value will also
+    be an instance of :py:class:`Khremata`. Otherwise the return value
+    will be a :py:class:`fractions.Fraction`.
+
+    """
+
+    if isinstance(o, Khremata):
+        return Khremata(round_amount(o.b, rounding))
+
+    unit, div = ROUNDING_RULES[rounding]
+    o = Fraction(o)
+    return div(o.numerator * unit.denominator,
+               o.denominator * unit.numerator) * unit
+
+
+def round_amounts(amts, rounding=Rounding.CEIL):
+    """Round a sequence of values to a quarter obol, obol, or drachma.
+
+    :param amts: Values to be rounded
+    :type amts: iterable of Khremata, fractions.Fraction, int, float
+    :param rounding: Rounding policy. Defaults to rounding up to the quarter obol
+    :type rounding: Rounding
+    :rtype: list
+
+    Equivalent to ``[round_amount(o, rounding) for o in amts]`` but
+    looks up the policy only once.
+
+    """
+
+    unit, div = ROUNDING_RULES[rounding]
+    un, ud = unit.numerator, unit.denominator
+    rounded = []
+    append = rounded.append
+
+    for o in amts:
+        if isinstance(o, Khremata):
+            b = o.b
+            append(Khremata(Fraction(div(b.numerator * ud, b.denominator * un)
+                                     * un, ud)))
+        elif isinstance(o, int):
+            append(Fraction(div(o * ud, un) * un, ud))
+        else:
+            b = Fraction(o)
+            append(Fraction(div(b.numerator * ud, b.denominator * un)
+                            * un, ud))
+
+    return rounded
+
+
+def greek_quarters(q):
+    """Format a number of quarter oboloí as Greek acrophonic numerals
+
+    :param q: Amount in quarter oboloí
+    :type q: int
+    :rtype: str
+
+    The same as formatting with :py:attr:`Fmt.GREEK`, but using only
+    integer arithmetic.
+
+    """
+    parts = []
+    for value, numeral in QUARTER_NUMERALS:
+        if q >= value:
+            count, q = divmod(q, value)
+            parts.append(numeral * count)
 
-    return math.ceil(o * 4) / 4
+    return "".join(parts)
 
 
 def _fmt_akrophonic(amt):
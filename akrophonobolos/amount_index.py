@@ -0,0 +1,120 @@
+"""
+A sorted index of amounts for range and nearest-value lookups.
+
+"""
+
+from bisect import bisect_left, bisect_right
+from fractions import Fraction
+from operator import itemgetter
+from akrophonobolos.akrophonobolos import Khremata, _quarter_value
+
+__all__ = ["AmountIndex"]
+
+
+class AmountIndex:
+    """Amounts with attached payloads, sorted for fast lookups."""
+
+    def __init__(self, items=()):
+        """:param items: (amount, payload) pairs to index
+        :type items: iterable of tuples
+
+        Amounts can be anything :py:class:`Khremata` accepts. They are
+        kept as a sorted list of integer keys (in quarter oboloí, or a
+        :py:class:`fractions.Fraction` for amounts finer than that), so
+        lookups are binary searches that compare plain numbers.
+
+        """
+
+        pairs = sorted(((_quarter_value(amt), payload)
+                        for amt, payload in items), key=itemgetter(0))
+        self.keys = [k for k, _ in pairs]
+        self.payloads = [p for _, p in pairs]
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        """Iterate over (Khremata, payload) pairs in order of amount"""
+        return iter(self._items(0, len(self.keys)))
+
+    def insert(self, amt, payload=None):
+        """Add an amount to the index
+
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :param payload: Value attached to the amount
+
+        Amounts equal to ones already in the index are placed after
+        them.
+
+        """
+        key = _quarter_value(amt)
+        i = bisect_right(self.keys, key)
+        self.keys.insert(i, key)
+        self.payloads.insert(i, payload)
+
+    def range(self, lo=None, hi=None):
+        """Find amounts between two bounds, inclusive
+
+        :param lo: Lower bound, or None for no lower bound
+        :type lo: str, float, int, fraction.Fraction, Khremata
+        :param hi: Upper bound, or None for no upper bound
+        :type hi: str, float, int, fraction.Fraction, Khremata
+        :return: (Khremata, payload) pairs in order of amount
+        :rtype: list
+
+        """
+        start = 0 if lo is None \
+            else bisect_left(self.keys, _quarter_value(lo))
+        end = len(self.keys) if hi is None \
+            else bisect_right(self.keys, _quarter_value(hi))
+        return self._items(start, end)
+
+    def exact(self, amt):
+        """Find the payloads of amounts equal to ``amt``
+
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :rtype: list
+
+        """
+        key = _quarter_value(amt)
+        return self.payloads[bisect_left(self.keys, key):
+                             bisect_right(self.keys, key)]
+
+    def nearest(self, amt, k=1):
+        """Find the amounts closest to ``amt``
+
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :param k: Number of amounts to find
+        :type k: int
+        :return: (Khremata, payload) pairs, closest first. Of two equally
+                 close amounts the smaller comes first
+        :rtype: list
+
+        """
+        key = _quarter_value(amt)
+        keys = self.keys
+        right = bisect_left(keys, key)
+        left = right - 1
+        found = []
+
+        while len(found) < k and (left >= 0 or right < len(keys)):
+            if right >= len(keys) or \
+               (left >= 0 and key - keys[left] <= keys[right] - key):
+                found.append(left)
+                left -= 1
+            else:
+                found.append(right)
+                right += 1
+
+        return [(_amount(keys[i]), self.payloads[i]) for i in found]
+
+    def _items(self, start, end):
+        return [(_amount(k), p) for k, p in
+                zip(self.keys[start:end], self.payloads[start:end])]
+
+
+def _amount(key):
+    return Khremata(Fraction(key, 4))
@@ -0,0 +1,146 @@
+"""
+Split amounts into shares without losing anything to rounding.
+
+"""
+
+from enum import Enum
+from fractions import Fraction
+import math
+from akrophonobolos.akrophonobolos import (Khremata, _whole_quarters,
+                                           round_amount)
+
+__all__ = ["Allocation", "quota", "apportion", "apportion_many"]
+
+
+class Allocation(Enum):
+    """Policies for giving out the quarter obols left over when an
+    amount does not divide exactly"""
+
+    LARGEST_REMAINDER = 1
+    FIRST = 2
+    LAST = 3
+    LARGEST_SHARE = 4
+
+
+def quota(amt, ratio, rounding=None):
+    """Calculate an exact fraction of an amount.
+
+    :param amt: Amount
+    :type amt: str, float, int, fraction.Fraction, Khremata
+    :param ratio: Fraction of ``amt`` to take, such as ``Fraction(1, 60)``
+    :type ratio: fractions.Fraction, int
+    :param rounding: If given, how to round the result
+    :type rounding: Rounding
+    :rtype: Khremata
+
+    Unlike multiplying a :py:class:`Khremata` by a number, the ratio is
+    never converted to a float.
+
+    """
+
+    if not isinstance(amt, Khremata):
+        amt = Khremata(amt)
+
+    share = Khremata(amt.b * Fraction(ratio))
+
+    if rounding is None:
+        return share
+
+    return round_amount(share, rounding)
+
+
+def apportion(amt, weights, policy=Allocation.LARGEST_REMAINDER):
+    """Divide an amount into shares in proportion to weights.
+
+    :param amt: Amount to divide, in whole quarter oboloí
+    :type amt: str, float, int, fraction.Fraction, Khremata
+    :param weights: Relative size of each share
+    :type weights: sequence of int, fraction.Fraction, float
+    :param policy: Which shares get the quarter oboloí left over
+    :type policy: Allocation
+    :return: Shares, which add up exactly to ``amt``
+    :rtype: list of Khremata
+    :raise ValueError: If ``amt`` is not a whole number of quarter
+                       oboloí, or the weights are negative or all zero
+
+    Each share is first rounded down to the quarter obolós. The
+    quarter oboloí left over, fewer than the number of shares, are
+    then given out one at a time to the shares with the largest
+    remainders (:py:attr:`Allocation.LARGEST_REMAINDER`), to the first
+    or last shares that were rounded down (:py:attr:`Allocation.FIRST`,
+    :py:attr:`Allocation.LAST`), or to the rounded-down shares with the
+    largest weights (:py:attr:`Allocation.LARGEST_SHARE`).
+
+    """
+
+    return _apportion(_whole_quarters(amt), _int_weights(weights), policy)
+
+
+def apportion_many(amts, weights, policy=Allocation.LARGEST_REMAINDER):
+    """Divide each of many amounts into shares in proportion to weights.
+
+    :param amts: Amounts to divide
+    :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+    :param weights: Relative size of each share
+    :type weights: sequence of int, fraction.Fraction, float
+    :param policy: Which shares get the quarter oboloí left over
+    :type policy: Allocation
+    :rtype: list of lists of Khremata
+
+    Equivalent to calling :py:func:`apportion` for each amount, but
+    the weights are prepared only once.
+
+    """
+
+    weights = _int_weights(weights)
+    return [_apportion(_whole_quarters(amt), weights, policy)
+            for amt in amts]
+
+
+def _int_weights(weights):
+    """Scale weights to integers with the same ratios."""
+
+    weights = [Fraction(w) for w in weights]
+    if any(w < 0 for w in weights) or not any(weights):
+        raise ValueError("Weights must be non-negative and not all zero")
+
+    scale = _lcm([w.denominator for w in weights])
+    ints = [int(w * scale) for w in weights]
+    return ints, sum(ints)
+
+
+def _lcm(nums):
+    result = 1
+    for n in nums:
+        result = result * n // math.gcd(result, n)
+
+    return result
+
+
+def _apportion(q, weights, policy):
+    ints, total = weights
+    shares = []
+    remainders = []
+
+    for w in ints:
+        share, rem = divmod(q * w, total)
+        shares.append(share)
+        remainders.append(rem)
+
+    left = q - sum(shares)
+    if left:
+        rounded = [i for i, r in enumerate(remainders) if r]
+
+        if policy is Allocation.LARGEST_REMAINDER:
+            rounded.sort(key=lambda i: -remainders[i])
+        elif policy is Allocation.LAST:
+            rounded.reverse()
+        elif policy is Allocation.LARGEST_SHARE:
+            rounded.sort(key=lambda i: -ints[i])
+        elif policy is not Allocation.FIRST:
+            raise ValueError(f"Unknown allocation policy {policy}")
+
+        for i in rounded[:left]:
+            shares[i] += 1
+
+    return [Khremata(Fraction(s, 4)) for s in shares]
@@ -0,0 +1,120 @@
+"""
+Long-running batch jobs that can be stopped and resumed.
+
+"""
+
+from itertools import islice
+import json
+import os
+
+__all__ = ["CHUNK_LINES", "run_resumable"]
+
+
+# Number of input lines processed between checkpoints
+CHUNK_LINES = 1000
+
+
+def run_resumable(source, output, process, checkpoint=None,
+                  chunk_lines=CHUNK_LINES, header_lines=0, prelude=""):
+    """Process a file in chunks of lines, recording progress so that an
+    interrupted run can be resumed.
+
+    :param source: Path of the input file
+    :type source: str
+    :param output: Path of the output file
+    :type output: str
+    :param process: Function called with a list of input lines and a
+                    list of the header lines, returning the output for
+                    those lines as a string
+    :type process: callable
+    :param checkpoint: Path of the checkpoint file, or None to run
+                       without one
+    :type checkpoint: str
+    :param chunk_lines: Number of input lines in each chunk
+    :type chunk_lines: int
+    :param header_lines: Number of lines at the start of the input (such
+                         as a CSV header) passed to every call of
+                         ``process`` instead of being processed
+    :type header_lines: int
+    :param prelude: Text written at the start of the output
+    :type prelude: str
+    :return: Number of chunks processed by this call
+    :rtype: int
+    :raise ValueError: If the checkpoint belongs to a different job
+
+    After each chunk the output is flushed to disk and the position
+    reached in both files is written to the checkpoint, replacing the
+    old one atomically. If the checkpoint exists when the job starts,
+    the output is cut back to the recorded length, discarding anything
+    written after the last checkpoint, and the input is read from the
+    recorded position. The output of a resumed run is therefore the
+    same as that of an uninterrupted one, as long as ``process`` gives
+    the same output for the same lines. The checkpoint is removed when
+    the job finishes.
+
+    Each record must be on a single line of the input.
+
+    """
+
+    job = {"source": os.path.abspath(source),
+           "output": os.path.abspath(output)}
+    state = _load_checkpoint(checkpoint)
+    if state is not None and any(state[k] != v for k, v in job.items()):
+        raise ValueError(f"Checkpoint {checkpoint} is for a different job")
+
+    chunks = 0
+    with open(source, "rb") as fin:
+        header = [fin.readline().decode("utf-8")
+                  for _ in range(header_lines)]
+
+        if state is None:
+            fout = open(output, "wb")
+            fout.write(prelude.encode("utf-8"))
+            chunk = 0
+        else:
+            fout = open(output, "r+b")
+            fout.truncate(state["size"])
+            fout.seek(state["size"])
+            fin.seek(state["offset"])
+            chunk = state["chunk"]
+
+        with fout:
+            while True:
+                lines = list(islice(fin, chunk_lines))
+                if not lines:
+                    break
+
+                fout.write(process([line.decode("utf-8") for line in lines],
+                                   header).encode("utf-8"))
+                chunk += 1
+                chunks += 1
+
+                if checkpoint is not None:
+                    fout.flush()
+                    os.fsync(fout.fileno())
+                    _save_checkpoint(checkpoint, {**job, "chunk": chunk,
+                                                  "offset": fin.tell(),
+                                                  "size": fout.tell()})
+
+    if checkpoint is not None and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+
+    return chunks
+
+
+def _load_checkpoint(checkpoint):
+    if checkpoint is None or not os.path.exists(checkpoint):
+        return None
+
+    with open(checkpoint) as f:
+        return json.load(f)
+
+
+def _save_checkpoint(checkpoint, state):
+    tmp = f"{checkpoint}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(state, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp, checkpoint)
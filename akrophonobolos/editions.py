@@ -0,0 +1,205 @@
+"""
+Compare the amounts of two editions of an account.
+
+"""
+
+from collections import namedtuple
+from enum import Enum
+from akrophonobolos.akrophonobolos import (_quarter_value, interest,
+                                           interest_rate, loan_term)
+from akrophonobolos.validation import ParseError, try_parse
+
+__all__ = ["Change", "EntryChange", "EditionComparison", "compare_editions"]
+
+
+class Change(Enum):
+    """How an entry differs between editions"""
+
+    ADDED = 1
+    REMOVED = 2
+    CHANGED = 3
+
+
+EntryChange = namedtuple("EntryChange", [
+    "key", "change", "deltas", "old", "new", "interest", "term"])
+EntryChange.__doc__ = """An entry that differs between editions: its
+key, a :py:class:`Change`, the difference (new - old) in quarter oboloí
+of each amount field that changed (None if either value is missing or
+cannot be read), the old and new rows (None if absent), and the
+interest and term recalculated from the new row (None if it does not
+have the amounts needed)"""
+
+
+class EditionComparison:
+    """The differences between two editions of an account."""
+
+    def __init__(self, fields):
+        """:param fields: The amount fields compared
+        :type fields: tuple
+
+        ``added``, ``removed``, and ``changed`` hold
+        :py:class:`EntryChange` records in the order of the new edition
+        (the old for ``removed``). ``unchanged`` is the number of
+        entries that are the same in both, and ``totals`` holds the
+        change in the total of each field, in quarter oboloí, over the
+        entries in both editions.
+
+        """
+        self.fields = fields
+        self.added = []
+        self.removed = []
+        self.changed = []
+        self.unchanged = 0
+        self.totals = dict.fromkeys(fields, 0)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__} ({len(self.added)} added, "
+                f"{len(self.removed)} removed, {len(self.changed)} changed, "
+                f"{self.unchanged} unchanged)")
+
+    def __iter__(self):
+        """Iterate over all added, removed, and changed entries"""
+        yield from self.added
+        yield from self.changed
+        yield from self.removed
+
+
+def compare_editions(old, new, key="id", fields=("principal", "interest"),
+                     days="days", rate=interest_rate()):
+    """Compare the entries of two editions of an account
+
+    :param old: Rows of the earlier edition
+    :type old: iterable of dict
+    :param new: Rows of the later edition
+    :type new: iterable of dict
+    :param key: Field identifying an entry in both editions
+    :type key: str
+    :param fields: Fields holding amounts, in any form
+                   :py:class:`Khremata` accepts
+    :type fields: tuple
+    :param days: Field holding the number of days of a loan, or None
+    :type days: str
+    :param rate: Interest rate for recalculating interest and terms
+    :type rate: fractions.Fraction
+    :rtype: EditionComparison
+    :raise ValueError: If a key appears more than once in an edition
+
+    The old edition is put in a dictionary by key and each new row is
+    looked up in it, so the comparison takes time in proportion to the
+    number of rows. Fields with the same text in both editions are not
+    parsed. Interest (from the first field, as principal, and the
+    days) and the term (from the first and second fields, as principal
+    and interest) are recalculated only for added and changed entries.
+
+    >>> old = [{"id": "1", "principal": "𐅊", "interest": "ΤΤ"}]
+    >>> new = [{"id": "1", "principal": "𐅊", "interest": "ΤΤΧ"}]
+    >>> obol.compare_editions(old, new).changed[0].deltas
+    {'interest': 24000}
+
+    """
+    fields = tuple(fields)
+    compared = fields + ((days,) if days else ())
+    old_rows = {}
+    for row in old:
+        k = row[key]
+        if k in old_rows:
+            raise ValueError(f"Key {k} appears more than once in the old "
+                             "edition")
+        old_rows[k] = row
+
+    result = EditionComparison(fields)
+    seen = set()
+
+    for row in new:
+        k = row[key]
+        if k in seen:
+            raise ValueError(f"Key {k} appears more than once in the new "
+                             "edition")
+        seen.add(k)
+
+        before = old_rows.get(k)
+        if before is None:
+            result.added.append(EntryChange(
+                k, Change.ADDED, {}, None, row,
+                *_recalculate(row, fields, days, rate)))
+            continue
+
+        deltas = {}
+        differs = False
+        for field in compared:
+            a = before.get(field)
+            b = row.get(field)
+            if a == b:
+                continue
+
+            if field == days:
+                differs = differs or _days(a) != _days(b)
+                continue
+
+            qa = _quarters(a)
+            qb = _quarters(b)
+            if qa is not None and qb is not None:
+                if qa != qb:
+                    deltas[field] = qb - qa
+                    result.totals[field] += qb - qa
+            elif not (_blank(a) and _blank(b)):
+                deltas[field] = None
+
+        if deltas or differs:
+            result.changed.append(EntryChange(
+                k, Change.CHANGED, deltas, before, row,
+                *_recalculate(row, fields, days, rate)))
+        else:
+            result.unchanged += 1
+
+    for k, row in old_rows.items():
+        if k not in seen:
+            result.removed.append(EntryChange(
+                k, Change.REMOVED, {}, row, None, None, None))
+
+    return result
+
+
+def _blank(value):
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def _quarters(value):
+    if _blank(value):
+        return None
+
+    amt, error = try_parse(value)
+    if error is not ParseError.OK:
+        return None
+
+    return _quarter_value(amt)
+
+
+def _days(value):
+    if _blank(value):
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _amount(value):
+    if _blank(value):
+        return None
+
+    amt, error = try_parse(value)
+    return amt if error is ParseError.OK else None
+
+
+def _recalculate(row, fields, days, rate):
+    p = _amount(row.get(fields[0])) if fields else None
+    d = _days(row.get(days)) if days else None
+    i = _amount(row.get(fields[1])) if len(fields) > 1 else None
+
+    new_interest = interest(p, d, rate) if p is not None and d else None
+    term = loan_term(p, i, rate) if p is not None and p.b and i is not None \
+        else None
+
+    return new_interest, term
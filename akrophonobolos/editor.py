@@ -0,0 +1,233 @@
+"""
+A Greek numeral that is edited one symbol at a time, as in a
+transcription editor.
+
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+from akrophonobolos.akrophonobolos import (QUARTER_NUMERALS, QUARTERS, Fmt,
+                                           Khremata, format_amount)
+
+__all__ = ["RENDER_CACHE", "EditableNumeral"]
+
+
+# Number of renderings of each kind kept for reuse
+RENDER_CACHE = 256
+
+
+class EditableNumeral:
+    """A Greek acrophonic numeral that keeps its value up to date as it
+    is edited."""
+
+    def __init__(self, text=""):
+        """:param text: Initial numeral
+        :type text: str
+
+        Each edit updates the value, the counts of each symbol, and the
+        number of symbols out of order by looking only at the symbols
+        next to the edit, so the value and validity never require
+        reading the whole numeral again. Renderings are cached by value,
+        so undoing an edit or typing a numeral seen before costs nothing.
+
+        The symbols are kept in a list, so an edit still shifts the
+        symbols after it: inserting or deleting k symbols takes O(k)
+        time for the bookkeeping plus one O(n) block move of the list,
+        which is fast for numerals of any length written by hand. The
+        text is joined again only when it is read after an edit.
+
+        Characters that are not numerals (such as brackets) are allowed
+        and counted, but add nothing to the value.
+
+        >>> num = obol.EditableNumeral("ΤΗΗ")
+        >>> num.insert(1, "𐅅")
+        >>> num.as_abbr()
+        '1t 700d'
+        >>> num.canonical
+        True
+
+        """
+        self.symbols = []
+        self.quarters = 0
+        self.counts = {}
+        self.invalid = 0
+        self.unordered = 0
+        self._text = ""
+        self.insert(0, text)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __str__(self):
+        return self.text
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ({self.text!r})"
+
+    @property
+    def text(self):
+        """The numeral as a string"""
+        if self._text is None:
+            self._text = "".join(self.symbols)
+        return self._text
+
+    @property
+    def b(self):
+        """Value in oboloí, as a :py:class:`fractions.Fraction`"""
+        return Fraction(self.quarters, 4)
+
+    @property
+    def khremata(self):
+        """Value as :py:class:`Khremata`"""
+        return Khremata(self.b)
+
+    @property
+    def valid(self):
+        """True if the numeral is not empty and has only numerals, as
+        for :py:func:`valid_greek_amount`"""
+        return bool(self.symbols) and not self.invalid
+
+    @property
+    def canonical(self):
+        """True if the numeral is valid and written in the standard
+        way: largest symbols first, with the fewest symbols (so ΙΙΙΙΙΙ
+        is valid but not canonical, since it should be 𐅂)"""
+        if not self.valid or self.unordered:
+            return False
+
+        q = self.quarters
+        counts = self.counts
+        for value, numeral in QUARTER_NUMERALS:
+            n, q = divmod(q, value)
+            if counts.get(numeral, 0) != n:
+                return False
+
+        return True
+
+    def append(self, text):
+        """
+        :param text: Symbols to add at the end
+        :type text: str
+        """
+        self.insert(len(self.symbols), text)
+
+    def insert(self, pos, text):
+        """
+        :param pos: Position to insert at
+        :type pos: int
+        :param text: Symbols to insert
+        :type text: str
+        """
+        if not text:
+            return
+
+        symbols = self.symbols
+        pos = max(0, min(pos, len(symbols)))
+        before = symbols[pos - 1] if pos else None
+        after = symbols[pos] if pos < len(symbols) else None
+
+        self._pair(before, after, -1)
+        prev = before
+        for symbol in text:
+            self._count(symbol, 1)
+            self._pair(prev, symbol, 1)
+            prev = symbol
+        self._pair(prev, after, 1)
+
+        symbols[pos:pos] = text
+        self._text = None
+
+    def delete(self, pos, n=1):
+        """
+        :param pos: Position of the first symbol to delete
+        :type pos: int
+        :param n: Number of symbols to delete
+        :type n: int
+        :raise IndexError: If there are no symbols at ``pos``
+        """
+        symbols = self.symbols
+        if not 0 <= pos < len(symbols) or n < 1:
+            raise IndexError(f"No symbols to delete at {pos}")
+
+        end = min(pos + n, len(symbols))
+        before = symbols[pos - 1] if pos else None
+        after = symbols[end] if end < len(symbols) else None
+
+        prev = before
+        for symbol in symbols[pos:end]:
+            self._count(symbol, -1)
+            self._pair(prev, symbol, -1)
+            prev = symbol
+        self._pair(prev, after, -1)
+        self._pair(before, after, 1)
+
+        del symbols[pos:end]
+        self._text = None
+
+    def __delitem__(self, pos):
+        self.delete(pos)
+
+    def replace(self, pos, text):
+        """Replace the symbol at ``pos``
+
+        :param pos: Position
+        :type pos: int
+        :param text: New symbols
+        :type text: str
+
+        """
+        self.delete(pos)
+        self.insert(pos, text)
+
+    def as_greek(self):
+        """
+        :return: Canonical form of the value
+        :rtype: str
+        """
+        return _render(self.quarters, Fmt.GREEK)
+
+    def as_phrase(self, decimal=False):
+        """
+        :param decimal: Format as decimal if True, otherwise as a fraction
+        :type decimal: bool
+        :rtype: str
+        """
+        return _render(self.quarters, Fmt.ENGLISH |
+                       (Fmt.DECIMAL if decimal else Fmt.FRACTION))
+
+    def as_abbr(self, decimal=False):
+        """
+        :param decimal: Format as decimal if True, otherwise as a fraction
+        :type decimal: bool
+        :rtype: str
+        """
+        return _render(self.quarters,
+                       Fmt.ABBR | Fmt.DECIMAL if decimal else Fmt.ABBR)
+
+    def _count(self, symbol, sign):
+        value = QUARTERS.get(symbol)
+        if value is None:
+            self.invalid += sign
+            return
+
+        self.quarters += sign * value
+        n = self.counts.get(symbol, 0) + sign
+        if n:
+            self.counts[symbol] = n
+        else:
+            del self.counts[symbol]
+
+    def _pair(self, left, right, sign):
+        """Count a pair of neighbouring symbols that is out of order"""
+        if left is None or right is None:
+            return
+
+        lv = QUARTERS.get(left)
+        rv = QUARTERS.get(right)
+        if lv is not None and rv is not None and lv < rv:
+            self.unordered += sign
+
+
+@lru_cache(maxsize=RENDER_CACHE)
+def _render(quarters, fmt_flags):
+    return format_amount(Fraction(quarters, 4), fmt_flags)
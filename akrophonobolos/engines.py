@@ -0,0 +1,313 @@
+"""
+Interchangeable implementations of the core operations, with a mode
+that checks a fast implementation against the reference one.
+
+The engine selected with :py:func:`set_engine` parses the strings
+given to :py:class:`Khremata` and carries out :py:func:`format_amount`,
+:py:func:`interest`, and :py:func:`principal`. The reference engine
+uses the implementations in the core module directly.
+
+"""
+
+from collections import namedtuple
+from fractions import Fraction
+import random
+import threading
+from akrophonobolos import akrophonobolos as core
+from akrophonobolos.akrophonobolos import (GREEK_AMT, QUARTERS, Fmt, Khremata,
+                                           Rounding, _quarters, getcontext,
+                                           greek_quarters, interest_rate)
+
+__all__ = ["UnknownEngine", "Divergence", "ReferenceEngine", "QuarterEngine",
+           "VerifyingEngine", "ENGINES", "register_engine", "get_engine",
+           "set_engine"]
+
+
+class UnknownEngine(Exception):
+    pass
+
+
+Divergence = namedtuple("Divergence",
+                        ["operation", "args", "result", "expected"])
+Divergence.__doc__ = """An operation on which a
+:py:class:`VerifyingEngine` gave a different result from its reference
+engine: the name of the operation, its arguments, and the two results
+(exceptions are recorded as results)"""
+
+
+class ReferenceEngine:
+    """The operations as defined by :py:class:`Khremata`,
+    :py:func:`format_amount`, :py:func:`interest`, and
+    :py:func:`principal`."""
+
+    name = "reference"
+
+    def parse(self, amt):
+        """
+        :param amt: Monetary amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :return: Amount in oboloí
+        :rtype: fractions.Fraction
+        """
+        return core._parse_khremata(amt, None)
+
+    def format(self, amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
+        """
+        :param amt: Amount in oboloí
+        :type amt: fractions.Fraction, Khremata
+        :param fmt_flags: Formatting options as for :py:func:`format_amount`
+        :type fmt_flags: Fmt
+        :rtype: str
+        """
+        return core._format_amount(_b(amt), fmt_flags)
+
+    def interest(self, p, d, r=interest_rate(), roundup=True, rounding=None):
+        """Same as :py:func:`interest`"""
+        return core._interest(p, d, r, roundup, rounding)
+
+    def principal(self, i, d, r=interest_rate(), roundup=True, rounding=None):
+        """Same as :py:func:`principal`"""
+        return core._principal(i, d, r, roundup, rounding)
+
+
+class QuarterEngine(ReferenceEngine):
+    """Faster operations on whole quarter oboloí using only integers.
+
+    Anything else (amounts with finer fractions, abbreviated strings,
+    formats other than Greek numerals, and rounding other than
+    :py:attr:`Rounding.CEIL`) is passed to :py:class:`ReferenceEngine`.
+
+    """
+
+    name = "quarters"
+
+    def parse(self, amt):
+        if isinstance(amt, str) and GREEK_AMT.search(amt):
+            values = QUARTERS
+            return Fraction(sum([values[c] for c in amt]), 4)
+
+        if isinstance(amt, int):
+            return Fraction(amt)
+
+        return super().parse(amt)
+
+    def format(self, amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
+        if fmt_flags & Fmt.GREEK:
+            q = _b(amt) * 4
+            if q >= 0:
+                return greek_quarters(-(-q.numerator // q.denominator))
+
+        return super().format(amt, fmt_flags)
+
+    def interest(self, p, d, r=interest_rate(), roundup=True, rounding=None):
+        q = self._fast(p, d, r, roundup, rounding)
+        if q is None:
+            return super().interest(p, d, r, roundup, rounding)
+
+        # 4i = 4p * r * d, rounded up
+        r = Fraction(r)
+        return Khremata(Fraction(-(-q * r.numerator * d // r.denominator),
+                                 4))
+
+    def principal(self, i, d, r=interest_rate(), roundup=True, rounding=None):
+        q = self._fast(i, d, r, roundup, rounding)
+        if q is None or not d or not r:
+            return super().principal(i, d, r, roundup, rounding)
+
+        # 4p = 4i / (d * r), rounded up
+        r = Fraction(r)
+        return Khremata(Fraction(-(-q * r.denominator //
+                                   (d * r.numerator)), 4))
+
+    def _fast(self, amt, d, r, roundup, rounding):
+        if not roundup or not isinstance(d, int) or d < 0 or \
+           not isinstance(r, (int, Fraction)) or r < 0 or \
+           (rounding or getcontext().rounding) is not Rounding.CEIL:
+            return None
+
+        return _quarters(amt if isinstance(amt, Khremata)
+                         else Khremata(amt))
+
+
+class VerifyingEngine:
+    """An engine that checks a sample of its operations against a
+    reference engine."""
+
+    def __init__(self, engine, reference=None, sample=0.01, seed=None,
+                 max_divergences=1000, on_divergence=None):
+        """:param engine: Engine whose results are returned
+        :type engine: ReferenceEngine
+        :param reference: Engine to check against, defaults to a
+                          :py:class:`ReferenceEngine`
+        :type reference: ReferenceEngine
+        :param sample: Fraction of operations to check, from 0 to 1
+        :type sample: float
+        :param seed: Seed for choosing the operations to check
+        :type seed: int
+        :param max_divergences: Number of divergences to keep in
+                                ``divergences``
+        :type max_divergences: int
+        :param on_divergence: Function called with each
+                              :py:class:`Divergence`
+        :type on_divergence: callable
+
+        The results of ``engine`` are always returned, so checking
+        costs only the sampled calls to ``reference``. ``checked``
+        counts the operations checked and ``divergences`` holds those
+        that gave different results.
+
+        """
+        self.engine = engine
+        self.reference = reference or ReferenceEngine()
+        self.sample = sample
+        self.max_divergences = max_divergences
+        self.on_divergence = on_divergence
+        self.name = f"verifying-{engine.name}"
+        self.checked = 0
+        self.divergences = []
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._running = threading.local()
+
+    def parse(self, amt):
+        """See :py:meth:`ReferenceEngine.parse`"""
+        return self._call("parse", (amt,))
+
+    def format(self, amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
+        """See :py:meth:`ReferenceEngine.format`"""
+        return self._call("format", (amt, fmt_flags))
+
+    def interest(self, p, d, r=interest_rate(), roundup=True, rounding=None):
+        """See :py:meth:`ReferenceEngine.interest`"""
+        return self._call("interest", (p, d, r, roundup, rounding))
+
+    def principal(self, i, d, r=interest_rate(), roundup=True, rounding=None):
+        """See :py:meth:`ReferenceEngine.principal`"""
+        return self._call("principal", (i, d, r, roundup, rounding))
+
+    def _call(self, operation, args):
+        # Operations started by another one (such as parsing the amounts
+        # given to interest) go to the engine running it, unchecked, so
+        # that the reference result is computed by the reference alone
+        running = getattr(self._running, "engine", None)
+        if running is not None:
+            return getattr(running, operation)(*args)
+
+        result = self._run(self.engine, operation, args)
+
+        with self._lock:
+            check = self._rng.random() < self.sample
+
+        if check:
+            expected = self._run(self.reference, operation, args)
+            self._compare(operation, args, result, expected)
+
+        if isinstance(result, Exception):
+            raise result
+
+        return result
+
+    def _run(self, engine, operation, args):
+        self._running.engine = engine
+        try:
+            return getattr(engine, operation)(*args)
+        except Exception as e:
+            return e
+        finally:
+            self._running.engine = None
+
+    def _compare(self, operation, args, result, expected):
+        if isinstance(result, Exception) or isinstance(expected, Exception):
+            same = type(result) is type(expected)
+        else:
+            same = result == expected
+
+        divergence = None
+        with self._lock:
+            self.checked += 1
+            if not same:
+                divergence = Divergence(operation, args, result, expected)
+                if len(self.divergences) < self.max_divergences:
+                    self.divergences.append(divergence)
+
+        if divergence is not None and self.on_divergence is not None:
+            self.on_divergence(divergence)
+
+
+ENGINES = {}
+
+_current = None
+
+
+def register_engine(engine):
+    """Make an engine available to :py:func:`set_engine`
+
+    :param engine: Engine, registered under its ``name``
+    :type engine: ReferenceEngine
+
+    """
+    ENGINES[engine.name] = engine
+
+
+def get_engine(name=None):
+    """
+    :param name: Name of a registered engine, or None for the current one
+    :type name: str
+    :rtype: ReferenceEngine
+    :raise UnknownEngine: If no engine is registered as ``name``
+    """
+    if name is None:
+        return _current
+
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise UnknownEngine(f"No engine named {name}") from None
+
+
+def set_engine(engine, verify=None, **kwargs):
+    """Choose the engine returned by :py:func:`get_engine`
+
+    :param engine: Engine or the name of a registered engine
+    :type engine: str, ReferenceEngine
+    :param verify: If given, wrap the engine in a
+                   :py:class:`VerifyingEngine` that checks this fraction
+                   of operations
+    :type verify: float
+    :param kwargs: Other arguments for :py:class:`VerifyingEngine`
+    :return: The engine now in use
+    :rtype: ReferenceEngine
+
+    The engine is used by :py:class:`Khremata` to parse strings and by
+    :py:func:`format_amount`, :py:func:`interest`, and
+    :py:func:`principal`, in every thread. Select ``"reference"`` to go
+    back to the core implementations.
+
+    >>> engine = obol.set_engine("quarters", verify=0.01)
+    >>> engine.parse("Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁")
+    Fraction(81759, 2)
+    >>> engine.divergences
+    []
+
+    """
+    global _current
+
+    if isinstance(engine, str):
+        engine = get_engine(engine)
+
+    if verify is not None:
+        engine = VerifyingEngine(engine, sample=verify, **kwargs)
+
+    _current = engine
+    # Skip the dispatch entirely for the plain reference engine
+    core._use_engine(None if type(engine) is ReferenceEngine else engine)
+    return engine
+
+
+def _b(amt):
+    return amt.b if isinstance(amt, Khremata) else Fraction(amt)
+
+
+register_engine(ReferenceEngine())
+register_engine(QuarterEngine())
+set_engine("reference")
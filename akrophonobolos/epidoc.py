@@ -0,0 +1,367 @@
+"""
+Read and write the numerals of EpiDoc (TEI XML) editions.
+
+"""
+
+from collections import namedtuple
+from enum import Enum
+from fractions import Fraction
+import xml.sax
+from xml.sax.handler import ContentHandler, property_lexical_handler
+from xml.sax.saxutils import XMLGenerator, quoteattr
+from akrophonobolos.validation import ParseError, try_parse
+
+__all__ = ["READ_BYTES", "CONTEXT_CHARS", "NumStatus", "EpiDocNumeral",
+           "read_epidoc", "write_epidoc", "format_value"]
+
+
+# Bytes of XML read at a time
+READ_BYTES = 1 << 16
+
+# Characters of text kept before and after each numeral
+CONTEXT_CHARS = 40
+
+
+class NumStatus(Enum):
+    """Result of checking a ``<num>`` element"""
+
+    MATCH = 1
+    MISMATCH = 2
+    NO_VALUE = 3
+    UNPARSEABLE = 4
+
+
+EpiDocNumeral = namedtuple("EpiDocNumeral", [
+    "text", "value", "amount", "status", "line", "before", "after"])
+EpiDocNumeral.__doc__ = """A ``<num>`` element found by
+:py:func:`read_epidoc`: its text, its ``value`` attribute (as a
+:py:class:`fractions.Fraction`, or None), the amount parsed from the
+text (:py:class:`Khremata`, or None), a :py:class:`NumStatus`, the
+number of the line (from the last ``<lb n="..."/>``), and the text
+before and after it"""
+
+
+def read_epidoc(source, unit=1, context=CONTEXT_CHARS):
+    """Find the numerals in an EpiDoc document
+
+    :param source: Path or binary file of the document
+    :type source: str, file
+    :param unit: Number of oboloí in one unit of the ``value``
+                 attributes, such as 6 if values are in drakhmaí
+    :type unit: int, fraction.Fraction
+    :param context: Number of characters of text to keep before and
+                    after each numeral
+    :type context: int
+    :return: A record for each ``<num>`` element, in document order
+    :rtype: iterator of EpiDocNumeral
+
+    The document is parsed incrementally, so memory use does not grow
+    with its length. The text of each numeral is parsed as an amount
+    and compared to its ``value`` attribute. Elements are matched by
+    local name, with or without the TEI namespace.
+
+    >>> from akrophonobolos import epidoc
+    >>> for num in epidoc.read_epidoc("edition.xml"):
+    ...     if num.status is epidoc.NumStatus.MISMATCH:
+    ...         print(num.line, num.text, num.value)
+
+    """
+    handler = _NumReader(Fraction(unit), context)
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+
+    f = open(source, "rb") if isinstance(source, str) else source
+    try:
+        while True:
+            data = f.read(READ_BYTES)
+            if not data:
+                break
+            parser.feed(data)
+            yield from handler.drain()
+    finally:
+        if f is not source:
+            f.close()
+
+    parser.close()
+    yield from handler.drain()
+
+
+def write_epidoc(source, out, unit=1, replace=False):
+    """Copy an EpiDoc document, setting the ``value`` attribute of
+    each ``<num>`` element to the value of its text
+
+    :param source: Path or binary file of the document
+    :type source: str, file
+    :param out: File to write the document to
+    :type out: file
+    :param unit: Number of oboloí in one unit of the ``value``
+                 attributes, such as 6 if values are in drakhmaí
+    :type unit: int, fraction.Fraction
+    :param replace: If True, replace existing ``value`` attributes.
+                    Otherwise only elements without one are given a value
+    :type replace: bool
+    :return: Number of values written
+    :rtype: int
+
+    Like :py:func:`read_epidoc`, the document is processed as a stream.
+    Values that are not whole numbers are written as decimals ("1.5")
+    or, if they have no exact decimal, as fractions ("1/3"). Elements
+    whose text cannot be parsed are copied unchanged. Comments and the
+    ``<!DOCTYPE>`` declaration are copied, but not the declarations of
+    an internal DTD subset (``<!DOCTYPE TEI [...]>``), and CDATA
+    sections are written as escaped text.
+
+    """
+    handler = _NumWriter(_Generator(out, "utf-8", short_empty_elements=True),
+                         Fraction(unit), replace)
+    parser = xml.sax.make_parser()
+    parser.setContentHandler(handler)
+    parser.setProperty(property_lexical_handler, handler)
+    parser.parse(source)
+    return handler.written
+
+
+def format_value(value):
+    """Format a number for a ``value`` attribute
+
+    :param value: Number
+    :type value: fractions.Fraction, int
+    :rtype: str
+
+    """
+    value = Fraction(value)
+    if value.denominator == 1:
+        return str(value.numerator)
+
+    d = value.denominator
+    while d % 2 == 0:
+        d //= 2
+    while d % 5 == 0:
+        d //= 5
+
+    if d != 1:
+        return str(value)
+
+    digits = 0
+    while (value * 10**digits).denominator != 1:
+        digits += 1
+
+    whole, frac = divmod(abs(value) * 10**digits, 10**digits)
+    sign = "-" if value < 0 else ""
+    return f"{sign}{int(whole)}.{int(frac):0{digits}d}"
+
+
+def _local(name):
+    return name.rpartition(":")[2]
+
+
+def _value(attr):
+    if attr is None:
+        return None
+
+    try:
+        return Fraction(attr.strip())
+    except ValueError:
+        return None
+
+
+class _NumReader(ContentHandler):
+    def __init__(self, unit, context):
+        super().__init__()
+        self.unit = unit
+        self.context = context
+        self.before = ""
+        self.line = None
+        self.depth = 0
+        self.pending = []
+        self.done = []
+
+    def drain(self):
+        done = self.done
+        self.done = []
+        return done
+
+    def startElement(self, name, attrs):
+        local = _local(name)
+        if local == "lb":
+            self.line = attrs.get("n", self.line)
+        elif local == "num":
+            if not self.depth:
+                self.value = attrs.get("value")
+                self.text = []
+                self.num_before = self.before
+            self.depth += 1
+
+    def endElement(self, name):
+        if _local(name) != "num" or not self.depth:
+            return
+
+        self.depth -= 1
+        if self.depth:
+            return
+
+        text = "".join(self.text).strip()
+        value = _value(self.value)
+        amount, error = try_parse(text)
+
+        if error is not ParseError.OK:
+            status = NumStatus.UNPARSEABLE
+        elif value is None:
+            status = NumStatus.NO_VALUE
+        elif amount.b == value * self.unit:
+            status = NumStatus.MATCH
+        else:
+            status = NumStatus.MISMATCH
+
+        self.pending.append([(text, value, amount, status, self.line,
+                              " ".join(self.num_before.split())), ""])
+
+    def characters(self, content):
+        if self.depth:
+            self.text.append(content)
+
+        if self.context:
+            self.before = (self.before + content)[-self.context:]
+
+        if self.pending:
+            still = []
+            for record in self.pending:
+                record[1] += content
+                if len(record[1]) >= self.context:
+                    self._finish(record)
+                else:
+                    still.append(record)
+            self.pending = still
+
+    def endDocument(self):
+        for record in self.pending:
+            self._finish(record)
+        self.pending = []
+
+    def _finish(self, record):
+        fields, after = record
+        self.done.append(EpiDocNumeral(
+            *fields, " ".join(after[:self.context].split())))
+
+
+class _Generator(XMLGenerator):
+    """XMLGenerator that can also write comments and a DOCTYPE"""
+
+    def comment(self, content):
+        self._finish_pending_start_element()
+        self._write(f"<!--{content}-->")
+
+    def doctype(self, name, public_id, system_id):
+        if public_id:
+            ids = f" PUBLIC {quoteattr(public_id)} {quoteattr(system_id)}"
+        elif system_id:
+            ids = f" SYSTEM {quoteattr(system_id)}"
+        else:
+            ids = ""
+        self._write(f"<!DOCTYPE {name}{ids}>\n")
+
+
+class _NumWriter(ContentHandler):
+    def __init__(self, out, unit, replace):
+        super().__init__()
+        self.out = out
+        self.unit = unit
+        self.replace = replace
+        self.buffer = None
+        self.depth = 0
+        self.level = 0
+        self.in_dtd = False
+        self.written = 0
+
+    def startDocument(self):
+        self.out.startDocument()
+
+    def endDocument(self):
+        self.out.endDocument()
+
+    def processingInstruction(self, target, data):
+        self.out.processingInstruction(target, data)
+
+    # Lexical handler methods
+
+    def startDTD(self, name, public_id, system_id):
+        self.in_dtd = True
+        self.out.doctype(name, public_id, system_id)
+
+    def endDTD(self):
+        self.in_dtd = False
+
+    def startCDATA(self):
+        pass
+
+    def endCDATA(self):
+        pass
+
+    def comment(self, content):
+        if self.in_dtd:
+            return
+
+        if self.depth:
+            self.buffer.append(("comment", content))
+            return
+
+        self.out.comment(content)
+        if not self.level:
+            # Whitespace outside the root element is not reported, so
+            # put comments there on lines of their own
+            self.out.ignorableWhitespace("\n")
+
+    def startElement(self, name, attrs):
+        self.level += 1
+        if _local(name) == "num":
+            if not self.depth:
+                self.buffer = []
+            self.depth += 1
+
+        if self.depth:
+            self.buffer.append(("start", name, dict(attrs)))
+        else:
+            self.out.startElement(name, attrs)
+
+    def endElement(self, name):
+        self.level -= 1
+        if not self.depth:
+            self.out.endElement(name)
+            return
+
+        self.buffer.append(("end", name))
+        if _local(name) == "num":
+            self.depth -= 1
+            if not self.depth:
+                self._flush()
+
+    def characters(self, content):
+        if self.depth:
+            self.buffer.append(("chars", content))
+        else:
+            self.out.characters(content)
+
+    def ignorableWhitespace(self, content):
+        self.characters(content)
+
+    def _flush(self):
+        text = "".join(event[1] for event in self.buffer
+                       if event[0] == "chars")
+        amount, error = try_parse(text.strip())
+
+        _, name, attrs = self.buffer[0]
+        if error is ParseError.OK and (self.replace or "value" not in attrs):
+            attrs["value"] = format_value(amount.b / self.unit)
+            self.written += 1
+
+        for kind, *args in self.buffer:
+            if kind == "start":
+                self.out.startElement(*args)
+            elif kind == "end":
+                self.out.endElement(*args)
+            elif kind == "comment":
+                self.out.comment(*args)
+            else:
+                self.out.characters(*args)
+
+        self.buffer = None
@@ -0,0 +1,281 @@
+"""
+Amounts known only to lie between two bounds, such as damaged numerals.
+
+"""
+
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import (Khremata,
+                                           UndefinedMonetaryOperation,
+                                           _quarter_value, getcontext,
+                                           interest_rate, round_amount)
+
+__all__ = ["KhremataInterval", "interest_bounds", "principal_bounds",
+           "loan_term_bounds"]
+
+
+class KhremataInterval:
+    """An amount between a lower and an upper bound."""
+
+    def __init__(self, lo, hi=None):
+        """:param lo: Lower bound
+        :type lo: str, float, int, fraction.Fraction, Khremata
+        :param hi: Upper bound, defaults to ``lo``
+        :type hi: str, float, int, fraction.Fraction, Khremata
+        :raise ValueError: If ``lo`` is greater than ``hi``
+
+        Both bounds are included and kept exactly, in quarter oboloí
+        (as ints when they are whole quarters). Arithmetic on
+        intervals gives the smallest interval containing every possible
+        result, so that a damaged numeral read as "at least ΤΤ, at most
+        ΤΤΤ𐅆" can be carried through a calculation in one step:
+
+        >>> obol.interest_bounds(obol.KhremataInterval("ΤΤ", "ΤΤΤ𐅆"), 100)
+        KhremataInterval (40d to 76d 4b)
+
+        """
+        self.q_lo = _quarter_value(lo)
+        self.q_hi = self.q_lo if hi is None else _quarter_value(hi)
+
+        if self.q_lo > self.q_hi:
+            raise ValueError(f"Lower bound {self.low} is greater than upper "
+                             f"bound {self.high}")
+
+    @classmethod
+    def from_candidates(cls, amts):
+        """
+        :param amts: Possible values
+        :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+        :return: Smallest interval containing all of ``amts``
+        :rtype: KhremataInterval
+        """
+        values = [_quarter_value(amt) for amt in amts]
+        return cls._from_quarters(min(values), max(values))
+
+    @classmethod
+    def _from_quarters(cls, q_lo, q_hi):
+        interval = cls.__new__(cls)
+        interval.q_lo = _whole(q_lo)
+        interval.q_hi = _whole(q_hi)
+        return interval
+
+    @property
+    def lo(self):
+        """Lower bound in oboloí
+
+        :rtype: fractions.Fraction
+        """
+        return Fraction(self.q_lo, 4)
+
+    @property
+    def hi(self):
+        """Upper bound in oboloí
+
+        :rtype: fractions.Fraction
+        """
+        return Fraction(self.q_hi, 4)
+
+    @property
+    def low(self):
+        """Lower bound as :py:class:`Khremata`"""
+        return Khremata(self.lo)
+
+    @property
+    def high(self):
+        """Upper bound as :py:class:`Khremata`"""
+        return Khremata(self.hi)
+
+    @property
+    def width(self):
+        """Difference between the bounds as :py:class:`Khremata`"""
+        return Khremata(Fraction(self.q_hi - self.q_lo, 4))
+
+    def __str__(self):
+        return f"{self.low} to {self.high}"
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ({self.__str__()})"
+
+    def __eq__(self, other):
+        if not isinstance(other, KhremataInterval):
+            other = KhremataInterval(other)
+
+        return self.q_lo == other.q_lo and self.q_hi == other.q_hi
+
+    def __hash__(self):
+        return hash((self.q_lo, self.q_hi))
+
+    def __contains__(self, amt):
+        return self.q_lo <= _quarter_value(amt) <= self.q_hi
+
+    def __add__(self, other):
+        other = _interval(other)
+        return KhremataInterval._from_quarters(self.q_lo + other.q_lo,
+                                               self.q_hi + other.q_hi)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        other = _interval(other)
+        return KhremataInterval._from_quarters(self.q_lo - other.q_hi,
+                                               self.q_hi - other.q_lo)
+
+    def __rsub__(self, other):
+        return _interval(other) - self
+
+    def __neg__(self):
+        return KhremataInterval._from_quarters(-self.q_hi, -self.q_lo)
+
+    def __mul__(self, other):
+        """
+        :raise UndefinedMonetaryOperation: if multiplying by an amount or an interval
+        """
+        if isinstance(other, (Khremata, KhremataInterval)):
+            raise UndefinedMonetaryOperation(
+                "Cannot multiply two monetary amounts")
+
+        return _scaled(self, Fraction(other))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, (Khremata, KhremataInterval)):
+            raise UndefinedMonetaryOperation(
+                "Cannot divide by a monetary amount")
+
+        return _scaled(self, 1 / Fraction(other))
+
+
+def interest_bounds(p, d, r=interest_rate(), roundup=True, rounding=None):
+    """
+    Calculate the range of interest on a principal in a range for a
+    number of days in a range
+
+    :param p: Principal
+    :type p: KhremataInterval, str, float, int, fraction.Fraction, Khremata
+    :param d: Number of days, or the lowest and highest number of days
+    :type d: int, tuple
+    :param r: Simple interest rate
+    :type r: fractions.Fraction, int
+    :param roundup: If True, the bounds are rounded as by
+                    :py:func:`interest`. If False, they are exact
+    :type roundup: bool
+    :param rounding: How the bounds are rounded if ``roundup`` is True
+    :type rounding: Rounding
+    :rtype: KhremataInterval
+    :raise ValueError: If the principal could be less than zero
+
+    """
+    p = _interval(p)
+    d_lo, d_hi = _days(d)
+    r = Fraction(r)
+
+    if p.lo < 0:
+        raise ValueError("Principal cannot be less than zero")
+
+    return _bounds(p.lo * r * d_lo, p.hi * r * d_hi, roundup, rounding)
+
+
+def principal_bounds(i, d, r=interest_rate(), roundup=True, rounding=None):
+    """
+    Calculate the range of principals that would return interest in a
+    range after a number of days in a range
+
+    :param i: Interest
+    :type i: KhremataInterval, str, float, int, fraction.Fraction, Khremata
+    :param d: Number of days, or the lowest and highest number of days
+    :type d: int, tuple
+    :param r: Simple interest rate
+    :type r: fractions.Fraction, int
+    :param roundup: If True, the bounds are rounded as by
+                    :py:func:`principal`. If False, they are exact
+    :type roundup: bool
+    :param rounding: How the bounds are rounded if ``roundup`` is True
+    :type rounding: Rounding
+    :rtype: KhremataInterval
+    :raise ValueError: If the interest could be less than zero
+
+    """
+    i = _interval(i)
+    d_lo, d_hi = _days(d)
+    r = Fraction(r)
+
+    if i.lo < 0:
+        raise ValueError("Interest cannot be less than zero")
+
+    return _bounds(i.lo / (d_hi * r), i.hi / (d_lo * r), roundup, rounding)
+
+
+def loan_term_bounds(p, i, r=interest_rate(), roundoff=True):
+    """
+    Calculate the range of loan terms in days for a principal and
+    interest in ranges
+
+    :param p: Principal
+    :type p: KhremataInterval, str, float, int, fraction.Fraction, Khremata
+    :param i: Interest
+    :type i: KhremataInterval, str, float, int, fraction.Fraction, Khremata
+    :param r: Simple interest rate
+    :type r: fractions.Fraction, int
+    :param roundoff: If True, the bounds are rounded to whole days as by
+                     :py:func:`loan_term`
+    :type roundoff: bool
+    :return: Shortest and longest terms
+    :rtype: tuple
+    :raise ValueError: If the principal could be zero or less
+
+    """
+    p = _interval(p)
+    i = _interval(i)
+    r = Fraction(r)
+
+    if p.lo <= 0:
+        raise ValueError("Principal must be greater than zero")
+
+    lo = i.lo / (p.hi * r)
+    hi = i.hi / (p.lo * r)
+
+    if roundoff:
+        return (round(lo), round(hi))
+
+    return (lo, hi)
+
+
+def _interval(amt):
+    if isinstance(amt, KhremataInterval):
+        return amt
+
+    return KhremataInterval(amt)
+
+
+def _days(d):
+    if isinstance(d, tuple):
+        d_lo, d_hi = d
+    else:
+        d_lo = d_hi = d
+
+    if d_lo <= 0 or d_lo > d_hi:
+        raise ValueError(f"Invalid number of days {d}")
+
+    return d_lo, d_hi
+
+
+def _scaled(interval, factor):
+    lo = interval.q_lo * factor
+    hi = interval.q_hi * factor
+    return KhremataInterval._from_quarters(min(lo, hi), max(lo, hi))
+
+
+def _bounds(lo, hi, roundup, rounding):
+    if roundup:
+        rounding = rounding or getcontext().rounding
+        lo = round_amount(lo, rounding)
+        hi = round_amount(hi, rounding)
+
+    return KhremataInterval._from_quarters(lo * 4, hi * 4)
+
+
+def _whole(q):
+    if isinstance(q, Fraction) and q.denominator == 1:
+        return q.numerator
+
+    return q
@@ -0,0 +1,179 @@
+"""
+Running totals over the entries of a long account.
+
+"""
+
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import Khremata, _quarter_value
+
+__all__ = ["RunningTotals"]
+
+
+class RunningTotals:
+    """Entries of an account with fast subtotals while they are edited."""
+
+    def __init__(self, amts=()):
+        """:param amts: Entries, in order
+        :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+
+        The entries are kept in quarter oboloí in a Fenwick tree (binary
+        indexed tree), so that changing an entry, the total of any range
+        of entries, and finding where the running total passes an amount
+        each take time in proportion to the logarithm of the number of
+        entries.
+
+        >>> ledger = obol.RunningTotals(["ΤΤ", "ΧΧ", "Η", "Τ"])
+        >>> ledger.total(1, 3)
+        Khremata (2100d [= 12600.0 obols])
+        >>> ledger.find_exceeding("2t 2000d")
+        2
+
+        """
+        self.values = [_quarter_value(amt) for amt in amts]
+        n = len(self.values)
+        tree = [0] + self.values
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+        self.tree = tree
+        self._negative = sum(1 for v in self.values if v < 0)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for v in self.values:
+            yield _amount(v)
+
+    def __getitem__(self, i):
+        """:rtype: Khremata"""
+        return _amount(self.values[i])
+
+    def __setitem__(self, i, amt):
+        """Change an entry"""
+        if i < 0:
+            i += len(self.values)
+        if not 0 <= i < len(self.values):
+            raise IndexError("RunningTotals index out of range")
+
+        q = _quarter_value(amt)
+        old = self.values[i]
+        self._negative += (q < 0) - (old < 0)
+        self.values[i] = q
+        self._update(i, q - old)
+
+    def add(self, i, amt):
+        """Add an amount to an entry
+
+        :param i: Position of the entry
+        :type i: int
+        :param amt: Amount to add
+        :type amt: str, float, int, fraction.Fraction, Khremata
+
+        """
+        if i < 0:
+            i += len(self.values)
+        if not 0 <= i < len(self.values):
+            raise IndexError("RunningTotals index out of range")
+
+        q = _quarter_value(amt)
+        old = self.values[i]
+        self.values[i] = old + q
+        self._negative += (old + q < 0) - (old < 0)
+        self._update(i, q)
+
+    def append(self, amt):
+        """Add an entry at the end
+
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+
+        """
+        q = _quarter_value(amt)
+        i = len(self.values) + 1
+        # The new node covers the entries (i - lowbit(i), i]
+        node = q + self._prefix(i - 1) - self._prefix(i - (i & -i))
+        self.values.append(q)
+        self.tree.append(node)
+        self._negative += q < 0
+
+    def running(self, i):
+        """Running total up to and including an entry
+
+        :param i: Position of the entry
+        :type i: int
+        :rtype: Khremata
+
+        """
+        return _amount(self._prefix(i + 1))
+
+    def total(self, start=0, end=None):
+        """Total of a range of entries
+
+        :param start: Position of the first entry
+        :type start: int
+        :param end: Position after the last entry, defaults to the end
+        :type end: int
+        :rtype: Khremata
+
+        Like a slice, the range includes ``start`` but not ``end``.
+
+        """
+        n = len(self.values)
+        end = n if end is None else max(0, min(end, n))
+        start = max(0, min(start, end))
+        return _amount(self._prefix(end) - self._prefix(start))
+
+    def find_exceeding(self, amt):
+        """Find the first entry at which the running total exceeds an amount
+
+        :param amt: Amount
+        :type amt: str, float, int, fraction.Fraction, Khremata
+        :return: Position of the entry, or None if the total of all
+                 entries does not exceed ``amt``
+        :rtype: int
+        :raise ValueError: If any entry is negative, since the running
+                           total would not only increase
+
+        """
+        if self._negative:
+            raise ValueError("Entries must not be negative")
+
+        remaining = _quarter_value(amt)
+        tree = self.tree
+        n = len(self.values)
+        pos = 0
+        step = 1 << n.bit_length()
+
+        # Descend to the longest prefix whose total does not exceed amt
+        while step:
+            nxt = pos + step
+            if nxt <= n and tree[nxt] <= remaining:
+                pos = nxt
+                remaining -= tree[nxt]
+            step >>= 1
+
+        return pos if pos < n else None
+
+    def _prefix(self, i):
+        """Total of the first i entries, in quarter oboloí"""
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def _update(self, i, delta):
+        tree = self.tree
+        n = len(self.values)
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+
+def _amount(q):
+    return Khremata(Fraction(q, 4))
@@ -0,0 +1,230 @@
+"""
+Exact solutions of linear constraints linking many account entries.
+
+"""
+
+from collections import namedtuple
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import Khremata, _obols, interest_rate
+
+__all__ = ["InconsistentSystem", "Var", "LinearSystem", "Solution"]
+
+
+class InconsistentSystem(Exception):
+    pass
+
+
+Var = namedtuple("Var", ["name"])
+Var.__doc__ = """An unknown in a :py:meth:`LinearSystem.add_loan`
+constraint"""
+
+
+class LinearSystem:
+    """Linear constraints over unknown amounts and day counts."""
+
+    def __init__(self):
+        """Constraints are added with :py:meth:`add` and
+        :py:meth:`add_loan` and solved with :py:meth:`solve`.
+
+        Unknowns are named with strings. Amounts are in oboloí and all
+        arithmetic is done with :py:class:`fractions.Fraction`, so no
+        precision is lost however many unknowns there are.
+
+        >>> system = obol.LinearSystem()
+        >>> system.add({"a": 1, "b": 1}, "1t")
+        >>> system.add({"a": 1, "b": -1}, "2000d")
+        >>> system.solve().khremata("a")
+        Khremata (4000d [= 24000.0 obols])
+
+        """
+        self.variables = []
+        self.equations = []
+        self._index = {}
+
+    def __len__(self):
+        return len(self.equations)
+
+    def add(self, coeffs, total=0):
+        """Add the constraint that a sum of unknowns is equal to an amount
+
+        :param coeffs: Coefficient of each unknown in the sum
+        :type coeffs: dict of str to int, fractions.Fraction
+        :param total: Amount the sum is equal to
+        :type total: str, float, int, fraction.Fraction, Khremata
+
+        """
+        row = {}
+        for name, coeff in coeffs.items():
+            coeff = Fraction(coeff)
+            if coeff:
+                row[self._variable(name)] = coeff
+
+        self.equations.append((row, _obols(total)))
+
+    def add_loan(self, p, d, i, r=interest_rate()):
+        """Add the constraint that principal ``p`` earns interest ``i``
+        in ``d`` days at rate ``r``
+
+        :param p: Principal, or a :py:class:`Var` if unknown
+        :type p: str, float, int, fraction.Fraction, Khremata, Var
+        :param d: Number of days, or a :py:class:`Var` if unknown
+        :type d: int, Var
+        :param i: Interest, or a :py:class:`Var` if unknown
+        :type i: str, float, int, fraction.Fraction, Khremata, Var
+        :param r: Simple interest rate
+        :type r: fractions.Fraction, int
+        :raise ValueError: If both ``p`` and ``d`` are unknown, since
+                           the constraint would not be linear
+
+        The interest is taken to be exact, not rounded to the quarter
+        obolós.
+
+        """
+        if isinstance(p, Var) and isinstance(d, Var):
+            raise ValueError("Principal and days cannot both be unknown")
+
+        r = Fraction(r)
+        coeffs = {}
+        total = Fraction(0)
+
+        if isinstance(i, Var):
+            coeffs[i.name] = Fraction(-1)
+        else:
+            total = _obols(i)
+
+        if isinstance(p, Var):
+            coeffs[p.name] = coeffs.get(p.name, 0) + r * d
+        elif isinstance(d, Var):
+            coeffs[d.name] = coeffs.get(d.name, 0) + _obols(p) * r
+        else:
+            total -= _obols(p) * r * d
+
+        self.add(coeffs, total)
+
+    def solve(self):
+        """Solve the constraints by Gaussian elimination
+
+        :return: The unique solution, or if there are fewer independent
+                 constraints than unknowns the family of solutions
+        :rtype: Solution
+        :raise InconsistentSystem: If the constraints contradict each
+                                   other
+
+        """
+        pivots = {}
+
+        for n, (coeffs, total) in enumerate(self.equations):
+            row = dict(coeffs)
+            for var in [v for v in row if v in pivots]:
+                factor = row.pop(var)
+                p_row, p_total = pivots[var]
+                for v, c in p_row.items():
+                    value = row.get(v, 0) - factor * c
+                    if value:
+                        row[v] = value
+                    else:
+                        row.pop(v, None)
+                total -= factor * p_total
+
+            if not row:
+                if total:
+                    raise InconsistentSystem(
+                        f"Constraint {n} contradicts the ones before it")
+                continue
+
+            pivot = min(row)
+            scale = row.pop(pivot)
+            row = {v: c / scale for v, c in row.items()}
+            total /= scale
+
+            # Keep the other rows free of the new pivot
+            for var, (p_row, p_total) in pivots.items():
+                factor = p_row.pop(pivot, None)
+                if factor is None:
+                    continue
+                for v, c in row.items():
+                    value = p_row.get(v, 0) - factor * c
+                    if value:
+                        p_row[v] = value
+                    else:
+                        p_row.pop(v, None)
+                pivots[var] = (p_row, p_total - factor * total)
+
+            pivots[pivot] = (row, total)
+
+        names = self.variables
+        free = [names[v] for v in range(len(names)) if v not in pivots]
+        general = {}
+        for var, (row, total) in pivots.items():
+            general[names[var]] = (total, {names[v]: -c
+                                           for v, c in row.items()})
+
+        return Solution(general, free)
+
+    def _variable(self, name):
+        if name not in self._index:
+            self._index[name] = len(self.variables)
+            self.variables.append(name)
+
+        return self._index[name]
+
+
+class Solution:
+    """The solution of a :py:class:`LinearSystem`."""
+
+    def __init__(self, general, free):
+        """:param general: For each unknown that is not free, its value
+                        as a constant plus a multiple of each free unknown
+        :type general: dict of str to (fractions.Fraction, dict)
+        :param free: Unknowns that can take any value
+        :type free: list of str
+
+        ``values`` holds the unknowns whose value is fixed, whatever the
+        values of the free unknowns.
+
+        """
+        self.general = general
+        self.free = free
+        self.values = {name: const for name, (const, terms) in general.items()
+                       if not terms}
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__} ({len(self.values)} solved, "
+                f"{len(self.free)} free)")
+
+    @property
+    def unique(self):
+        """True if every unknown has a single value"""
+        return not self.free
+
+    def __getitem__(self, name):
+        return self.values[name]
+
+    def khremata(self, name):
+        """
+        :param name: Unknown
+        :type name: str
+        :return: Value of an unknown amount
+        :rtype: Khremata
+        :raise KeyError: If the unknown does not have a single value
+        """
+        return Khremata(self.values[name])
+
+    def evaluate(self, free_values=None):
+        """Pick one solution from the family of solutions
+
+        :param free_values: Values of the free unknowns, which default
+                            to 0
+        :type free_values: dict of str to int, fractions.Fraction
+        :return: Value of every unknown
+        :rtype: dict of str to fractions.Fraction
+
+        """
+        free_values = {name: Fraction((free_values or {}).get(name, 0))
+                       for name in self.free}
+        values = dict(free_values)
+        for name, (const, terms) in self.general.items():
+            values[name] = const + sum(c * free_values[v]
+                                       for v, c in terms.items())
+
+        return values
@@ -1,10 +1,21 @@
 #!/usr/bin/env python3
 
 import akrophonobolos as obol
+from akrophonobolos.batch import run_resumable
 import argparse
+import csv
 from fractions import Fraction
+import io
+import json
+import sys
 from sys import exit
 
+# Number of result rows written at a time in batch mode
+BATCH_ROWS = 1000
+
+RESULT_FIELDS = ("principal", "principal_greek", "rate", "days",
+                 "interest", "interest_greek", "error")
+
 
 def money(s):
     return obol.Khremata(s)
@@ -14,43 +25,39 @@ def spread(d, s):
     return range(d - s, d + s + 1)
 
 
+def solve_interest(p, d, rate):
+    return (p, p * rate, d, obol.interest(p, d, rate))
+
+
+def solve_days(p, i, rate):
+    r = p * rate
+    return (p, r, (i/r).limit_denominator(1), i)
+
+
+def solve_principal(i, d, rate):
+    return (obol.principal(i, d, rate), i/d, d, i)
+
+
 def calculate_interest(args, rate):
-    per_diem = args.principal * rate
     if args.day_range:
         for s in spread(args.days, args.day_range):
-            format_output(args.principal,
-                          per_diem,
-                          s,
-                          obol.interest(args.principal, s, rate))
+            format_output(*solve_interest(args.principal, s, rate))
         return
 
-    format_output(args.principal,
-                  per_diem,
-                  args.days,
-                  obol.interest(args.principal, args.days, rate))
+    format_output(*solve_interest(args.principal, args.days, rate))
 
 
 def calculate_days(args, rate):
-    r = args.principal * rate
-    format_output(args.principal,
-                  r,
-                  (args.interest/r).limit_denominator(1),
-                  args.interest)
+    format_output(*solve_days(args.principal, args.interest, rate))
 
 
 def calculate_principal(args, rate):
     if args.day_range:
         for s in spread(args.days, args.day_range):
-            format_output(obol.principal(args.interest, s, rate),
-                          args.interest/s,
-                          s,
-                          args.interest)
+            format_output(*solve_principal(args.interest, s, rate))
         return
 
-    format_output(obol.principal(args.interest, args.days, rate),
-                  args.interest/args.days,
-                  args.days,
-                  args.interest)
+    format_output(*solve_principal(args.interest, args.days, rate))
 
 
 def format_output(p, r, d, i):
@@ -60,6 +67,141 @@ def format_output(p, r, d, i):
           f"{i.as_greek()} ({i.as_abbr(True)}) interest")
 
 
+def solve_row(row, rates, defaults):
+    """Solve for the missing one of principal, days, and interest in a
+    batch row, reusing rates already calculated."""
+
+    if isinstance(row, json.JSONDecodeError):
+        raise ValueError(f"Invalid JSON: {row.msg}")
+
+    if not isinstance(row, dict):
+        raise ValueError("Row must be a JSON object")
+
+    rate_key = tuple(row[k] if _given(row, k) else defaults[k]
+                     for k in ("int_p", "int_d", "int_i"))
+    if rate_key not in rates:
+        rates[rate_key] = obol.interest_rate(
+            rate_key[0], int(rate_key[1]), rate_key[2])
+    rate = rates[rate_key]
+
+    p = money(row["principal"]) if _given(row, "principal") else None
+    d = int(row["days"]) if _given(row, "days") else None
+    i = money(row["interest"]) if _given(row, "interest") else None
+
+    if p is not None and d is not None and i is None:
+        return solve_interest(p, d, rate)
+
+    if p is not None and i is not None and d is None:
+        return solve_days(p, i, rate)
+
+    if d is not None and i is not None and p is None:
+        return solve_principal(i, d, rate)
+
+    raise ValueError("Row must have exactly two of principal, days, "
+                     "and interest")
+
+
+def _given(row, key):
+    """True if a batch row has a value, even zero, in a column"""
+    return row.get(key) not in (None, "")
+
+
+def result_record(p, r, d, i):
+    return {"principal": p.as_abbr(),
+            "principal_greek": p.as_greek(),
+            "rate": r.as_abbr(True),
+            "days": int(d),
+            "interest": i.as_abbr(True),
+            "interest_greek": i.as_greek(),
+            "error": None}
+
+
+def read_rows(f, fmt):
+    if fmt == "csv":
+        yield from csv.DictReader(f)
+        return
+
+    for line in f:
+        if line.strip():
+            # A bad line is passed on to be reported in its own row
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield e
+
+
+def record_writer(buf, fmt):
+    if fmt == "csv":
+        return csv.DictWriter(buf, RESULT_FIELDS, lineterminator="\n").writerow
+
+    def write(record):
+        buf.write(json.dumps(record, ensure_ascii=False))
+        buf.write("\n")
+
+    return write
+
+
+def solve_rows(rows, rates, defaults):
+    for row in rows:
+        try:
+            yield result_record(*solve_row(row, rates, defaults))
+        except (ValueError, KeyError, TypeError,
+                obol.UnparseableMonetaryString, ZeroDivisionError) as e:
+            yield {**dict.fromkeys(RESULT_FIELDS), "error": str(e)}
+
+
+def csv_header():
+    return ",".join(RESULT_FIELDS) + "\n"
+
+
+def run_batch(f, out, fmt, defaults):
+    """Solve every row read from ``f`` and write the results to ``out``"""
+    rates = {}
+    buf = io.StringIO()
+    write = record_writer(buf, fmt)
+
+    if fmt == "csv":
+        buf.write(csv_header())
+
+    for n, record in enumerate(solve_rows(read_rows(f, fmt), rates,
+                                          defaults), 1):
+        write(record)
+
+        if not n % BATCH_ROWS:
+            out.write(buf.getvalue())
+            buf.seek(0)
+            buf.truncate()
+
+    out.write(buf.getvalue())
+    out.flush()
+
+
+def run_checkpointed(path, output, checkpoint, fmt, defaults):
+    """Solve every row in the file ``path``, writing the results to the
+    file ``output`` and resuming from ``checkpoint`` if it exists"""
+    rates = {}
+
+    def process(lines, header):
+        buf = io.StringIO()
+        write = record_writer(buf, fmt)
+        for record in solve_rows(read_rows(header + lines, fmt), rates,
+                                 defaults):
+            write(record)
+        return buf.getvalue()
+
+    csv_fmt = fmt == "csv"
+    run_resumable(path, output, process, checkpoint, BATCH_ROWS,
+                  header_lines=1 if csv_fmt else 0,
+                  prelude=csv_header() if csv_fmt else "")
+
+
+def batch_format(args):
+    if args.format:
+        return args.format
+
+    return "csv" if args.batch.lower().endswith(".csv") else "jsonl"
+
+
 def get_interest_rate(args):
     return obol.interest_rate(obol.Khremata(args.int_p),
                               obol.Khremata(args.int_i),
@@ -67,8 +209,17 @@ def get_interest_rate(args):
 
 
 def main():
+    # The engine is chosen before the other arguments are parsed, since
+    # the amounts among them are parsed by it
+    engine = argparse.ArgumentParser(add_help=False)
+    engine.add_argument("--engine", choices=sorted(obol.ENGINES),
+                        default="reference",
+                        help="Implementation of the core operations to use")
+    obol.set_engine(engine.parse_known_args()[0].engine)
+
     parser = argparse.ArgumentParser(
-        description="Ancient Athenian acrophonic numeral converter"
+        description="Ancient Athenian acrophonic numeral converter",
+        parents=[engine]
     )
     parser.add_argument("-p", "--principal", type=money, default=None,
                         help="Amount of principal of loan")
@@ -88,9 +239,47 @@ def main():
                         help="Interest amount for interest rate calculation")
     parser.add_argument("--int-d", metavar="D", default=1, type=int,
                         help="Number of days for interest rate calculation")
+    parser.add_argument("--batch", metavar="FILE", default=None,
+                        help="Solve every loan in a CSV or JSON Lines FILE "
+                        "(- for standard input) with columns principal, "
+                        "days, interest and optionally int_p, int_d, int_i")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default=None,
+                        help="Format of the batch file and results "
+                        "(default: guessed from the file name)")
+    parser.add_argument("--output", metavar="FILE", default=None,
+                        help="Write batch results to FILE instead of "
+                        "standard output")
+    parser.add_argument("--checkpoint", metavar="FILE", default=None,
+                        help="Record the progress of a batch in FILE, and "
+                        "resume from it if it exists (requires --output)")
 
     args = parser.parse_args()
 
+    if args.batch:
+        defaults = {"int_p": args.int_p, "int_d": args.int_d,
+                    "int_i": args.int_i}
+        fmt = batch_format(args)
+        if args.checkpoint:
+            if args.batch == "-" or not args.output:
+                parser.error("--checkpoint requires --batch FILE and "
+                             "--output FILE")
+            run_checkpointed(args.batch, args.output, args.checkpoint, fmt,
+                             defaults)
+            return
+
+        out = open(args.output, "w", newline="") if args.output \
+            else sys.stdout
+        try:
+            if args.batch == "-":
+                run_batch(sys.stdin, out, fmt, defaults)
+            else:
+                with open(args.batch, newline="") as f:
+                    run_batch(f, out, fmt, defaults)
+        finally:
+            if args.output:
+                out.close()
+        return
+
     rate = obol.interest_rate(args.int_p, args.int_d, args.int_i)
 
     if all((args.principal, args.rate, args.days)) and not args.interest:
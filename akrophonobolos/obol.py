@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 
 import akrophonobolos as obol
+from akrophonobolos.batch import CHUNK_LINES, run_resumable
 import argparse
 from enum import Enum, auto
+from itertools import islice
+import sys
 from sys import exit
 
 
@@ -22,7 +25,7 @@ class INPUT_T(Enum):
 
 
 def detect_type(input):
-    if any([i in obol.NUMERALS.keys() for i in input]):
+    if not obol.NUMERAL_CHARS.isdisjoint(input):
         return INPUT_T.ACRO
 
     if obol.valid_amount_str(input):
@@ -55,30 +58,98 @@ def recurse_calc(eq):
 
 
 def do_equation(input):
+    print(equation_line(input))
+
+
+def equation_line(input):
     result = recurse_calc(input)
-    print(f"{result.as_greek()} = {result.as_abbr()}")
+    return f"{result.as_greek()} = {result.as_abbr()}"
+
+
+def conversion_lines(input):
+    for i in input:
+        if detect_type(i) in (INPUT_T.ACRO, INPUT_T.STR):
+            p = obol.Khremata(i)
+
+            if detect_type(i) == INPUT_T.ACRO:
+                yield f"{i} = {p.as_phrase()}"
+
+            else:
+                yield f"{i} = {p.as_greek()}"
+
+
+def convert_lines(lines, header=()):
+    """Convert each line of a file, which holds either amounts separated
+    by spaces or an equation"""
+    out = []
+    for line in lines:
+        input = line.split()
+        if not input:
+            continue
+
+        try:
+            if is_equation(input):
+                out.append(equation_line(input))
+            else:
+                out.extend(conversion_lines(input))
+        except (UnexpectedInput, UnexpectedEndOfEquation,
+                obol.UnparseableMonetaryString) as e:
+            out.append(f"{line.strip()} = error: "
+                       f"{str(e) or e.__class__.__name__}")
+
+    return "".join(f"{o}\n" for o in out)
+
+
+def convert_file(f, out, chunk_lines=CHUNK_LINES):
+    """Convert each line read from ``f`` and write the results to
+    ``out``, a chunk of lines at a time"""
+    while True:
+        lines = list(islice(f, chunk_lines))
+        if not lines:
+            break
+        out.write(convert_lines(lines))
+
+    out.flush()
 
 
 def main():
     parser = argparse.ArgumentParser(
         description="Ancient Athenian acrophonic numeral converter"
     )
-    parser.add_argument("input", nargs="+", type=str)
+    parser.add_argument("input", nargs="*", type=str)
+    parser.add_argument("--file", metavar="FILE", default=None,
+                        help="Convert each line of FILE")
+    parser.add_argument("--output", metavar="FILE", default=None,
+                        help="Write the conversions of --file to FILE")
+    parser.add_argument("--checkpoint", metavar="FILE", default=None,
+                        help="Record the progress of --file in FILE, and "
+                        "resume from it if it exists (requires --output)")
+    parser.add_argument("--engine", choices=sorted(obol.ENGINES),
+                        default="reference",
+                        help="Implementation of the core operations to use")
     args = parser.parse_args()
+    obol.set_engine(args.engine)
+
+    if args.file:
+        if args.output:
+            run_resumable(args.file, args.output, convert_lines,
+                          args.checkpoint)
+        elif args.checkpoint:
+            parser.error("--checkpoint requires --output")
+        else:
+            with open(args.file) as f:
+                convert_file(f, sys.stdout)
+        exit()
+
+    if not args.input:
+        parser.error("No input")
 
     if is_equation(args.input):
         do_equation(args.input)
         exit()
 
-    for i in args.input:
-        if detect_type(i) in (INPUT_T.ACRO, INPUT_T.STR):
-            p = obol.Khremata(i)
-
-            if detect_type(i) == INPUT_T.ACRO:
-                print(f"{i} = {p.as_phrase()}")
-
-            else:
-                print(f"{i} = {p.as_greek()}")
+    for line in conversion_lines(args.input):
+        print(line)
 
 
 if __name__ == "__main__":
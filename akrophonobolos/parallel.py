@@ -0,0 +1,191 @@
+"""
+Parse, format, and calculate interest on many amounts concurrently.
+
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import sys
+from akrophonobolos.akrophonobolos import (Fmt, Khremata, format_amount,
+                                           getcontext, interest,
+                                           interest_rate, localcontext)
+
+__all__ = ["CHUNK_SIZE", "MapResult", "free_threaded", "default_executor",
+           "map_parse", "map_format", "map_interest"]
+
+
+# Number of items given to a worker at a time
+CHUNK_SIZE = 1000
+
+MapResult = namedtuple("MapResult", ["values", "errors"])
+MapResult.__doc__ = """Result of :py:func:`map_parse`,
+:py:func:`map_format`, and :py:func:`map_interest`: a list of results
+in the order of the input (None where there was an error) and a list of
+(index, exception) pairs"""
+
+
+def free_threaded():
+    """
+    :return: True if running on a Python without the global interpreter lock
+    :rtype: bool
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def default_executor(workers=None):
+    """Create the executor used when none is given
+
+    :param workers: Maximum number of workers
+    :type workers: int
+    :rtype: concurrent.futures.Executor
+
+    Threads run in parallel only without the global interpreter lock, so
+    this is a :py:class:`concurrent.futures.ThreadPoolExecutor` on
+    free-threaded builds of Python and a
+    :py:class:`concurrent.futures.ProcessPoolExecutor` otherwise.
+
+    """
+    if free_threaded():
+        return ThreadPoolExecutor(max_workers=workers)
+
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def map_parse(amts, chunk_size=CHUNK_SIZE, executor=None, workers=None):
+    """Parse many amounts concurrently
+
+    :param amts: Amounts to parse
+    :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+    :param chunk_size: Number of amounts given to a worker at a time
+    :type chunk_size: int
+    :param executor: Executor to run on. If not given, one is created
+                     with :py:func:`default_executor` and shut down
+                     afterwards
+    :type executor: concurrent.futures.Executor
+    :param workers: Number of workers if no executor is given
+    :type workers: int
+    :return: :py:class:`Khremata` for each amount, and the errors
+    :rtype: MapResult
+
+    >>> from akrophonobolos import parallel
+    >>> parallel.map_parse(["1t", "ΔΔ", "zz"])
+    MapResult(values=[Khremata (1t [= 36000.0 obols]), Khremata (20d [= 120.0 obols]), None], errors=[(2, UnparseableMonetaryString('Cannot parse zz as monetary amount'))])
+
+    """
+    return _map(_parse_chunk, (), amts, chunk_size, executor, workers)
+
+
+def map_format(amts, fmt_flags=Fmt.ABBR | Fmt.FRACTION,
+               chunk_size=CHUNK_SIZE, executor=None, workers=None):
+    """Format many amounts concurrently
+
+    :param amts: Amounts to format
+    :type amts: iterable of str, float, int, fraction.Fraction, Khremata
+    :param fmt_flags: Formatting options as for :py:func:`format_amount`
+    :type fmt_flags: Fmt
+    :param chunk_size: Number of amounts given to a worker at a time
+    :type chunk_size: int
+    :param executor: Executor to run on (see :py:func:`map_parse`)
+    :type executor: concurrent.futures.Executor
+    :param workers: Number of workers if no executor is given
+    :type workers: int
+    :return: Formatted strings, and the errors
+    :rtype: MapResult
+
+    """
+    return _map(_format_chunk, (fmt_flags,), amts, chunk_size, executor,
+                workers)
+
+
+def map_interest(loans, r=interest_rate(), roundup=True, rounding=None,
+                 chunk_size=CHUNK_SIZE, executor=None, workers=None):
+    """Calculate the interest on many loans concurrently
+
+    :param loans: Principal and number of days of each loan
+    :type loans: iterable of tuples
+    :param r: Simple interest rate
+    :type r: fractions.Fraction, int, float
+    :param roundup: As for :py:func:`interest`
+    :type roundup: bool
+    :param rounding: As for :py:func:`interest`
+    :type rounding: Rounding
+    :param chunk_size: Number of loans given to a worker at a time
+    :type chunk_size: int
+    :param executor: Executor to run on (see :py:func:`map_parse`)
+    :type executor: concurrent.futures.Executor
+    :param workers: Number of workers if no executor is given
+    :type workers: int
+    :return: Interest on each loan, and the errors
+    :rtype: MapResult
+
+    """
+    return _map(_interest_chunk, (r, roundup, rounding), loans, chunk_size,
+                executor, workers)
+
+
+def _map(func, args, items, chunk_size, executor, workers):
+    items = list(items)
+    chunks = [items[i:i + chunk_size]
+              for i in range(0, len(items), chunk_size)]
+    # Workers do not share the calling thread's arithmetic context
+    context = getcontext()
+
+    if len(chunks) <= 1 and executor is None:
+        results = [func(chunk, context, *args) for chunk in chunks]
+    else:
+        own = executor is None
+        if own:
+            executor = default_executor(workers)
+
+        try:
+            futures = [executor.submit(func, chunk, context, *args)
+                       for chunk in chunks]
+            results = []
+            for chunk, future in zip(chunks, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append([(False, e)] * len(chunk))
+        finally:
+            if own:
+                executor.shutdown()
+
+    values = []
+    errors = []
+    for chunk_results in results:
+        for ok, value in chunk_results:
+            if ok:
+                values.append(value)
+            else:
+                errors.append((len(values), value))
+                values.append(None)
+
+    return MapResult(values, errors)
+
+
+def _run(chunk, context, func):
+    results = []
+    # Pool threads are reused, so leave their own context as it was
+    with localcontext(context):
+        for item in chunk:
+            try:
+                results.append((True, func(item)))
+            except Exception as e:
+                results.append((False, e))
+
+    return results
+
+
+def _parse_chunk(chunk, context):
+    return _run(chunk, context, Khremata)
+
+
+def _format_chunk(chunk, context, fmt_flags):
+    return _run(chunk, context,
+                lambda amt: format_amount(Khremata(amt).b, fmt_flags))
+
+
+def _interest_chunk(chunk, context, r, roundup, rounding):
+    return _run(chunk, context,
+                lambda loan: interest(loan[0], loan[1], r, roundup, rounding))
@@ -0,0 +1,126 @@
+"""
+A mutable accumulator for adding up many amounts.
+
+"""
+
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import (AMT, GREEK_AMT, QUARTERS, Khremata,
+                                           UnparseableMonetaryString,
+                                           _from_float, _qo, getcontext)
+
+__all__ = ["Purse"]
+
+
+class Purse:
+    """Running total of monetary amounts, updated in place."""
+
+    def __init__(self, amt=0):
+        """:param amt: Starting amount
+        :type amt: str, float, int, fraction.Fraction, Khremata, Purse
+        :raise UnparseableMonetaryString: If `amt` cannot be parsed
+
+        A :py:class:`Purse` accepts the same amounts as
+        :py:class:`Khremata` with ``+=`` and ``-=``, but changes its
+        own value rather than creating a new object. Talents,
+        drakhmai, and whole and quarter oboloi are kept as separate
+        integer tallies and are only combined (and reduced) by
+        :py:meth:`freeze`, so adding to a purse does no fraction
+        arithmetic unless an amount is not a multiple of a quarter
+        obolós. Floats are converted by the ``floats`` policy of the
+        current :py:class:`Context` when they are added, and the
+        ``max_denominator`` only applies to the frozen total.
+
+        """
+        self.t = 0
+        self.d = 0
+        self.q = 0
+        self.x = Fraction(0)
+        self._add(amt, 1)
+
+    def _add(self, amt, sign):
+        if isinstance(amt, Khremata):
+            amt = amt.b
+
+        if isinstance(amt, int):
+            self.q += sign * 4 * amt
+            return
+
+        if isinstance(amt, float):
+            amt = _from_float(amt, getcontext().floats)
+
+        if isinstance(amt, Fraction):
+            if 4 % amt.denominator:
+                self.x += sign * amt
+            else:
+                self.q += sign * amt.numerator * (4 // amt.denominator)
+            return
+
+        if isinstance(amt, Purse):
+            self.t += sign * amt.t
+            self.d += sign * amt.d
+            self.q += sign * amt.q
+            self.x += sign * amt.x
+            return
+
+        if isinstance(amt, str):
+            if GREEK_AMT.search(amt):
+                self.q += sign * sum([QUARTERS[c] for c in amt])
+                return
+
+            amt_match = AMT.search(amt)
+            if amt_match is not None:
+                if amt_match[2] is not None:
+                    self.t += sign * int(amt_match[2])
+                if amt_match[4] is not None:
+                    self.d += sign * int(amt_match[4])
+                if amt_match[6] is not None:
+                    self._add(_parse_obols(amt_match[6]), sign)
+                return
+
+        raise UnparseableMonetaryString(
+            f"Cannot parse {amt} as monetary amount")
+
+    def __iadd__(self, other):
+        self._add(other, 1)
+        return self
+
+    def __isub__(self, other):
+        self._add(other, -1)
+        return self
+
+    @property
+    def b(self):
+        """Total in obols
+
+        :rtype: fractions.Fraction
+        """
+        return _qo(self.t, self.d, 0) + Fraction(self.q, 4) + self.x
+
+    @property
+    def tally(self):
+        """Unreduced talents, drakhmai, and oboloi added so far
+
+        :rtype: tuple
+        """
+        return (self.t, self.d, Fraction(self.q, 4) + self.x)
+
+    def freeze(self):
+        """
+        :return: The current total
+        :rtype: Khremata
+        """
+        return Khremata(self.b)
+
+    def __str__(self):
+        return str(self.freeze())
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__} ("
+            f"{self.__str__()} [= {float(self.b)} obols])"
+        )
+
+
+def _parse_obols(amt):
+    """Parse obols that may contain vulgar fractions, exactly."""
+    return Fraction(amt.replace("½", ".5").replace("¼", ".25"))
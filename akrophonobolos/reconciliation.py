@@ -0,0 +1,228 @@
+"""
+Find which entries of an account could add up to a stated total.
+
+"""
+
+from bisect import bisect_left, bisect_right
+import time
+from akrophonobolos.akrophonobolos import _whole_quarters
+
+__all__ = ["DP_LIMIT", "CHECK_EVERY", "SUBSET_LIMIT", "Subsets",
+           "reconcile"]
+
+
+# Largest dynamic programming table (in bits) before falling back to
+# meet-in-the-middle
+DP_LIMIT = 2**30
+
+# How often (in search steps) the time budget is checked
+CHECK_EVERY = 4096
+
+# Most subset sums kept for each half in meet-in-the-middle
+SUBSET_LIMIT = 2**20
+
+
+class Subsets(list):
+    """Subsets found by :py:func:`reconcile`, as a list of sorted
+    tuples of indexes into the entries."""
+
+    def __init__(self, subsets=(), complete=True):
+        """:param subsets: Subsets found
+        :type subsets: iterable of tuples
+        :param complete: False if the search stopped before looking at
+                         every subset, because the time budget ran out
+                         or a half reached :py:data:`SUBSET_LIMIT`
+        :type complete: bool
+
+        """
+        super().__init__(subsets)
+        self.complete = complete
+
+
+def reconcile(entries, target, tolerance=0, max_results=100,
+              time_budget=None, workers=None):
+    """Find subsets of entries that add up to a total.
+
+    :param entries: Amounts of the entries in an account
+    :type entries: sequence of str, int, fraction.Fraction, Khremata
+    :param target: The total the subsets should add up to
+    :type target: str, int, fraction.Fraction, Khremata
+    :param tolerance: Largest acceptable difference from ``target``
+    :type tolerance: str, int, fraction.Fraction, Khremata
+    :param max_results: Stop after finding this many subsets
+    :type max_results: int
+    :param time_budget: Stop searching after this many seconds
+    :type time_budget: float
+    :param workers: If given, search in this many processes. Only used
+                    with dynamic programming
+    :type workers: int
+    :return: Subsets as sorted tuples of indexes into ``entries``
+    :rtype: Subsets
+    :raise ValueError: If an amount is negative or is not a whole
+                       number of quarter oboloí
+
+    All amounts are compared exactly as integer numbers of quarter
+    oboloí. When the table of reachable totals is small enough, it is
+    built by dynamic programming and subsets are read back from it, so
+    accounts with many entries are fast as long as the target is not
+    huge. Otherwise the entries are split in two halves whose subset
+    sums are matched against each other (meet-in-the-middle).
+
+    If the time budget runs out, or one half of meet-in-the-middle has
+    more than :py:data:`SUBSET_LIMIT` subsets small enough to use, the
+    subsets found so far are returned with ``complete`` set to False,
+    since others may exist. Reaching ``max_results`` does not make the
+    result incomplete.
+
+    """
+
+    values = [_whole_quarters(e) for e in entries]
+    target = _whole_quarters(target)
+    tolerance = _whole_quarters(tolerance)
+    lo, hi = max(target - tolerance, 0), target + tolerance
+
+    if any(v < 0 for v in values):
+        raise ValueError("Cannot reconcile negative amounts")
+
+    deadline = None if time_budget is None else time.time() + time_budget
+
+    if len(values) * (hi + 1) > DP_LIMIT:
+        results, complete = _meet_in_the_middle(values, lo, hi, max_results,
+                                                deadline)
+    elif workers and workers > 1 and len(values) > 1:
+        results, complete = _parallel_dp(values, lo, hi, max_results,
+                                         deadline, workers)
+    else:
+        results, complete = _dp(values, lo, hi, max_results, deadline, (), 0)
+
+    return Subsets(sorted(results)[:max_results], complete)
+
+
+def _prefix_tables(values, hi):
+    """For each k, the totals up to hi reachable with values[:k]."""
+    mask = (1 << (hi + 1)) - 1
+    size = hi // 8 + 1
+    reach = 1
+    tables = [reach.to_bytes(size, "little")]
+
+    for v in values:
+        reach = (reach | (reach << v)) & mask
+        tables.append(reach.to_bytes(size, "little"))
+
+    return tables
+
+
+def _dp(values, lo, hi, max_results, deadline, fixed, fixed_sum):
+    """Enumerate subsets of values (plus the indexes in ``fixed``,
+    which add up to ``fixed_sum``) with totals in [lo, hi]. Returns the
+    subsets and whether the search finished."""
+
+    results = []
+    if fixed_sum > hi:
+        return results, True
+
+    lo, hi = max(lo - fixed_sum, 0), hi - fixed_sum
+    tables = _prefix_tables(values, hi)
+    last = tables[-1]
+    steps = 0
+
+    for s in range(lo, hi + 1):
+        if not last[s >> 3] >> (s & 7) & 1:
+            continue
+
+        # Depth-first search back through the tables: (items left to
+        # decide, remaining total, items chosen so far)
+        stack = [(len(values), s, fixed)]
+        while stack:
+            k, rem, chosen = stack.pop()
+            if k == 0:
+                results.append(tuple(sorted(chosen)))
+                if len(results) >= max_results:
+                    return results, True
+                continue
+
+            steps += 1
+            if deadline is not None and not steps % CHECK_EVERY \
+               and time.time() > deadline:
+                return results, False
+
+            table = tables[k - 1]
+            v = values[k - 1]
+            if table[rem >> 3] >> (rem & 7) & 1:
+                stack.append((k - 1, rem, chosen))
+            if rem >= v and table[(rem - v) >> 3] >> ((rem - v) & 7) & 1:
+                stack.append((k - 1, rem - v, chosen + (k - 1,)))
+
+    return results, True
+
+
+def _parallel_dp(values, lo, hi, max_results, deadline, workers):
+    # Loaded only here, since it is slow to import and rarely needed
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Split the search on whether each of the last few entries is
+    # included. Each worker rebuilds the (cheap) tables for the rest.
+    split = min(len(values) - 1, max(1, (workers - 1).bit_length() + 1))
+    head = values[:-split]
+    tail = range(len(values) - split, len(values))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for branch in range(2**split):
+            fixed = tuple(i for j, i in enumerate(tail) if branch >> j & 1)
+            futures.append(executor.submit(
+                _dp, head, lo, hi, max_results, deadline, fixed,
+                sum(values[i] for i in fixed)))
+
+        results = []
+        complete = True
+        for future in futures:
+            found, finished = future.result()
+            results.extend(found)
+            complete = complete and finished
+
+    return results, complete
+
+
+def _subset_sums(values, offset, hi, deadline):
+    """All (total, indexes) of subsets of values with total <= hi, and
+    whether the list is complete."""
+    sums = [(0, ())]
+    steps = 0
+    for i, v in enumerate(values, offset):
+        # Only the sums from before this value are extended
+        for j in range(len(sums)):
+            s, idx = sums[j]
+            if s + v <= hi:
+                sums.append((s + v, idx + (i,)))
+                if len(sums) >= SUBSET_LIMIT:
+                    return sorted(sums), False
+
+            steps += 1
+            if deadline is not None and not steps % CHECK_EVERY \
+               and time.time() > deadline:
+                return sorted(sums), False
+
+    return sorted(sums), True
+
+
+def _meet_in_the_middle(values, lo, hi, max_results, deadline):
+    half = len(values) // 2
+    left, left_complete = _subset_sums(values[:half], 0, hi, deadline)
+    right, right_complete = _subset_sums(values[half:], half, hi, deadline)
+    complete = left_complete and right_complete
+    right_sums = [s for s, _ in right]
+
+    results = []
+    for steps, (s, idx) in enumerate(left):
+        if deadline is not None and not steps % CHECK_EVERY \
+           and time.time() > deadline:
+            return results, False
+
+        for j in range(bisect_left(right_sums, lo - s),
+                       bisect_right(right_sums, hi - s)):
+            results.append(idx + right[j][1])
+            if len(results) >= max_results:
+                return results, complete
+
+    return results, complete
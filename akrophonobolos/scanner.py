@@ -0,0 +1,113 @@
+"""
+Find monetary amounts embedded in running text, such as a
+transcribed line of an inscription.
+
+"""
+
+import re
+from akrophonobolos.akrophonobolos import (Khremata, parse_amount,
+                                           parse_greek_amount)
+
+__all__ = ["SCAN_AMT", "scan_amounts", "scan_stream"]
+
+
+_GREEK_CHARS = "ΔΗΙΤΧ\U00010140-\U0001014E"
+
+# Unanchored versions of GREEK_AMT and AMT. An amount has to stand
+# on its own: a run of numerals inside a word (as in an inscription
+# written in capitals) is not an amount.
+SCAN_AMT = re.compile(
+    r"(?<!\w)(?:"
+    rf"(?P<greek>[{_GREEK_CHARS}]+)"
+    r"|(?P<abbr>(?=[0-9½¼])(?i:"
+    r"(?:[0-9]+T ?)?(?:[0-9]+D ?)?"
+    r"(?:(?:[0-9]+(?:\.[0-9]+)?|[0-9]*[½¼])[OB])?))"
+    r")(?!\w)"
+)
+
+# Characters that can be part of an amount. When scanning a stream,
+# a trailing run of these characters might continue in the next chunk
+_AMT_CHARS = frozenset(
+    "ΔΗΙΤΧ0123456789.½¼tdobTDOB "
+    + "".join(chr(c) for c in range(0x10140, 0x1014F))
+)
+
+
+def scan_amounts(text, offset=0):
+    """Find monetary amounts in a string.
+
+    :param text: Text to be scanned
+    :type text: str
+    :param offset: Added to the positions of the amounts found
+    :type offset: int
+    :return: Generator of ((start, end), Khremata) tuples
+    :rtype: generator
+
+    Finds both Greek acrophonic numerals such as "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ" and
+    abbreviations such as "1t 813d 1½b", so that
+
+    >>> list(obol.scan_amounts("𐅊· τόκος τούτον ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"))
+    [((0, 1), Khremata (50t [= 1800000.0 obols])),
+     ((16, 27), Khremata (2t 1970d [= 83820.0 obols]))]
+
+    """
+    yield from _scan(text, 0, len(text), offset)
+
+
+def scan_stream(chunks):
+    """Find monetary amounts in text delivered in chunks.
+
+    :param chunks: Text to be scanned
+    :type chunks: iterable of str (such as a file opened in text mode)
+    :return: Generator of ((start, end), Khremata) tuples
+    :rtype: generator
+
+    Works like :py:func:`scan_amounts` over the concatenation of
+    ``chunks``, with positions relative to the start of the
+    stream. Amounts split across chunk boundaries are found, and only
+    the text after the last complete amount is kept between chunks.
+
+    """
+    buf = ""
+    pos = 0      # Where to start scanning in buf
+    offset = 0   # Position of buf in the stream
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+
+        buf += chunk
+        tail = _tail_start(buf, pos)
+
+        # Everything before the trailing run of amount characters is
+        # complete and can be scanned
+        yield from _scan(buf, pos, tail, offset)
+
+        # Keep one character before the tail for the look-behind
+        keep = max(tail - 1, 0)
+        offset += keep
+        pos = tail - keep
+        buf = buf[keep:]
+
+    yield from _scan(buf, pos, len(buf), offset)
+
+
+def _scan(text, start, end, offset):
+    for m in SCAN_AMT.finditer(text, start, end):
+        if m["greek"]:
+            yield ((m.start() + offset, m.end() + offset),
+                   Khremata(parse_greek_amount(m["greek"])))
+
+        elif m["abbr"].strip():
+            amt = m["abbr"].rstrip()
+            yield ((m.start() + offset, m.start() + len(amt) + offset),
+                   Khremata(parse_amount(amt)))
+
+
+def _tail_start(text, start):
+    """Return the start of the run of amount characters ending text."""
+    i = len(text)
+    while i > start and text[i - 1] in _AMT_CHARS:
+        i -= 1
+
+    return i
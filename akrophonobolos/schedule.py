@@ -0,0 +1,147 @@
+"""
+Simulate loan accounts in which the principal and the rate change
+over the term of the loan.
+
+"""
+
+from bisect import bisect_right
+from enum import Enum
+from fractions import Fraction
+from akrophonobolos.akrophonobolos import (Khremata, getcontext,
+                                           interest_rate, round_amount)
+
+__all__ = ["Event", "AccrualSchedule"]
+
+
+class Event(Enum):
+    """Kinds of event in an :py:class:`AccrualSchedule`"""
+
+    DISBURSEMENT = 1
+    REPAYMENT = 2
+    RATE = 3
+
+
+class AccrualSchedule:
+    """Running principal and accrued simple interest of a loan account."""
+
+    def __init__(self, events, rate=interest_rate(), roundup=True,
+                 rounding=None):
+        """:param events: Events as (day, event, value) tuples. ``value``
+                          is an amount for :py:attr:`Event.DISBURSEMENT`
+                          and :py:attr:`Event.REPAYMENT` and a rate
+                          (as returned by
+                          :py:func:`akrophonobolos.interest_rate`) for
+                          :py:attr:`Event.RATE`
+        :type events: iterable of tuples
+        :param rate: Simple interest rate at the start of the account
+        :type rate: fractions.Fraction
+        :param roundup: If True, the interest accrued by a day is
+                        rounded up to the nearest quarter obolós when it
+                        is looked up
+        :type roundup: bool
+        :param rounding: How interest is rounded if ``roundup`` is
+                         True. Defaults to the rounding of the current
+                         :py:class:`akrophonobolos.Context`
+        :type rounding: Rounding
+        :raise ValueError: If a repayment exceeds the outstanding principal
+
+        Events do not have to be in order. Events on the same day are
+        applied in the order given. Interest accrues on the principal
+        outstanding from the day of one event until the day of the
+        next, and repayments are applied to the principal. Interest is
+        accrued exactly and only rounded once, when it is looked up, so
+        events that change nothing (such as a repayment of nothing) do
+        not change the interest.
+
+        The account is computed once, so that the balance on any day
+        can be looked up in O(log n) time with :py:meth:`balance`.
+
+        """
+
+        self.roundup = roundup
+        self.rounding = rounding or getcontext().rounding
+        self.days = []
+        self._principal = []
+        self._interest = []
+        self._rates = []
+
+        p = Fraction(0)
+        i = Fraction(0)
+        r = Fraction(rate)
+        last = None
+
+        for day, event, value in sorted(events, key=lambda e: e[0]):
+            if last is not None and day > last:
+                i += self._accrue(p, r, day - last)
+
+            if event is Event.DISBURSEMENT:
+                p += Khremata(value).b
+            elif event is Event.REPAYMENT:
+                p -= Khremata(value).b
+                if p < 0:
+                    raise ValueError(
+                        f"Repayment of {value} on day {day} exceeds the "
+                        "outstanding principal")
+            elif event is Event.RATE:
+                r = Fraction(value)
+            else:
+                raise ValueError(f"Unknown event {event}")
+
+            if day == last:
+                self._principal[-1] = p
+                self._interest[-1] = i
+                self._rates[-1] = r
+            else:
+                self.days.append(day)
+                self._principal.append(p)
+                self._interest.append(i)
+                self._rates.append(r)
+
+            last = day
+
+    def _accrue(self, p, r, d):
+        return p * r * d
+
+    def _state(self, day):
+        k = bisect_right(self.days, day) - 1
+        if k < 0:
+            return Fraction(0), Fraction(0)
+
+        return (self._principal[k],
+                self._interest[k] + self._accrue(
+                    self._principal[k], self._rates[k], day - self.days[k]))
+
+    def balance(self, day):
+        """Outstanding principal and accrued interest on a day
+
+        :param day: Day of the account
+        :type day: int
+        :return: (principal, interest)
+        :rtype: tuple of Khremata
+
+        """
+        p, i = self._state(day)
+        if self.roundup:
+            i = round_amount(i, self.rounding)
+
+        return Khremata(p), Khremata(i)
+
+    def principal_at(self, day):
+        """Outstanding principal on a day
+
+        :param day: Day of the account
+        :type day: int
+        :rtype: Khremata
+
+        """
+        return self.balance(day)[0]
+
+    def interest_at(self, day):
+        """Interest accrued up to a day
+
+        :param day: Day of the account
+        :type day: int
+        :rtype: Khremata
+
+        """
+        return self.balance(day)[1]
@@ -0,0 +1,325 @@
+"""
+Numeral systems and monetary standards other than the plain Attic
+talent, drachma and obol.
+
+Each :py:class:`MonetaryStandard` is compiled once, when it is
+created, into the lookup tables it uses for parsing and
+formatting. The module-level functions such as
+:py:func:`akrophonobolos.format_amount` do not go through the
+registry, so they are not slowed down by it.
+
+"""
+
+from fractions import Fraction
+import math
+import re
+from akrophonobolos.akrophonobolos import (
+    Fmt, Khremata, NUMERALS, UnparseableMonetaryString, _fmt_decimal,
+    _fmt_fraction, _fmt_tdo, rec_reduce)
+
+__all__ = ["UnknownMonetaryStandard", "MonetaryStandard", "STANDARDS",
+           "register_standard", "get_standard", "TDO_UNITS", "TMDO_UNITS",
+           "TMSDO_UNITS", "ATTIC_NUMERALS", "AEGINETAN_OBOL", "ATTIC",
+           "ATTIC_MINAE", "AEGINETAN"]
+
+
+class UnknownMonetaryStandard(Exception):
+    pass
+
+
+class MonetaryStandard:
+    """A system of monetary units and the numerals used to write them."""
+
+    def __init__(self, name, units, numerals, obol_value=Fraction(1)):
+        """:param name: Name under which the standard is registered
+        :type name: str
+        :param units: Units from largest to smallest as (abbreviation,
+                      singular, plural, obols) tuples. The last unit
+                      must be the obol itself
+        :type units: sequence of tuples
+        :param numerals: Acrophonic numerals and their values in
+                         obols, in order of preference for formatting
+        :type numerals: dict
+        :param obol_value: Value of an obol of this standard in Attic obols
+        :type obol_value: fractions.Fraction, int
+
+        Amounts are parsed into, and formatted from, a number of obols
+        of the standard itself. Use :py:meth:`convert` or
+        :py:meth:`to_khremata` to move between standards.
+
+        """
+
+        if units[-1][3] != 1:
+            raise ValueError("The smallest unit of a standard must be "
+                             "the obol")
+
+        self.name = name
+        self.units = tuple(units)
+        self.numerals = dict(numerals)
+        self.obol_value = Fraction(obol_value)
+
+        # Parse tables
+        self._values = {k: Fraction(v) for k, v in self.numerals.items()}
+        self._greek_re = re.compile(
+            "\\A[" + "".join(re.escape(k) for k in self._values) + "]+\\Z")
+        self._abbr_re = re.compile(
+            "\\A"
+            + "".join(f"(?:(\\d+){re.escape(u[0])} ?)?" for u in units[:-1])
+            + f"(?:(\\d+(?:\\.\\d+)?|\\d*[½¼])(?:{re.escape(units[-1][0])}"
+            + ("|O" if units[-1][0].lower() == "b" else "") + "))?\\Z",
+            re.I)
+        self._multipliers = tuple(Fraction(u[3]) for u in units)
+
+        # Format tables. When two numerals have the same value, the
+        # first one is used for formatting
+        greek = {}
+        for k, v in self._values.items():
+            greek.setdefault(v, k)
+        self._greek = tuple(sorted(greek.items(), reverse=True))
+        self._divisors = tuple(u[3] for u in units[:-1])
+        self._abbrs = tuple((u[0], u[0]) for u in units)
+        self._names = tuple((u[1], u[2]) for u in units)
+        self._fraction_funcs = (int,) * len(self._divisors) + (_fmt_fraction,)
+        self._decimal_funcs = (int,) * len(self._divisors) + (_fmt_decimal,)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ({self.name})"
+
+    def valid(self, amt):
+        """Return True if ``amt`` can be parsed in this standard.
+
+        :param amt: Monetary string
+        :type amt: str
+        :rtype: bool
+
+        """
+        return (self._greek_re.search(amt) is not None
+                or (bool(amt.strip())
+                    and self._abbr_re.search(amt) is not None))
+
+    def parse(self, amt):
+        """Parse a Greek numeral or abbreviation into obols of this standard.
+
+        :param amt: Monetary string
+        :type amt: str
+        :return: Amount in obols of this standard
+        :rtype: fractions.Fraction
+        :raise UnparseableMonetaryString: If `amt` cannot be parsed
+
+        """
+        if self._greek_re.search(amt):
+            values = self._values
+            return sum([values[c] for c in amt], Fraction(0))
+
+        amt_match = self._abbr_re.search(amt) if amt.strip() else None
+        if amt_match is None:
+            raise UnparseableMonetaryString(
+                f"Cannot parse {amt} as monetary amount in the "
+                f"{self.name} standard")
+
+        total = Fraction(0)
+        for count, mult in zip(amt_match.groups(), self._multipliers):
+            if count is not None:
+                total += _parse_count(count) * mult
+
+        return total
+
+    def format(self, amt, fmt_flags=Fmt.ABBR | Fmt.FRACTION):
+        """Format an amount of obols of this standard as a string.
+
+        :param amt: Amount in obols of this standard
+        :type amt: fractions.Fraction, int, float
+        :param fmt_flags: Flags for formatting options, as for
+                          :py:func:`akrophonobolos.format_amount`
+        :type fmt_flags: Fmt
+        :rtype: str
+
+        """
+        if fmt_flags & Fmt.GREEK:
+            return self._fmt_greek(
+                Fraction(math.ceil(Fraction(amt) * 4), 4))
+
+        funcs = self._decimal_funcs if fmt_flags & Fmt.DECIMAL \
+            else self._fraction_funcs
+
+        if fmt_flags & Fmt.ENGLISH:
+            return _fmt_tdo(rec_reduce(amt, self._divisors),
+                            self._names, funcs, " ", ", ")
+
+        return _fmt_tdo(rec_reduce(amt, self._divisors),
+                        self._abbrs, funcs, "", " ")
+
+    def _fmt_greek(self, amt):
+        parts = []
+        for value, num in self._greek:
+            if amt >= value:
+                count, amt = divmod(amt, value)
+                parts.append(num * count)
+
+        return "".join(parts)
+
+    def convert(self, amt, other):
+        """Convert obols of this standard to obols of another.
+
+        :param amt: Amount in obols of this standard
+        :type amt: fractions.Fraction, int
+        :param other: Standard to convert to
+        :type other: MonetaryStandard, str
+        :return: Amount in obols of ``other``
+        :rtype: fractions.Fraction
+
+        """
+        other = get_standard(other)
+        return Fraction(amt) * self.obol_value / other.obol_value
+
+    def to_khremata(self, amt):
+        """Convert an amount in this standard to Attic :py:class:`Khremata`
+
+        :param amt: Monetary string or amount in obols of this standard
+        :type amt: str, fractions.Fraction, int
+        :rtype: Khremata
+
+        """
+        if isinstance(amt, str):
+            amt = self.parse(amt)
+
+        return Khremata(Fraction(amt) * self.obol_value)
+
+    def from_khremata(self, amt):
+        """Convert Attic :py:class:`Khremata` to obols of this standard
+
+        :param amt: Attic amount
+        :type amt: Khremata
+        :rtype: fractions.Fraction
+
+        """
+        return amt.b / self.obol_value
+
+
+def _parse_count(count):
+    """Parse a count of units that may end in a vulgar fraction."""
+    if count[-1] == "½":
+        return Fraction(count[:-1] or 0) + Fraction(1, 2)
+
+    if count[-1] == "¼":
+        return Fraction(count[:-1] or 0) + Fraction(1, 4)
+
+    return Fraction(count)
+
+
+STANDARDS = {}
+
+
+def register_standard(standard):
+    """Add a monetary standard to the registry
+
+    :param standard: The standard to register under its name
+    :type standard: MonetaryStandard
+    :return: The registered standard
+    :rtype: MonetaryStandard
+
+    """
+
+    STANDARDS[standard.name] = standard
+    return standard
+
+
+def get_standard(name):
+    """Look up a registered monetary standard
+
+    :param name: Name of the standard, or a standard
+    :type name: str, MonetaryStandard
+    :rtype: MonetaryStandard
+    :raise UnknownMonetaryStandard: If no standard is registered as `name`
+
+    """
+    if isinstance(name, MonetaryStandard):
+        return name
+
+    try:
+        return STANDARDS[name]
+    except KeyError:
+        raise UnknownMonetaryStandard(
+            f"No monetary standard named {name}") from None
+
+
+def _drachmas(numerals):
+    """Numerals with values in drachmas to values in obols"""
+    return {k: v * 6 for k, v in numerals.items()}
+
+
+TDO_UNITS = (("t", "talent", "talents", 36_000),
+             ("d", "drachma", "drachmas", 6),
+             ("b", "obol", "obols", 1))
+
+TMDO_UNITS = (("t", "talent", "talents", 36_000),
+              ("m", "mina", "minae", 600),
+              ("d", "drachma", "drachmas", 6),
+              ("b", "obol", "obols", 1))
+
+TMSDO_UNITS = (("t", "talent", "talents", 36_000),
+               ("m", "mina", "minae", 600),
+               ("s", "stater", "staters", 12),
+               ("d", "drachma", "drachmas", 6),
+               ("b", "obol", "obols", 1))
+
+# Attic numerals, plus 𐅗 (10 minae), which is only used for parsing
+# since Χ has the same value
+ATTIC_NUMERALS = {**NUMERALS, "\U00010157": Fraction(6_000)}
+
+# The Aeginetan standard is conventionally reckoned at 10 Aeginetan
+# to 7 Attic
+AEGINETAN_OBOL = Fraction(10, 7)
+
+ATTIC = register_standard(
+    MonetaryStandard("attic", TDO_UNITS, ATTIC_NUMERALS))
+ATTIC_MINAE = register_standard(
+    MonetaryStandard("attic-minae", TMDO_UNITS, ATTIC_NUMERALS))
+AEGINETAN = register_standard(
+    MonetaryStandard("aeginetan", TMSDO_UNITS, ATTIC_NUMERALS,
+                     AEGINETAN_OBOL))
+
+# Local acrophonic variants. Local signs are preferred over the Attic
+# ones with the same value when formatting
+register_standard(MonetaryStandard(
+    "epidaurean", TMSDO_UNITS,
+    {**_drachmas({"\U0001016C": 500,     # 𐅬 FIVE HUNDRED
+                  "\U0001015E": 2}),     # 𐅞 TWO DRACHMAS
+     **ATTIC_NUMERALS},
+    AEGINETAN_OBOL))
+
+register_standard(MonetaryStandard(
+    "troezenian", TMSDO_UNITS,
+    {**_drachmas({"\U0001016D": 500,     # 𐅭 FIVE HUNDRED
+                  "\U00010166": 50,      # 𐅦 FIFTY
+                  "\U00010167": 50,      # 𐅧 FIFTY ALTERNATE FORM
+                  "\U00010160": 10,      # 𐅠 TEN
+                  "\U00010161": 10,      # 𐅡 TEN ALTERNATE FORM
+                  "\U0001015F": 5}),     # 𐅟 FIVE
+     **ATTIC_NUMERALS},
+    AEGINETAN_OBOL))
+
+register_standard(MonetaryStandard(
+    "thespian", TMSDO_UNITS,
+    {**_drachmas({"\U00010172": 5000,    # 𐅲 FIVE THOUSAND
+                  "\U00010171": 1000,    # 𐅱 ONE THOUSAND
+                  "\U0001016E": 500,     # 𐅮 FIVE HUNDRED
+                  "\U0001016B": 300,     # 𐅫 THREE HUNDRED
+                  "\U0001016A": 100,     # 𐅪 ONE HUNDRED
+                  "\U00010169": 50,      # 𐅩 FIFTY
+                  "\U00010165": 30,      # 𐅥 THIRTY
+                  "\U00010164": 10,      # 𐅤 TEN
+                  "\U0001015C": 2,       # 𐅜 TWO
+                  "\U00010159": 1}),     # 𐅙 ONE
+     **ATTIC_NUMERALS},
+    AEGINETAN_OBOL))
+
+register_standard(MonetaryStandard(
+    "naxian", TDO_UNITS,
+    {**_drachmas({"\U00010170": 500}),   # 𐅰 FIVE HUNDRED
+     **ATTIC_NUMERALS}))
+
+register_standard(MonetaryStandard(
+    "carystian", TDO_UNITS,
+    {**_drachmas({"\U0001016F": 500}),   # 𐅯 FIVE HUNDRED
+     **ATTIC_NUMERALS}))
@@ -0,0 +1,253 @@
+"""
+Reproducible synthetic numerals and loan accounts for load testing.
+
+"""
+
+import csv
+from enum import Enum
+from fractions import Fraction
+import io
+import math
+import random
+from akrophonobolos.akrophonobolos import (Khremata, _quarter_value,
+                                           format_amount, greek_quarters,
+                                           interest, interest_rate)
+
+__all__ = ["WRITE_LINES", "OCR_CONFUSIONS", "ACCOUNT_FIELDS", "Distribution",
+           "CorpusGenerator"]
+
+
+# Lines written to disk at a time
+WRITE_LINES = 10_000
+
+# Misreadings typical of OCR: Latin look-alikes and similar numerals
+OCR_CONFUSIONS = {
+    "Τ": ("T",),
+    "Χ": ("X",),
+    "Η": ("H", "Ν"),
+    "Δ": ("Λ", "Α"),
+    "Ι": ("I", "1"),
+    "𐅂": ("Ϝ", "Γ"),
+    "𐅃": ("𐅄", "Γ"),
+    "𐅄": ("𐅃", "𐅅"),
+    "𐅅": ("𐅄", "𐅆"),
+    "𐅆": ("𐅅",),
+    "𐅁": ("C", "<"),
+}
+
+ACCOUNT_FIELDS = ("principal", "days", "interest")
+
+
+class Distribution(Enum):
+    """Distributions of generated amounts"""
+
+    LOG_UNIFORM = 1
+    UNIFORM = 2
+
+
+class CorpusGenerator:
+    """A seeded source of synthetic amounts, numerals and loans."""
+
+    def __init__(self, seed=None, lo="¼b", hi="100t",
+                 distribution=Distribution.LOG_UNIFORM, step="¼b",
+                 ocr_rate=0, lacuna_rate=0, days=(1, 1460),
+                 rate=interest_rate()):
+        """:param seed: Seed for the random number generator. The same
+                     seed and the same calls produce the same output
+        :type seed: int
+        :param lo: Smallest amount
+        :type lo: str, int, fraction.Fraction, Khremata
+        :param hi: Largest amount
+        :type hi: str, int, fraction.Fraction, Khremata
+        :param distribution: How amounts are spread between ``lo`` and
+                             ``hi``, or a function taking a
+                             :py:class:`random.Random` and returning a
+                             number of quarter oboloí
+        :type distribution: Distribution, callable
+        :param step: Amounts are multiples of this, such as "1d" for
+                     whole drakhmaí
+        :type step: str, int, fraction.Fraction, Khremata
+        :param ocr_rate: Chance that each character of a numeral is
+                         misread (see :py:data:`OCR_CONFUSIONS`)
+        :type ocr_rate: float
+        :param lacuna_rate: Chance that part of a numeral is lost and
+                            replaced by dots in square brackets
+        :type lacuna_rate: float
+        :param days: Shortest and longest loan terms for :py:meth:`accounts`
+        :type days: tuple
+        :param rate: Interest rate for :py:meth:`accounts`
+        :type rate: fractions.Fraction
+
+        :py:attr:`Distribution.LOG_UNIFORM`, the default, makes each
+        order of magnitude equally likely, so that there are as many
+        amounts in oboloí as in talents, as in the inscriptions.
+
+        """
+        self.rng = random.Random(seed)
+        self.lo = math.ceil(_quarter_value(lo))
+        self.hi = math.ceil(_quarter_value(hi))
+        self.step = math.ceil(_quarter_value(step))
+        self.distribution = distribution
+        self.ocr_rate = ocr_rate
+        self.lacuna_rate = lacuna_rate
+        self.days = days
+        self.rate = rate
+
+        if not 0 < self.lo <= self.hi or self.step < 1:
+            raise ValueError("Amounts must be greater than zero and lo "
+                             "no greater than hi")
+
+        self._log_lo = math.log(self.lo)
+        self._log_hi = math.log(self.hi + 1)
+
+    def quarters(self):
+        """
+        :return: A random amount in quarter oboloí
+        :rtype: int
+        """
+        rng = self.rng
+        if self.distribution is Distribution.UNIFORM:
+            q = rng.randint(self.lo, self.hi)
+        elif self.distribution is Distribution.LOG_UNIFORM:
+            q = min(int(math.exp(rng.uniform(self._log_lo, self._log_hi))),
+                    self.hi)
+        else:
+            q = self.distribution(rng)
+
+        return max(q - q % self.step, self.step)
+
+    def amounts(self, n):
+        """
+        :param n: Number of amounts
+        :type n: int
+        :rtype: iterator of Khremata
+        """
+        for _ in range(n):
+            yield Khremata(Fraction(self.quarters(), 4))
+
+    def numerals(self, n):
+        """Generate amounts in Greek acrophonic numerals, with noise
+
+        :param n: Number of amounts
+        :type n: int
+        :rtype: iterator of str
+
+        """
+        for _ in range(n):
+            yield self.noisy(greek_quarters(self.quarters()))
+
+    def abbreviations(self, n):
+        """Generate amounts abbreviated with "t", "d", and "b"
+
+        :param n: Number of amounts
+        :type n: int
+        :rtype: iterator of str
+
+        """
+        for _ in range(n):
+            yield format_amount(Fraction(self.quarters(), 4))
+
+    def accounts(self, n, omit=None):
+        """Generate loans with their interest
+
+        :param n: Number of loans
+        :type n: int
+        :param omit: Field to leave empty in every loan, "random" for a
+                     different one each time (for input to ``logistes
+                     --batch``), or None
+        :type omit: str
+        :return: Dictionaries with the principal and interest in Greek
+                 numerals (with noise) and the days
+        :rtype: iterator of dict
+
+        """
+        rng = self.rng
+        for _ in range(n):
+            q = self.quarters()
+            days = rng.randint(*self.days)
+            i = interest(Fraction(q, 4), days, self.rate)
+            loan = {"principal": self.noisy(greek_quarters(q)),
+                    "days": days,
+                    "interest": self.noisy(greek_quarters(int(i.b * 4)))}
+
+            field = rng.choice(ACCOUNT_FIELDS) if omit == "random" else omit
+            if field is not None:
+                loan[field] = ""
+
+            yield loan
+
+    def noisy(self, numeral):
+        """Add OCR misreadings and lacunae to a numeral
+
+        :param numeral: Greek numeral
+        :type numeral: str
+        :rtype: str
+
+        """
+        rng = self.rng
+        if self.ocr_rate:
+            numeral = "".join(
+                rng.choice(OCR_CONFUSIONS[c])
+                if c in OCR_CONFUSIONS and rng.random() < self.ocr_rate
+                else c for c in numeral)
+
+        if numeral and self.lacuna_rate and rng.random() < self.lacuna_rate:
+            start = rng.randrange(len(numeral))
+            end = rng.randint(start + 1, len(numeral))
+            numeral = (f"{numeral[:start]}[{'.' * (end - start)}]"
+                       f"{numeral[end:]}")
+
+        return numeral
+
+    def write(self, path, n, kind="numerals"):
+        """Write generated lines to a file
+
+        :param path: Path of the file
+        :type path: str
+        :param n: Number of lines (not counting the header of accounts)
+        :type n: int
+        :param kind: "numerals", "abbreviations", or "accounts" (written
+                     as CSV, with a random field of each left empty)
+        :type kind: str
+        :return: Number of lines written, including the header
+        :rtype: int
+
+        Lines are written in blocks of :py:data:`WRITE_LINES`, so files
+        of many gigabytes can be made quickly in little memory.
+
+        """
+        if kind == "accounts":
+            lines = self._account_lines(n)
+        elif kind in ("numerals", "abbreviations"):
+            lines = getattr(self, kind)(n)
+        else:
+            raise ValueError(f"Unknown kind of output {kind}")
+
+        written = 0
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            if kind == "accounts":
+                f.write(",".join(ACCOUNT_FIELDS) + "\n")
+                written += 1
+
+            block = []
+            for line in lines:
+                block.append(line)
+                if len(block) == WRITE_LINES:
+                    f.write("\n".join(block) + "\n")
+                    written += len(block)
+                    block = []
+
+            if block:
+                f.write("\n".join(block) + "\n")
+                written += len(block)
+
+        return written
+
+    def _account_lines(self, n):
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="")
+        for loan in self.accounts(n, omit="random"):
+            buf.seek(0)
+            buf.truncate()
+            writer.writerow([loan[k] for k in ACCOUNT_FIELDS])
+            yield buf.getvalue()
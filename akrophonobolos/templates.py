@@ -0,0 +1,184 @@
+"""
+User-defined output formats for monetary amounts.
+
+"""
+
+from string import Formatter
+from akrophonobolos.akrophonobolos import (FMT_TDO, Khremata, _fmt_akrophonic,
+                                           _fmt_decimal, _fmt_fraction,
+                                           round_amount)
+
+__all__ = ["FIELDS", "AmountFormat", "compile_format"]
+
+
+FIELDS = ("t", "d", "b", "greek", "obols")
+
+
+class AmountFormat:
+    """A compiled output format for monetary amounts."""
+
+    def __init__(self, template):
+        """:param template: Format template
+        :type template: str
+        :raise ValueError: If the template uses an unknown field or option
+
+        The template uses the syntax of :py:meth:`str.format` with these
+        fields:
+
+        ``{t}``, ``{d}``
+            Talents and drakhmai (the remainder after talents), as
+            integers. These accept any integer format specification,
+            such as ``{d:04}`` for a zero-padded column
+        ``{b}``
+            Oboloí (the remainder after drakhmai). Formatted with
+            vulgar fractions ("1½") by default or with ``{b:frac}``,
+            as a decimal with ``{b:dec}``, or with any float format
+            specification such as ``{b:5.2f}``
+        ``{greek}``
+            Greek acrophonic numerals, rounded up to the quarter obolós.
+            ``{greek:sep=·}`` puts "·" between the talents, drakhmai and
+            oboloí
+        ``{obols}``
+            The whole amount in oboloí, with the same options as ``{b}``
+
+        The template is parsed once, when the format is created, so
+        applying it with :py:meth:`format` only does the arithmetic
+        the fields need.
+
+        """
+
+        self.template = template
+        fmt = []
+        converters = []
+
+        for literal, field, spec, conversion in Formatter().parse(template):
+            fmt.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field is None:
+                continue
+
+            if field not in FIELDS or conversion:
+                raise ValueError(f"Unknown field {{{field}}} in format "
+                                 f"template {template!r}")
+
+            converter, spec = _compile_field(field, spec or "")
+            fmt.append(f"{{{len(converters)}:{spec}}}" if spec
+                       else f"{{{len(converters)}}}")
+            converters.append(converter)
+
+        self._fmt = "".join(fmt).format
+        self._converters = tuple(converters)
+        self._needs_tdo = any(c[0] == "tdo" for c in converters)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} ({self.template!r})"
+
+    def format(self, amt):
+        """
+        :param amt: Amount to be formatted
+        :type amt: str, Khremata, fractions.Fraction, int, float
+        :rtype: str
+        """
+        if isinstance(amt, Khremata):
+            amt = amt.b
+        elif isinstance(amt, str):
+            amt = Khremata(amt).b
+
+        tdo = None
+        if self._needs_tdo:
+            t, rest = divmod(amt, FMT_TDO[0])
+            d, b = divmod(rest, FMT_TDO[1])
+            tdo = (t, d, b)
+
+        return self._fmt(*[func(amt, tdo, arg)
+                           for _, func, arg in self._converters])
+
+    __call__ = format
+
+    def format_many(self, amts):
+        """
+        :param amts: Amounts to be formatted
+        :type amts: iterable of str, Khremata, fractions.Fraction, int, float
+        :rtype: list of str
+        """
+        fmt = self.format
+        return [fmt(amt) for amt in amts]
+
+
+def compile_format(template):
+    """Compile a template into an :py:class:`AmountFormat`
+
+    :param template: Format template (see :py:class:`AmountFormat`)
+    :type template: str
+    :rtype: AmountFormat
+
+    >>> fmt = obol.compile_format("{t}T {d:04}D {b:frac}b")
+    >>> fmt.format(obol.Khremata("1t 813d 1½b"))
+    '1T 0813D 1½b'
+
+    """
+    return AmountFormat(template)
+
+
+def _compile_field(field, spec):
+    """Return a (kind, function, argument) converter and the format
+    spec to be applied to its result."""
+
+    if field in ("t", "d"):
+        return ("tdo", _tdo_int, "td".index(field)), spec
+
+    if field == "b":
+        return _compile_obols(_tdo_obols, spec)
+
+    if field == "obols":
+        return _compile_obols(_total_obols, spec)
+
+    # greek
+    if spec and not spec.startswith("sep="):
+        raise ValueError(f"Unknown option {spec!r} for {{greek}}")
+
+    if spec:
+        return ("tdo", _greek_sep, spec[4:]), ""
+
+    return ("amt", _greek, None), ""
+
+
+def _compile_obols(func, spec):
+    kind = "tdo" if func is _tdo_obols else "amt"
+
+    if spec in ("", "frac"):
+        return (kind, func, _fmt_fraction), ""
+
+    if spec == "dec":
+        return (kind, func, _fmt_decimal), ""
+
+    return (kind, func, float), spec
+
+
+def _tdo_int(amt, tdo, i):
+    return int(tdo[i])
+
+
+def _tdo_obols(amt, tdo, conv):
+    return conv(tdo[2])
+
+
+def _total_obols(amt, tdo, conv):
+    return conv(amt)
+
+
+def _greek(amt, tdo, arg):
+    return "".join(_fmt_akrophonic(round_amount(amt)))
+
+
+def _greek_sep(amt, tdo, sep):
+    t, d, b = tdo
+    b = round_amount(b)
+    if b == 6:
+        d, b = d + 1, 0
+    if d * FMT_TDO[1] == FMT_TDO[0]:
+        t, d = t + 1, 0
+
+    return sep.join([g for g in ("".join(_fmt_akrophonic(t * FMT_TDO[0])),
+                                 "".join(_fmt_akrophonic(d * FMT_TDO[1])),
+                                 "".join(_fmt_akrophonic(b)))
+                     if g])
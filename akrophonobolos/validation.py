@@ -0,0 +1,134 @@
+"""
+Parsing without exceptions, for input that is often not a valid amount.
+
+"""
+
+from collections import namedtuple
+from enum import Enum
+from fractions import Fraction
+import math
+from akrophonobolos.akrophonobolos import (AMT, GREEK_AMT, NUMERALS, Khremata,
+                                           parse_amount, parse_greek_amount)
+
+__all__ = ["AmountType", "ParseError", "ParseResult", "Classification",
+           "NUMERAL_CHARS", "OPERATORS", "try_parse", "classify_amounts"]
+
+
+class AmountType(Enum):
+    """Kinds of input detected by :py:func:`classify_amounts`"""
+
+    GREEK = 1
+    ABBR = 2
+    OP = 3
+    UNKNOWN = 4
+
+
+class ParseError(Enum):
+    """Error codes returned by :py:func:`try_parse`"""
+
+    OK = 0
+    EMPTY = 1
+    UNPARSEABLE = 2
+    UNSUPPORTED_TYPE = 3
+
+
+ParseResult = namedtuple("ParseResult", ["value", "error"])
+ParseResult.__doc__ = """Result of :py:func:`try_parse`: a
+:py:class:`Khremata` (or None) and a :py:class:`ParseError`"""
+
+Classification = namedtuple("Classification", ["types", "valid", "values"])
+Classification.__doc__ = """Result of :py:func:`classify_amounts`: lists
+of :py:class:`AmountType`, validity flags, and :py:class:`Khremata` (or
+None) in the order of the input"""
+
+NUMERAL_CHARS = frozenset(NUMERALS)
+OPERATORS = frozenset(("+", "-"))
+
+
+def try_parse(amt):
+    """Parse an amount without raising an exception.
+
+    :param amt: Monetary amount
+    :type amt: str, float, int, fraction.Fraction, Khremata
+    :return: (value, error), where value is None unless error is
+             :py:attr:`ParseError.OK`
+    :rtype: ParseResult
+
+    Accepts the same input as :py:class:`Khremata`, except that an
+    empty string is reported as :py:attr:`ParseError.EMPTY` rather than
+    read as zero.
+
+    """
+
+    if isinstance(amt, str):
+        if not amt.strip():
+            return ParseResult(None, ParseError.EMPTY)
+
+        if GREEK_AMT.search(amt):
+            return ParseResult(Khremata(parse_greek_amount(amt)),
+                               ParseError.OK)
+
+        if AMT.search(amt):
+            return ParseResult(Khremata(parse_amount(amt)), ParseError.OK)
+
+        return ParseResult(None, ParseError.UNPARSEABLE)
+
+    if isinstance(amt, Khremata):
+        return ParseResult(amt, ParseError.OK)
+
+    if isinstance(amt, float) and not math.isfinite(amt):
+        return ParseResult(None, ParseError.UNPARSEABLE)
+
+    if isinstance(amt, (int, float, Fraction)):
+        return ParseResult(Khremata(amt), ParseError.OK)
+
+    return ParseResult(None, ParseError.UNSUPPORTED_TYPE)
+
+
+def classify_amounts(items):
+    """Detect the type of, validate, and parse many strings at once.
+
+    :param items: Strings to classify
+    :type items: iterable of str
+    :rtype: Classification
+
+    Each string is classified as Greek numerals (if it contains any
+    acrophonic numeral), an abbreviation, an operator ("+" or "-"), or
+    unknown. Greek numerals and abbreviations are parsed if they are
+    valid. The result has three lists, in the order of ``items``: the
+    types, a validity mask, and the parsed values (None where not
+    valid).
+
+    """
+
+    types = []
+    valid = []
+    values = []
+    greek_match = GREEK_AMT.search
+    amt_match = AMT.search
+    numeral_chars = NUMERAL_CHARS
+
+    for item in items:
+        if not numeral_chars.isdisjoint(item):
+            types.append(AmountType.GREEK)
+            if greek_match(item):
+                valid.append(True)
+                values.append(Khremata(parse_greek_amount(item)))
+                continue
+
+        elif item in OPERATORS:
+            types.append(AmountType.OP)
+
+        elif item.strip() and amt_match(item):
+            types.append(AmountType.ABBR)
+            valid.append(True)
+            values.append(Khremata(parse_amount(item)))
+            continue
+
+        else:
+            types.append(AmountType.UNKNOWN)
+
+        valid.append(False)
+        values.append(None)
+
+    return Classification(types, valid, values)
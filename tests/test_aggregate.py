@@ -0,0 +1,84 @@
+from bisect import bisect_left
+import pickle
+import random
+import akrophonobolos as obol
+from akrophonobolos import synthetic
+
+
+def rank(values, x):
+    return bisect_left(values, x) / len(values)
+
+
+def test_sketch_accuracy():
+    rng = random.Random(48)
+    values = [rng.randrange(10**6) for _ in range(50_000)]
+    sketch = obol.QuantileSketch()
+    for v in values:
+        sketch.add(v)
+
+    values.sort()
+    for q in (0.1, 0.25, 0.5, 0.9, 0.99):
+        assert abs(rank(values, sketch.quantile(q)) - q) < 0.02
+
+    assert len(sketch) == 50_000
+    assert sum(len(level) for level in sketch.levels) < 1000
+
+
+def test_sketch_merge():
+    rng = random.Random(49)
+    values = [rng.randrange(10**6) for _ in range(40_000)]
+    sketches = [obol.QuantileSketch() for _ in range(4)]
+    for i, v in enumerate(values):
+        sketches[i % 4].add(v)
+
+    merged = sketches[0]
+    for s in sketches[1:]:
+        merged.merge(s)
+
+    values.sort()
+    assert len(merged) == 40_000
+    assert abs(rank(values, merged.quantile(0.5)) - 0.5) < 0.02
+    assert obol.QuantileSketch().quantile(0.5) is None
+
+
+def test_group_aggregator():
+    agg = obol.GroupAggregator()
+    agg.add_many([("Athens", "ΤΤ"), ("Athens", "Τ"), ("Samos", "Χ"),
+                  ("Athens", "1½b")])
+
+    athens = agg["Athens"]
+    assert athens.count == 3
+    assert athens.total == obol.Khremata("3t 1½b")
+    assert athens.min == obol.Khremata("1½b")
+    assert athens.max == obol.Khremata("2t")
+    assert athens.mean == obol.Khremata("1t ½b")
+    assert athens.quantile(0.5) == obol.Khremata("1t")
+    assert sorted(agg.keys()) == ["Athens", "Samos"]
+
+    summary = agg.summary(qs=(0, 1))["Samos"]
+    assert summary.count == 1
+    assert summary.quantiles == {0: obol.Khremata("1000d"),
+                                 1: obol.Khremata("1000d")}
+
+
+def test_group_merge():
+    gen = synthetic.CorpusGenerator(50)
+    pairs = [(n % 7, amt) for n, amt in enumerate(gen.amounts(7_000))]
+
+    whole = obol.GroupAggregator()
+    whole.add_many(pairs)
+
+    parts = [obol.GroupAggregator() for _ in range(3)]
+    for i, part in enumerate(parts):
+        part.add_many(pairs[i::3])
+
+    # Partial results can be sent between processes
+    merged = pickle.loads(pickle.dumps(parts[0]))
+    for part in parts[1:]:
+        merged.merge(part)
+
+    for key in range(7):
+        assert merged[key].count == whole[key].count
+        assert merged[key].total == whole[key].total
+        assert merged[key].min == whole[key].min
+        assert merged[key].max == whole[key].max
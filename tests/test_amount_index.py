@@ -0,0 +1,45 @@
+import akrophonobolos as obol
+from fractions import Fraction
+
+
+LOANS = [("𐅊", "line 7"), ("𐅋", "line 12"), ("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι", "line 88"),
+         ("5t", "a"), ("10t", "b"), ("7t", "c"), (Fraction(1, 3), "d")]
+
+
+def test_range():
+    index = obol.AmountIndex(LOANS)
+
+    assert len(index) == 7
+    assert index.range("5t", "10t") == [(obol.Khremata("5t"), "a"),
+                                         (obol.Khremata("7t"), "c"),
+                                         (obol.Khremata("10t"), "b")]
+    assert [p for _, p in index.range(hi="1t")] == ["d", "line 88"]
+    assert [p for _, p in index.range("50t")] == ["line 7", "line 12"]
+    assert index.range("11t", "12t") == []
+
+
+def test_exact():
+    index = obol.AmountIndex(LOANS)
+
+    assert index.exact("𐅈") == ["a"]
+    assert index.exact(Fraction(1, 3)) == ["d"]
+    assert index.exact("6t") == []
+
+
+def test_nearest():
+    index = obol.AmountIndex(LOANS)
+
+    assert index.nearest("6t") == [(obol.Khremata("5t"), "a")]
+    assert [p for _, p in index.nearest("6t 3001d", 3)] == ["c", "a", "b"]
+    assert [p for _, p in index.nearest("1000t", 2)] == ["line 12", "line 7"]
+    assert len(index.nearest(0, 100)) == 7
+    assert obol.AmountIndex().nearest(0) == []
+
+
+def test_insert():
+    index = obol.AmountIndex(LOANS)
+    index.insert("6t", "e")
+    index.insert("5t", "f")
+
+    assert [p for _, p in index.range("5t", "7t")] == ["a", "f", "e", "c"]
+    assert [amt for amt, _ in index] == sorted(amt for amt, _ in index)
@@ -0,0 +1,67 @@
+import akrophonobolos as obol
+from fractions import Fraction
+import pytest
+
+
+def test_quota():
+    # The aparche, 1/60 of the tribute
+    assert obol.quota("1t", Fraction(1, 60)) == obol.Khremata("100d")
+    assert obol.quota("1d", Fraction(1, 60)).b == Fraction(1, 10)
+    assert obol.quota("1d", Fraction(1, 60), obol.Rounding.CEIL) == 0.25
+
+
+def test_apportion():
+    shares = obol.apportion("1t", [1, 1, 1])
+    assert shares == [obol.Khremata("2000d")] * 3
+
+    shares = obol.apportion("1d", [1, 1, 1, 1, 1, 1, 1])
+    assert sum(s.b for s in shares) == 6
+    assert sorted(s.b for s in shares) == \
+        [Fraction(3, 4)] * 4 + [Fraction(1)] * 3
+
+
+def test_apportion_policies():
+    # 1 obol in 3 shares: 1/4 each with 1/4 left over
+    amt = "1b"
+    weights = [1, 2, 1]
+
+    # 1/4, 1/2, 1/4 exactly
+    assert obol.apportion(amt, weights) == [0.25, 0.5, 0.25]
+
+    weights = [Fraction(1, 3), Fraction(1, 3), Fraction(1, 3)]
+    assert obol.apportion(amt, weights, obol.Allocation.FIRST) == \
+        [0.5, 0.25, 0.25]
+    assert obol.apportion(amt, weights, obol.Allocation.LAST) == \
+        [0.25, 0.25, 0.5]
+
+    weights = [3, 5, 2]
+    # 4 quarters: 1.2, 2, 0.8
+    assert obol.apportion(amt, weights) == [0.25, 0.5, 0.25]
+    assert obol.apportion(amt, weights,
+                          obol.Allocation.LARGEST_SHARE) == [0.5, 0.5, 0]
+
+
+def test_apportion_sums_exactly():
+    weights = [0.1, 0.2, 0.3, 0.4, Fraction(1, 7)]
+    for amt in ("ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", "1t 813d 1½b", "𐅂ΙΙΙΙΙ𐅁"):
+        for policy in obol.Allocation:
+            shares = obol.apportion(amt, weights, policy)
+            assert sum(s.b for s in shares) == obol.Khremata(amt).b
+            assert all((s.b * 4).denominator == 1 for s in shares)
+
+
+def test_apportion_many():
+    amts = ["1t", "1d", "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"]
+    assert obol.apportion_many(amts, [2, 1]) == \
+        [obol.apportion(a, [2, 1]) for a in amts]
+
+
+def test_apportion_invalid():
+    with pytest.raises(ValueError):
+        obol.apportion(0.1, [1, 1])
+
+    with pytest.raises(ValueError):
+        obol.apportion("1d", [0, 0])
+
+    with pytest.raises(ValueError):
+        obol.apportion("1d", [1, -1])
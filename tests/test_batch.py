@@ -0,0 +1,77 @@
+import json
+import pytest
+from akrophonobolos import batch
+
+
+def upper(lines, header):
+    return "".join(h.strip() + ":" + line.upper() for h in header[:1]
+                   for line in lines)
+
+
+class Interrupted(Exception):
+    pass
+
+
+def write_input(tmp_path, n):
+    source = tmp_path / "in.txt"
+    source.write_text("name\n" + "".join(f"line {i}\n" for i in range(n)))
+    return source
+
+
+def test_run_resumable(tmp_path):
+    source = write_input(tmp_path, 25)
+    output = tmp_path / "out.txt"
+    checkpoint = tmp_path / "job.json"
+
+    assert batch.run_resumable(str(source), str(output), upper,
+                              str(checkpoint), chunk_lines=10,
+                              header_lines=1, prelude="start\n") == 3
+
+    lines = output.read_text().splitlines()
+    assert lines[0] == "start"
+    assert lines[1] == "name:LINE 0"
+    assert len(lines) == 26
+    assert not checkpoint.exists()
+
+
+def test_run_resumable_resume(tmp_path):
+    source = write_input(tmp_path, 25)
+    expected = tmp_path / "expected.txt"
+    output = tmp_path / "out.txt"
+    checkpoint = tmp_path / "job.json"
+    batch.run_resumable(str(source), str(expected), upper, chunk_lines=10,
+                       header_lines=1)
+
+    calls = []
+
+    def failing(lines, header):
+        calls.append(lines)
+        if len(calls) == 2:
+            # Half of a chunk written before the crash
+            with open(output, "a") as f:
+                f.write("partial")
+            raise Interrupted()
+        return upper(lines, header)
+
+    with pytest.raises(Interrupted):
+        batch.run_resumable(str(source), str(output), failing,
+                           str(checkpoint), chunk_lines=10, header_lines=1)
+
+    assert json.loads(checkpoint.read_text())["chunk"] == 1
+
+    assert batch.run_resumable(str(source), str(output), upper,
+                              str(checkpoint), chunk_lines=10,
+                              header_lines=1) == 2
+    assert output.read_text() == expected.read_text()
+    assert not checkpoint.exists()
+
+
+def test_run_resumable_other_job(tmp_path):
+    source = write_input(tmp_path, 5)
+    checkpoint = tmp_path / "job.json"
+    checkpoint.write_text(json.dumps({"source": "elsewhere", "output": "x",
+                                      "chunk": 1, "offset": 0, "size": 0}))
+
+    with pytest.raises(ValueError):
+        batch.run_resumable(str(source), str(tmp_path / "out.txt"), upper,
+                           str(checkpoint))
@@ -1,5 +1,6 @@
 import akrophonobolos as obol
 from fractions import Fraction
+import pytest
 
 
 def test_init():
@@ -179,3 +180,117 @@ def test_interest():
     interest = (principal / 30000) * days
     assert interest.as_abbr() == "3t 5940d"
     assert interest.as_greek() == "ΤΤΤ𐅆𐅅ΗΗΗΗΔΔΔΔ"
+
+
+def test_as_greek_rounding():
+    money = obol.Khremata("1d 1.1b")
+    assert money.as_greek() == "𐅂Ι"
+    assert money.as_greek(obol.Rounding.CEIL) == "𐅂Ι𐅀"
+    assert obol.Khremata("1d 1.9b").as_greek(obol.Rounding.OBOL) == "𐅂Ι"
+
+
+def test_lazy():
+    money = obol.LazyKhremata("Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁")
+    assert not money.parsed
+    assert money.raw == "Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁"
+    assert not money.parsed
+
+    assert money == obol.Khremata("1t 813d 1½b")
+    assert money.parsed
+    assert money.b == Fraction(81759, 2)
+    assert money.as_abbr() == "1t 813d 1½b"
+
+    # Works anywhere a Khremata does
+    assert isinstance(money, obol.Khremata)
+    assert money + "1d" == obol.Khremata("1t 814d 1½b")
+    assert obol.Khremata("1d") + obol.LazyKhremata("1d") == 12
+    assert obol.interest(obol.LazyKhremata("5t"), 1) == 6
+
+
+def test_lazy_unparseable():
+    money = obol.LazyKhremata("1Z")
+    assert money.raw == "1Z"
+
+    with pytest.raises(obol.UnparseableMonetaryString):
+        money.b
+
+
+def test_pickle():
+    import pickle
+
+    for amt in ("1t 813d 1½b", 0, -5, 0.1, Fraction(1, 3)):
+        money = obol.Khremata(amt)
+        copy = pickle.loads(pickle.dumps(money))
+        assert isinstance(copy, obol.Khremata)
+        assert copy.b == money.b
+
+    # Quarter obols are pickled as a single integer
+    assert len(pickle.dumps([obol.Khremata(i) for i in range(100)])) < 1000
+
+    lazy = pickle.loads(pickle.dumps(obol.LazyKhremata("1Z")))
+    assert lazy.raw == "1Z"
+
+
+def test_to_bytes():
+    for amt in ("1t 813d 1½b", "𐅎𐅎𐅎", 0, -5, -0.25, 0.1, Fraction(-1, 3)):
+        money = obol.Khremata(amt)
+        assert obol.Khremata.from_bytes(money.to_bytes()) == money
+
+    assert obol.Khremata("1d").to_bytes() == bytes([96])
+    assert len(obol.Khremata("1t 813d 1½b").to_bytes()) == 3
+
+    with pytest.raises(ValueError):
+        obol.Khremata.from_bytes(obol.Khremata("1t").to_bytes() + b"\0")
+
+    with pytest.raises(ValueError):
+        obol.Khremata.from_bytes(obol.Khremata("1t").to_bytes()[:-1])
+
+
+def test_pack_amounts():
+    amts = ["1t 813d 1½b", 0, -5, 0.1, Fraction(1, 3), obol.Khremata("1d")]
+    packed = obol.pack_amounts(amts)
+
+    assert obol.unpack_amounts(packed) == [obol.Khremata(a) for a in amts]
+    assert obol.unpack_amounts(obol.pack_amounts([])) == []
+
+    with pytest.raises(ValueError):
+        obol.unpack_amounts(packed[:-1])
+
+
+def test_context_limit():
+    third = Fraction(1, 3) + Fraction(1, 1_000_003)
+    assert obol.Khremata(third, 100).b == Fraction(1, 3)
+
+    with obol.localcontext(max_denominator=4) as ctx:
+        assert ctx.max_denominator == 4
+        assert obol.Khremata(third).b == Fraction(1, 3)
+        assert obol.Khremata(0.1).b == Fraction(0)
+        assert obol.Khremata("1t").b == 36000
+
+    assert obol.getcontext().max_denominator is None
+    assert obol.Khremata(third).b == third
+
+
+def test_context_floats():
+    assert obol.Khremata(0.1).b == Fraction.from_float(0.1)
+
+    with obol.localcontext(floats=obol.FloatPolicy.SHORTEST):
+        assert obol.Khremata(0.1).b == Fraction(1, 10)
+        assert obol.Khremata(163518.1).b == Fraction(1635181, 10)
+
+    with pytest.raises(AttributeError):
+        with obol.localcontext(precision=2):
+            pass
+
+
+def test_context_threads():
+    import threading
+
+    seen = []
+    with obol.localcontext(max_denominator=4):
+        thread = threading.Thread(
+            target=lambda: seen.append(obol.getcontext().max_denominator))
+        thread.start()
+        thread.join()
+
+    assert seen == [None]
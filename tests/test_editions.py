@@ -0,0 +1,71 @@
+import pytest
+import akrophonobolos as obol
+from akrophonobolos import synthetic
+
+
+OLD = [{"id": "1", "principal": "𐅊", "days": "1397", "interest": "ΤΤ"},
+       {"id": "2", "principal": "Τ", "days": "100", "interest": "ΔΔ"},
+       {"id": "3", "principal": "ΤΤ", "days": "", "interest": "[---]"},
+       {"id": "4", "principal": "Χ", "days": "10", "interest": "Ι"}]
+
+NEW = [{"id": "1", "principal": "𐅊", "days": "1397",
+        "interest": "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"},
+       {"id": "2", "principal": "6000d", "days": "100", "interest": "ΔΔ"},
+       {"id": "3", "principal": "ΤΤ", "days": "", "interest": "ΔΔ"},
+       {"id": "5", "principal": "Τ", "days": "30", "interest": ""}]
+
+
+def test_compare_editions():
+    result = obol.compare_editions(OLD, NEW)
+
+    assert result.unchanged == 1
+    assert [e.key for e in result.added] == ["5"]
+    assert [e.key for e in result.removed] == ["4"]
+    assert [e.key for e in result.changed] == ["1", "3"]
+
+    first = result.changed[0]
+    assert first.change is obol.Change.CHANGED
+    assert first.deltas == {"interest": (83_820 - 72_000) * 4}
+    assert first.interest == obol.Khremata("2t 1970d")
+    assert first.term == 1397
+
+    assert result.changed[1].deltas == {"interest": None}
+    assert result.changed[1].interest is None
+    assert result.totals == {"principal": 0, "interest": 11_820 * 4}
+
+    assert result.added[0].interest == obol.interest("1t", 30)
+    assert result.added[0].term is None
+    assert len(list(result)) == 4
+
+
+def test_compare_days():
+    old = [{"id": 1, "principal": "1t", "days": "10"}]
+    new = [{"id": 1, "principal": "1t", "days": "11"}]
+    result = obol.compare_editions(old, new, fields=("principal",))
+
+    assert result.changed[0].deltas == {}
+    assert result.changed[0].interest == obol.interest("1t", 11)
+
+
+def test_duplicate_keys():
+    with pytest.raises(ValueError):
+        obol.compare_editions(OLD + OLD[:1], NEW)
+
+    with pytest.raises(ValueError):
+        obol.compare_editions(OLD, NEW + NEW[:1])
+
+
+def test_large_tables():
+    gen = synthetic.CorpusGenerator(47)
+    old = [{"id": n, "principal": p, "days": str(d), "interest": i}
+           for n, (p, d, i) in enumerate(
+               (a["principal"], a["days"], a["interest"])
+               for a in gen.accounts(20_000))]
+    new = [dict(row) for row in old]
+    for row in new[::100]:
+        row["interest"] += "Ι"
+
+    result = obol.compare_editions(old, new)
+
+    assert len(result.changed) == 200
+    assert result.totals["interest"] == 200 * 4
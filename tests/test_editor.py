@@ -0,0 +1,59 @@
+import random
+import pytest
+import akrophonobolos as obol
+
+
+def test_editable_numeral():
+    num = obol.EditableNumeral("ΤΗΗ")
+    num.insert(1, "𐅅")
+
+    assert num.text == "Τ𐅅ΗΗ"
+    assert num.khremata == obol.Khremata("Τ𐅅ΗΗ")
+    assert num.as_abbr() == "1t 700d"
+    assert num.as_phrase() == obol.Khremata("1t 700d").as_phrase()
+    assert num.as_greek() == "Τ𐅅ΗΗ"
+    assert num.canonical
+
+    num.append("ΙΙΙΙΙΙ")
+    assert num.valid and not num.canonical
+    assert num.as_greek() == "Τ𐅅ΗΗ𐅂"
+
+    num.delete(4, 6)
+    num.insert(0, "Η")
+    assert num.valid and not num.canonical
+    assert num.unordered == 1
+
+    del num[0]
+    num.replace(3, "[")
+    assert num.text == "Τ𐅅Η["
+    assert not num.valid
+    assert num.b == obol.Khremata("1t 600d").b
+
+    with pytest.raises(IndexError):
+        num.delete(4)
+
+
+def test_random_edits():
+    rng = random.Random(49)
+    alphabet = list(obol.NUMERALS) + ["[", "]"]
+    num = obol.EditableNumeral()
+    text = ""
+
+    for _ in range(500):
+        if text and rng.random() < 0.4:
+            pos = rng.randrange(len(text))
+            n = rng.randint(1, 3)
+            num.delete(pos, n)
+            text = text[:pos] + text[pos + n:]
+        else:
+            pos = rng.randint(0, len(text))
+            s = "".join(rng.choices(alphabet, k=rng.randint(1, 3)))
+            num.insert(pos, s)
+            text = text[:pos] + s + text[pos:]
+
+        assert num.text == text
+        assert num.valid == obol.valid_greek_amount(text)
+        clean = "".join(c for c in text if c in obol.NUMERALS)
+        assert num.b == (obol.parse_greek_amount(clean) if clean else 0)
+        assert num.canonical == (num.valid and obol.Khremata(text).as_greek()
+                                 == text)
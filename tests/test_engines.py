@@ -0,0 +1,93 @@
+from fractions import Fraction
+import pytest
+import akrophonobolos as obol
+from akrophonobolos import synthetic
+
+
+class OffByOne(obol.QuarterEngine):
+    name = "off-by-one"
+
+    def interest(self, p, d, r=obol.interest_rate(), roundup=True,
+                 rounding=None):
+        return super().interest(p, d, r, roundup, rounding) + "¼b"
+
+
+@pytest.fixture
+def engine():
+    yield
+    obol.set_engine("reference")
+
+
+def test_quarter_engine():
+    fast = obol.get_engine("quarters")
+    ref = obol.get_engine("reference")
+    gen = synthetic.CorpusGenerator(46)
+
+    for numeral in gen.numerals(500):
+        assert fast.parse(numeral) == ref.parse(numeral)
+        b = fast.parse(numeral)
+        assert fast.format(b, obol.Fmt.GREEK) == numeral
+        assert fast.format(b) == ref.format(b)
+
+    for amt in gen.amounts(500):
+        assert fast.interest(amt, 1397) == ref.interest(amt, 1397)
+        assert fast.principal(amt, 17) == ref.principal(amt, 17)
+
+    assert fast.parse("1t 813d 1½b") == Fraction(81759, 2)
+    assert fast.interest(Fraction(1, 3), 17) == ref.interest(Fraction(1, 3),
+                                                             17)
+    assert fast.interest("50t", 1397, rounding=obol.Rounding.FLOOR) == \
+        obol.Khremata("2t 1970d")
+
+
+def test_set_engine(engine):
+    assert obol.get_engine().name == "reference"
+    assert obol.set_engine("quarters") is obol.get_engine("quarters")
+    assert obol.get_engine().name == "quarters"
+
+    with pytest.raises(obol.UnknownEngine):
+        obol.set_engine("abacus")
+
+
+def test_verifying_engine(engine):
+    seen = []
+    off = obol.Khremata("2t 1970d ¼b")
+    verifying = obol.set_engine(OffByOne(), verify=1,
+                                on_divergence=seen.append)
+
+    assert verifying.parse("ΤΤ") == 72_000
+    assert verifying.interest("50t", 1397) == off
+    assert verifying.checked == 2
+    assert verifying.divergences == seen
+    assert seen[0].operation == "interest"
+    assert seen[0].args[:2] == ("50t", 1397)
+    assert seen[0].expected == obol.Khremata("2t 1970d")
+
+    with pytest.raises(obol.UnparseableMonetaryString):
+        verifying.parse("zz")
+    assert len(verifying.divergences) == 1
+
+
+def test_verifying_sample():
+    verifying = obol.VerifyingEngine(OffByOne(), sample=0.1, seed=1,
+                                     max_divergences=5)
+    for days in range(1, 1001):
+        verifying.interest("5t", days)
+
+    assert 50 < verifying.checked < 150
+    assert len(verifying.divergences) == 5
+
+
+def test_engine_routing(engine):
+    obol.set_engine(OffByOne())
+    assert obol.interest("50t", 1397) == obol.Khremata("2t 1970d ¼b")
+
+    verifying = obol.set_engine("quarters", verify=1)
+    assert obol.Khremata("ΤΤ") == 72_000
+    assert obol.format_amount(72_000, obol.Fmt.GREEK) == "ΤΤ"
+    assert obol.interest("50t", 1397) == obol.Khremata("2t 1970d")
+    assert verifying.checked == 4
+    assert verifying.divergences == []
+
+    obol.set_engine("reference")
+    assert obol.interest("50t", 1397) == obol.Khremata("2t 1970d")
@@ -0,0 +1,79 @@
+from fractions import Fraction
+import io
+import akrophonobolos as obol
+from akrophonobolos import epidoc
+
+
+EDITION = """<?xml version="1.0" encoding="UTF-8"?>
+<TEI xmlns="http://www.tei-c.org/ns/1.0">
+<text><body><div type="edition"><ab>
+<lb n="1"/>ἐπὶ τῆς Αἰαντίδος <num value="6000">Τ</num> τόκος
+<lb n="2"/><num value="20">ΔΔ<supplied reason="lost">Δ</supplied></num> καὶ
+<lb n="3"/><num>𐅅ΗΗΗ</num> <num value="3">[---]</num>
+</ab></div></body></text>
+</TEI>
+""".encode("utf-8")
+
+
+def test_read_epidoc():
+    nums = list(epidoc.read_epidoc(io.BytesIO(EDITION), unit=6))
+
+    assert [n.text for n in nums] == ["Τ", "ΔΔΔ", "𐅅ΗΗΗ", "[---]"]
+    assert [n.status for n in nums] == [epidoc.NumStatus.MATCH,
+                                        epidoc.NumStatus.MISMATCH,
+                                        epidoc.NumStatus.NO_VALUE,
+                                        epidoc.NumStatus.UNPARSEABLE]
+    assert [n.line for n in nums] == ["1", "2", "3", "3"]
+    assert nums[1].amount == obol.Khremata("30d")
+    assert nums[1].value == 20
+    assert nums[0].before == "ἐπὶ τῆς Αἰαντίδος"
+    assert nums[0].after.startswith("τόκος ΔΔΔ καὶ")
+    assert nums[3].after == ""
+
+
+def test_read_epidoc_small_reads(monkeypatch):
+    monkeypatch.setattr(obol.epidoc, "READ_BYTES", 7)
+    nums = list(epidoc.read_epidoc(io.BytesIO(EDITION), unit=6, context=5))
+
+    assert [n.text for n in nums] == ["Τ", "ΔΔΔ", "𐅅ΗΗΗ", "[---]"]
+    assert nums[0].before == "ίδος"
+
+
+def test_write_epidoc():
+    out = io.BytesIO()
+    assert epidoc.write_epidoc(io.BytesIO(EDITION), out, unit=6) == 1
+
+    nums = list(epidoc.read_epidoc(io.BytesIO(out.getvalue()), unit=6))
+    assert nums[2].value == 800
+    assert nums[1].status is epidoc.NumStatus.MISMATCH
+    assert b'<lb n="3"/><num value="800">' in out.getvalue()
+
+    out = io.BytesIO()
+    assert epidoc.write_epidoc(io.BytesIO(EDITION), out, replace=True) == 3
+    assert {n.status for n in epidoc.read_epidoc(io.BytesIO(out.getvalue()))} \
+        == {epidoc.NumStatus.MATCH, epidoc.NumStatus.UNPARSEABLE}
+
+
+def test_write_epidoc_comments():
+    edition = EDITION.replace(b"<TEI", b"""<!DOCTYPE TEI SYSTEM "tei.dtd" [
+<!ENTITY ai "ai">
+<!-- in the subset -->
+]>
+<!-- before -->
+<TEI""", 1).replace(b"<num>", b"<num><!-- unread -->", 1)
+
+    out = io.BytesIO()
+    assert epidoc.write_epidoc(io.BytesIO(edition), out) == 1
+
+    lines = out.getvalue().decode("utf-8").splitlines()
+    assert lines[1] == '<!DOCTYPE TEI SYSTEM "tei.dtd">'
+    assert lines[2] == "<!-- before -->"
+    assert '<num value="4800"><!-- unread -->𐅅ΗΗΗ</num>' in lines[7]
+    assert "in the subset" not in out.getvalue().decode("utf-8")
+
+
+def test_format_value():
+    assert epidoc.format_value(12) == "12"
+    assert epidoc.format_value(obol.Khremata("1½b").b) == "1.5"
+    assert epidoc.format_value(Fraction(-1, 8)) == "-0.125"
+    assert epidoc.format_value(Fraction(1, 3)) == "1/3"
@@ -1,4 +1,6 @@
 import akrophonobolos as obol
+import subprocess
+import sys
 from fractions import Fraction
 
 
@@ -236,3 +238,95 @@ def test_roundup_to_quarter():
                       float)
     assert isinstance(obol.roundup_to_quarter_obol(26),
                       float)
+
+
+def test_round_amount():
+    assert obol.round_amount(Fraction(105, 4)) == Fraction(105, 4)
+    assert obol.round_amount(26.1) == Fraction(105, 4)
+    assert obol.round_amount(26.1, obol.Rounding.FLOOR) == 26
+    assert obol.round_amount(26.1, obol.Rounding.NEAREST) == 26
+    assert obol.round_amount(Fraction(211, 8), obol.Rounding.NEAREST) == \
+        Fraction(53, 2)
+    assert obol.round_amount(Fraction(213, 8), obol.Rounding.NEAREST) == \
+        Fraction(107, 4)
+    assert obol.round_amount(Fraction(211, 8), obol.Rounding.HALF_EVEN) == \
+        Fraction(53, 2)
+    assert obol.round_amount(Fraction(213, 8), obol.Rounding.HALF_EVEN) == \
+        Fraction(53, 2)
+    assert obol.round_amount(26.9, obol.Rounding.OBOL) == 26
+    assert obol.round_amount(26.9, obol.Rounding.DRACHMA) == 24
+    assert obol.round_amount(-26.9, obol.Rounding.DRACHMA) == -24
+
+    # It should be exact for large amounts
+    big = Fraction(10**30 * 4 + 1, 4) + Fraction(1, 10**9)
+    assert obol.round_amount(big) == Fraction(10**30 * 4 + 2, 4)
+
+    # Return type follows the input
+    assert isinstance(obol.round_amount(26.1), Fraction)
+    assert isinstance(obol.round_amount(obol.Khremata(26.1)), obol.Khremata)
+
+
+def test_round_amounts():
+    amts = [26.1, Fraction(211, 8), 7, obol.Khremata("1d 0.3b")]
+
+    for rounding in obol.Rounding:
+        assert obol.round_amounts(amts, rounding) == \
+            [obol.round_amount(a, rounding) for a in amts]
+
+
+def test_interest_rounding():
+    assert obol.interest("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι", 17) == 11.75
+    assert obol.interest("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι", 17,
+                         rounding=obol.Rounding.FLOOR) == 11.5
+    assert obol.principal("𐅂ΙΙΙΙΙ𐅁", 17,
+                          rounding=obol.Rounding.DRACHMA) == 20292
+
+
+def test_interest_context():
+    with obol.localcontext(rounding=obol.Rounding.FLOOR):
+        assert obol.interest(46_488, 17) == 26.25
+        assert obol.interest(46_488, 17, rounding=obol.Rounding.CEIL) == \
+            26.5
+
+    assert obol.interest(46_488, 17) == 26.5
+
+
+def test_interest_bounded_context():
+    for limit in (4, 100, 1000):
+        with obol.localcontext(max_denominator=limit):
+            assert obol.interest_rate() == Fraction(1, 30_000)
+            assert obol.interest_rate("1t", 2, "12d") == Fraction(1, 1000)
+
+    with obol.localcontext(max_denominator=100):
+        assert obol.interest(obol.Khremata("ΧΧ"), 20,
+                             obol.interest_rate()) == obol.Khremata("1d 2b")
+        assert obol.interest(46_488, 17, obol.interest_rate()) == 26.5
+
+
+def test_greek_quarters():
+    for q in (1, 3, 7, 163_518, 4 * 36_000 * 5000):
+        assert obol.greek_quarters(q) == \
+            obol.format_amount(Fraction(q, 4), obol.Fmt.GREEK)
+
+
+def test_namespace():
+    # Submodules with heavy imports are not loaded with the package
+    code = ("import sys, akrophonobolos as obol; "
+            "print(sorted(m for m in ('xml.sax', 'concurrent.futures', "
+            "'akrophonobolos.epidoc', 'akrophonobolos.parallel') "
+            "if m in sys.modules), [n for n in ('os', 'json', 're', "
+            "'threading', 'operator', 'contextmanager', 'Enum') "
+            "if hasattr(obol, n)])")
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True,
+                         text=True, check=True).stdout
+
+    assert out.split() == ["[]", "[]"]
+
+
+def test_format_greek_exact():
+    amt = Fraction(163_518, 4)
+    assert obol.format_amount(amt, obol.Fmt.GREEK) == "Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁"
+    assert obol.format_amount(amt + Fraction(1, 10**30), obol.Fmt.GREEK) \
+        == "Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁𐅀"
+    assert obol.format_amount(obol.Khremata(amt), obol.Fmt.GREEK) == \
+        obol.greek_quarters(163_518)
@@ -46,3 +46,10 @@ def test_id_I_3_369_88_rounded_interest():
 def test_id_I_3_369_88_rounded_principal():
     # 3382d 2¼b vs 3418d 1b
     assert obol.principal("𐅂ΙΙΙΙΙ𐅁", 17) == obol.Khremata("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι")
+
+
+def test_id_I_3_369_88_nearest_interest():
+    # Rounding to the nearest quarter obol matches 1d 5½b
+    assert obol.interest("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι", 17,
+                         rounding=obol.Rounding.NEAREST) == \
+        obol.Khremata("𐅂ΙΙΙΙΙ𐅁")
@@ -0,0 +1,88 @@
+from fractions import Fraction
+import pytest
+import akrophonobolos as obol
+
+
+def test_interval():
+    amt = obol.KhremataInterval("ΤΤ", "ΤΤΤ𐅆")
+
+    assert amt.low == obol.Khremata("2t")
+    assert amt.high == obol.Khremata("3t 5000d")
+    assert amt.width == obol.Khremata("1t 5000d")
+    assert "3t" in amt
+    assert "4t" not in amt
+    assert str(amt) == "2t to 3t 5000d"
+    assert obol.KhremataInterval("1d") == "1d"
+    assert obol.KhremataInterval.from_candidates(["1d", "3b", "2d"]) == \
+        obol.KhremataInterval("3b", "2d")
+
+    with pytest.raises(ValueError):
+        obol.KhremataInterval("1t", "1d")
+
+
+def test_interval_quarters():
+    amt = obol.KhremataInterval("ΤΤ", "ΤΤΤ𐅆")
+    assert (amt.q_lo, amt.q_hi) == (288_000, 552_000)
+    assert type(amt.q_lo) is int
+
+    third = obol.KhremataInterval(Fraction(1, 3), "1b")
+    assert third.q_lo == Fraction(4, 3)
+    assert third.lo == Fraction(1, 3)
+
+    total = third + Fraction(2, 3)
+    assert (total.q_lo, total.q_hi) == (4, Fraction(20, 3))
+    assert type(total.q_lo) is int
+
+
+def test_interval_arithmetic():
+    a = obol.KhremataInterval("1d", "2d")
+    b = obol.KhremataInterval("3b", "4b")
+
+    assert a + b == obol.KhremataInterval("1d 3b", "2d 4b")
+    assert a - b == obol.KhremataInterval("2b", "1d 3b")
+    assert a + "1d" == obol.KhremataInterval("2d", "3d")
+    assert "3d" - a == obol.KhremataInterval("1d", "2d")
+    assert -a == obol.KhremataInterval(-12, -6)
+    assert a * Fraction(1, 3) == obol.KhremataInterval("2b", "4b")
+    assert a * -2 == obol.KhremataInterval(-24, -12)
+    assert a / 4 == obol.KhremataInterval("1½b", "3b")
+
+    with pytest.raises(obol.UndefinedMonetaryOperation):
+        a * b
+
+
+def test_interest_bounds():
+    p = obol.KhremataInterval("49t", "51t")
+    bounds = obol.interest_bounds(p, (1390, 1400))
+
+    assert bounds.low == obol.interest("49t", 1390)
+    assert bounds.high == obol.interest("51t", 1400)
+    assert obol.interest_bounds("50t", 1397) == "2t 1970d"
+
+    exact = obol.interest_bounds(p, 17, roundup=False)
+    assert exact.lo == Fraction(49 * 36_000 * 17, 30_000)
+
+
+def test_principal_bounds():
+    bounds = obol.principal_bounds("ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", (1390, 1400))
+
+    assert bounds.low == obol.principal("ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", 1400)
+    assert bounds.high == obol.principal("ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", 1390)
+    assert "50t" in bounds
+
+
+def test_loan_term_bounds():
+    p = obol.KhremataInterval("49t", "51t")
+    i = obol.KhremataInterval("2t 1900d", "2t 2000d")
+    lo, hi = obol.loan_term_bounds(p, i)
+
+    # Every combination of candidate values falls within the bounds
+    terms = [obol.loan_term(f"{t}t", f"2t {d}d")
+             for t in (49, 50, 51) for d in range(1900, 2001, 25)]
+    assert lo == min(terms)
+    assert hi == max(terms)
+
+    assert obol.loan_term_bounds("50t", "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ") == (1397, 1397)
+
+    with pytest.raises(ValueError):
+        obol.loan_term_bounds(obol.KhremataInterval(0, "1t"), i)
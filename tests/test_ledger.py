@@ -0,0 +1,75 @@
+import random
+from fractions import Fraction
+import pytest
+import akrophonobolos as obol
+
+
+def test_running_totals():
+    ledger = obol.RunningTotals(["ΤΤ", "ΧΧ", "Η", "Τ"])
+
+    assert len(ledger) == 4
+    assert ledger[1] == obol.Khremata("ΧΧ")
+    assert ledger.total() == obol.Khremata("3t 2100d")
+    assert ledger.total(1, 3) == obol.Khremata("2100d")
+    assert ledger.running(1) == obol.Khremata("2t 2000d")
+    assert ledger.find_exceeding("2t 2000d") == 2
+    assert ledger.find_exceeding("1b") == 0
+    assert ledger.find_exceeding("3t 2100d") is None
+
+    ledger[2] = "ΧΧΧ"
+    ledger.add(0, "Η")
+    ledger.append("¼b")
+    assert ledger.total() == obol.Khremata("3t 5100d ¼b")
+    assert ledger.find_exceeding("3t 5100d") == 4
+    assert list(ledger)[-1] == obol.Khremata("¼b")
+
+    with pytest.raises(IndexError):
+        ledger[5] = 1
+
+
+def test_negative_entries():
+    ledger = obol.RunningTotals(["Τ", "Χ"])
+    ledger.add(1, -24000)
+    with pytest.raises(ValueError):
+        ledger.find_exceeding("1d")
+
+    ledger[1] = "Η"
+    assert ledger.find_exceeding("1t") == 1
+
+
+def test_fine_fractions():
+    ledger = obol.RunningTotals([Fraction(1, 8), Fraction(1, 8), 1])
+    assert ledger.total(0, 2) == obol.Khremata("¼b")
+    assert ledger.find_exceeding(Fraction(1, 8)) == 1
+
+
+def test_random_edits():
+    rng = random.Random(50)
+    values = [rng.randrange(0, 400) for _ in range(300)]
+    ledger = obol.RunningTotals(values)
+
+    for _ in range(500):
+        i = rng.randrange(len(values))
+        op = rng.randrange(3)
+        if op == 0:
+            values[i] = rng.randrange(0, 400)
+            ledger[i] = values[i]
+        elif op == 1:
+            values[i] += 7
+            ledger.add(i, 7)
+        else:
+            values.append(rng.randrange(0, 400))
+            ledger.append(values[-1])
+
+        j, k = sorted(rng.randrange(len(values) + 1) for _ in range(2))
+        assert ledger.total(j, k).b == sum(values[j:k])
+
+        target = rng.randrange(sum(values) + 10)
+        running = 0
+        expected = None
+        for n, v in enumerate(values):
+            running += v
+            if running > target:
+                expected = n
+                break
+        assert ledger.find_exceeding(target) == expected
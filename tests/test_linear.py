@@ -0,0 +1,82 @@
+from fractions import Fraction
+import random
+import pytest
+import akrophonobolos as obol
+
+
+def test_unique():
+    system = obol.LinearSystem()
+    system.add({"a": 1, "b": 1}, "1t")
+    system.add({"a": 1, "b": -1}, "2000d")
+    solution = system.solve()
+
+    assert solution.unique
+    assert solution.khremata("a") == obol.Khremata("4000d")
+    assert solution["b"] == 12_000
+
+
+def test_underdetermined():
+    system = obol.LinearSystem()
+    system.add({"a": 1, "b": 1, "c": 1}, "1t")
+    system.add({"a": 1, "b": -1})
+    solution = system.solve()
+
+    assert not solution.unique
+    assert solution.free == ["c"]
+    assert solution.values == {}
+    assert solution.general["a"] == (18_000, {"c": Fraction(-1, 2)})
+    assert solution.evaluate({"c": 6}) == {"a": 17_997, "b": 17_997, "c": 6}
+
+
+def test_inconsistent():
+    system = obol.LinearSystem()
+    system.add({"a": 1, "b": 1}, "1t")
+    system.add({"a": 2, "b": 2}, "1t")
+
+    with pytest.raises(obol.InconsistentSystem):
+        system.solve()
+
+
+def test_redundant():
+    system = obol.LinearSystem()
+    system.add({"a": 1, "b": 1}, "1t")
+    system.add({"a": 2, "b": 2}, "2t")
+    system.add({"b": 1}, "1d")
+
+    assert system.solve().values == {"a": 35_994, "b": 6}
+
+
+def test_loans():
+    # Two loans of the same unknown term, one with an unknown principal,
+    # and their interest adds up to a known total
+    system = obol.LinearSystem()
+    system.add_loan("50t", obol.Var("d"), obol.Var("i1"))
+    system.add_loan(obol.Var("p"), 1397, obol.Var("i2"))
+    system.add({"i1": 1, "i2": 1}, "4t 3940d")
+    system.add({"i1": 1, "i2": -1})
+    solution = system.solve()
+
+    assert solution["d"] == 1397
+    assert solution.khremata("p") == obol.Khremata("50t")
+    assert solution.khremata("i1") == obol.Khremata("2t 1970d")
+
+    with pytest.raises(ValueError):
+        system.add_loan(obol.Var("p"), obol.Var("d"), "1t")
+
+
+def test_large_exact():
+    rng = random.Random(41)
+    n = 60
+    values = {f"x{k}": Fraction(rng.randrange(1, 10**6), 4)
+              for k in range(n)}
+    system = obol.LinearSystem()
+    for _ in range(n):
+        coeffs = {name: rng.randrange(-5, 6)
+                  for name in rng.sample(sorted(values), 6)}
+        system.add(coeffs, sum(c * values[v] for v, c in coeffs.items()))
+    for k in range(0, n, 3):
+        system.add({f"x{k}": 1}, values[f"x{k}"])
+
+    solution = system.solve()
+    assert solution.unique
+    assert solution.values == {v: values[v] for v in system.variables}
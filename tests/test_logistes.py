@@ -0,0 +1,88 @@
+import io
+import json
+from akrophonobolos import logistes
+
+
+DEFAULTS = {"int_p": "5t", "int_d": 1, "int_i": "1d"}
+
+
+def run(text, fmt):
+    out = io.StringIO()
+    logistes.run_batch(io.StringIO(text), out, fmt, DEFAULTS)
+    return out.getvalue()
+
+
+def test_batch_jsonl():
+    rows = [{"principal": "50t", "days": 1397},
+            {"principal": "𐅊", "interest": "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"},
+            {"days": "1397", "interest": "2t 1970d"},
+            {"principal": "50t", "days": 1397, "int_i": "2d"},
+            {"principal": "50t"}]
+
+    results = [json.loads(line) for line in
+               run("\n".join(json.dumps(r) for r in rows), "jsonl")
+               .splitlines()]
+
+    assert [r["principal"] for r in results[:3]] == ["50t"] * 3
+    assert [r["days"] for r in results[:3]] == [1397] * 3
+    assert [r["interest_greek"] for r in results[:3]] == ["ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"] * 3
+    assert results[3]["interest"] == "4t 3940d"
+    assert results[4]["error"]
+
+
+def test_batch_csv():
+    out = run("principal,days,interest\n50t,1397,\nzz,1,\n", "csv")
+    lines = out.splitlines()
+
+    assert lines[0] == ",".join(logistes.RESULT_FIELDS)
+    assert lines[1] == "50t,𐅊,10d,1397,2t 1970d,ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ,"
+    assert lines[2] == ",,,,,,Cannot parse zz as monetary amount"
+
+
+def test_batch_bad_lines():
+    text = "\n".join(['{"principal": "50t", "days": 1397}', '{"principal',
+                      '[1, 2]', '{"principal": {}, "days": 1}',
+                      '{"days": "1397", "interest": "2t 1970d"}'])
+    results = [json.loads(line) for line in run(text, "jsonl").splitlines()]
+
+    assert len(results) == 5
+    assert results[0]["interest"] == results[4]["interest"] == "2t 1970d"
+    assert results[1]["error"].startswith("Invalid JSON")
+    assert results[2]["error"] == "Row must be a JSON object"
+    assert results[3]["error"]
+
+
+def test_batch_zero_values():
+    rows = [{"principal": 0, "days": 1397},
+            {"principal": "50t", "days": 1397, "interest": 0},
+            {"principal": "50t", "days": 0, "interest": "1d"}]
+    results = [json.loads(line) for line in
+               run("\n".join(json.dumps(r) for r in rows), "jsonl")
+               .splitlines()]
+
+    assert results[0]["days"] == 1397
+    assert results[0]["interest_greek"] == ""
+    assert results[0]["error"] is None
+    assert results[1]["error"] == results[2]["error"] == \
+        "Row must have exactly two of principal, days, and interest"
+
+
+def test_batch_reuses_rates():
+    rates = {}
+    row = {"principal": "50t", "days": "1397"}
+    logistes.solve_row(row, rates, DEFAULTS)
+    logistes.solve_row(row, rates, DEFAULTS)
+
+    assert len(rates) == 1
+
+
+def test_batch_checkpointed(tmp_path):
+    text = "principal,days,interest\n" + "50t,1397,\nzz,1,\n" * 5
+    source = tmp_path / "loans.csv"
+    source.write_text(text)
+    output = tmp_path / "results.csv"
+
+    logistes.run_checkpointed(str(source), str(output),
+                              str(tmp_path / "job.json"), "csv", DEFAULTS)
+
+    assert output.read_text() == run(text, "csv")
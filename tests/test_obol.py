@@ -0,0 +1,19 @@
+import io
+from akrophonobolos import obol
+
+
+def test_convert_lines():
+    out = obol.convert_lines(["1t 813d\n", "\n", "𐅎𐅎 + 1d\n", "5t -\n"])
+
+    assert out.splitlines() == ["1t = Τ",
+                                "813d = 𐅅ΗΗΗΔ𐅂𐅂𐅂",
+                                "𐅎𐅎𐅂 = 10000t 1d",
+                                "5t - = error: UnexpectedEndOfEquation"]
+
+
+def test_convert_file():
+    lines = ["1t 813d\n", "𐅎𐅎 + 1d\n", "\n", "5t -\n"] * 5
+    out = io.StringIO()
+    obol.convert_file(iter(lines), out, chunk_lines=3)
+
+    assert out.getvalue() == obol.convert_lines(lines)
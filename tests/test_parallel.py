@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+import akrophonobolos as obol
+from akrophonobolos import parallel
+
+
+def test_map_parse():
+    result = parallel.map_parse(["1t", "ΔΔ", "zz", 5])
+
+    assert result.values == [obol.Khremata("1t"), obol.Khremata("20d"), None,
+                             obol.Khremata(5)]
+    assert [i for i, _ in result.errors] == [2]
+    assert isinstance(result.errors[0][1], obol.UnparseableMonetaryString)
+
+
+def test_map_format_processes():
+    amts = ["1t 813d 1½b", "zz", 5] * 10
+    result = parallel.map_format(amts, obol.Fmt.GREEK, chunk_size=4,
+                                 workers=2)
+
+    assert result.values[:3] == ["Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁", None, "ΙΙΙΙΙ"]
+    assert len(result.values) == 30
+    assert [i for i, _ in result.errors] == list(range(1, 30, 3))
+
+
+def test_map_interest_executor():
+    loans = [("50t", 1397), ("1t", "x"), ("46488b", 17)] * 5
+
+    with ThreadPoolExecutor(2) as executor:
+        result = parallel.map_interest(loans, chunk_size=2, executor=executor)
+
+    assert result.values[:3] == [obol.Khremata("2t 1970d"), None, 26.5]
+    assert len(result.errors) == 5
+
+
+def test_map_context():
+    with obol.localcontext(rounding=obol.Rounding.FLOOR), \
+            ThreadPoolExecutor(2) as executor:
+        result = parallel.map_interest([("46488b", 17)] * 4, chunk_size=2,
+                                   executor=executor)
+
+    assert result.values == [26.25] * 4
+
+
+def test_map_context_restored():
+    with ThreadPoolExecutor(1) as executor:
+        with obol.localcontext(max_denominator=4,
+                               rounding=obol.Rounding.FLOOR) as context:
+            parallel.map_parse(["1t"] * 4, chunk_size=1, executor=executor)
+            context.rounding = obol.Rounding.HALF_EVEN
+
+        pool_context = executor.submit(obol.getcontext).result()
+
+    assert pool_context.max_denominator is None
+    assert pool_context.rounding is obol.Rounding.CEIL
@@ -0,0 +1,63 @@
+import akrophonobolos as obol
+from fractions import Fraction
+import pytest
+
+
+def test_purse_accumulates():
+    purse = obol.Purse()
+    purse += obol.Khremata("1t")
+    purse += "813d 1½b"
+    purse += "ΔΔ"
+    purse += 3
+    purse += Fraction(1, 4)
+    purse -= "1d"
+
+    assert purse.tally == (0, 812, Fraction(144_499, 4))
+    assert purse.freeze() == obol.Khremata("1t 832d 4.75b")
+    assert isinstance(purse.freeze(), obol.Khremata)
+
+
+def test_purse_in_place():
+    purse = obol.Purse("1t")
+    before = id(purse)
+    purse += "1t"
+
+    assert id(purse) == before
+    assert purse.b == 72_000
+
+
+def test_purse_fractions():
+    purse = obol.Purse(0.1)
+    purse += Fraction(1, 3)
+    purse += obol.Purse("1d")
+
+    assert purse.b == Fraction.from_float(0.1) + Fraction(1, 3) + 6
+
+
+def test_purse_float_policy():
+    with obol.localcontext(floats=obol.FloatPolicy.SHORTEST):
+        purse = obol.Purse(0.1)
+        purse += 0.2
+
+    assert purse.b == Fraction(3, 10)
+    assert obol.Purse(0.1).b == Fraction.from_float(0.1)
+
+
+def test_purse_matches_sum():
+    amounts = ["Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁", "1t 813d 1.5b", "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", 40879.5]
+    purse = obol.Purse()
+    total = obol.Khremata(0)
+
+    for amt in amounts:
+        purse += amt
+        total += amt
+
+    assert purse.freeze() == total
+    assert str(purse) == str(total)
+
+
+def test_purse_unparseable():
+    purse = obol.Purse()
+
+    with pytest.raises(obol.UnparseableMonetaryString):
+        purse += "1Z"
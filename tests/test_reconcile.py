@@ -0,0 +1,101 @@
+import akrophonobolos as obol
+from akrophonobolos import reconciliation
+from itertools import combinations
+import random
+import pytest
+
+
+ENTRIES = ["𐅊", "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", "𐅋", "ΤΤΤ𐅆𐅅ΗΗΗΗΔΔΔΔ", "ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι",
+           "𐅂ΙΙΙΙΙ𐅁", "1t 813d 1½b"]
+
+
+def brute_force(entries, lo, hi):
+    values = [obol.Khremata(e).b for e in entries]
+    return sorted(c for n in range(len(values) + 1)
+                  for c in combinations(range(len(values)), n)
+                  if lo <= sum(values[i] for i in c) <= hi)
+
+
+def test_reconcile():
+    target = obol.Khremata("𐅊") + "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ" + "𐅂ΙΙΙΙΙ𐅁"
+
+    assert obol.reconcile(ENTRIES, target) == [(0, 1, 5)]
+    assert obol.reconcile(ENTRIES, target) == \
+        brute_force(ENTRIES, target.b, target.b)
+
+
+def test_reconcile_tolerance():
+    target = obol.Khremata("𐅊") + "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"
+    found = obol.reconcile(ENTRIES, target, tolerance="2d")
+
+    assert found == brute_force(ENTRIES, target.b - 12, target.b + 12)
+    assert (0, 1) in found and (0, 1, 5) in found
+
+
+def test_reconcile_max_results():
+    assert len(obol.reconcile([1] * 10, 5, max_results=7)) == 7
+
+
+def test_reconcile_many_entries():
+    rng = random.Random(369)
+    entries = [rng.randrange(1, 4000) / 4 for _ in range(80)]
+    chosen = rng.sample(range(80), 30)
+    target = sum(entries[i] for i in chosen)
+
+    found = obol.reconcile(entries, target, max_results=5)
+    assert len(found) == 5
+    for subset in found:
+        assert sum(entries[i] for i in subset) == target
+
+
+def test_reconcile_meet_in_the_middle(monkeypatch):
+    monkeypatch.setattr(reconciliation, "DP_LIMIT", 0)
+    target = obol.Khremata("𐅊") + "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"
+
+    assert obol.reconcile(ENTRIES, target, tolerance="2d") == \
+        brute_force(ENTRIES, target.b - 12, target.b + 12)
+
+
+def test_reconcile_parallel():
+    target = obol.Khremata("𐅊") + "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ"
+
+    assert obol.reconcile(ENTRIES, target, tolerance="2d", workers=2) == \
+        obol.reconcile(ENTRIES, target, tolerance="2d")
+
+
+def test_reconcile_invalid():
+    with pytest.raises(ValueError):
+        obol.reconcile([-1, 2], 1)
+
+    with pytest.raises(ValueError):
+        obol.reconcile([0.1, 2], 1)
+
+
+def test_reconcile_subset_limit(monkeypatch):
+    monkeypatch.setattr(reconciliation, "DP_LIMIT", 0)
+    monkeypatch.setattr(reconciliation, "SUBSET_LIMIT", 1000)
+    entries = [2**i for i in range(60)]
+
+    found = obol.reconcile(entries, 2**5 + 2**8)
+    assert found == [(5, 8)]
+    assert found.complete is True
+
+    # The right half reaches the limit before index 40
+    found = obol.reconcile(entries, 2**5 + 2**40)
+    assert found == []
+    assert found.complete is False
+
+def test_reconcile_sixty_entries():
+    rng = random.Random(60)
+    entries = [rng.randrange(10**12, 2 * 10**12) for _ in range(60)]
+    target = entries[3] + entries[29] + entries[30] + entries[57]
+
+    found = obol.reconcile(entries, target)
+    assert found == [(3, 29, 30, 57)]
+    assert found.complete
+
+
+def test_reconcile_time_budget():
+    found = obol.reconcile([2**i for i in range(60)], 2**59 + 1,
+                           time_budget=0)
+    assert not found.complete
@@ -0,0 +1,32 @@
+import akrophonobolos as obol
+
+
+LINE = "𐅊· τόκος τούτον ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ, 1t 813d 1½b. ΤΟΚΟΣ 5d"
+
+
+def test_scan_amounts():
+    found = list(obol.scan_amounts(LINE))
+
+    assert [LINE[s:e] for (s, e), _ in found] == \
+        ["𐅊", "ΤΤΧ𐅅ΗΗΗΗ𐅄ΔΔ", "1t 813d 1½b", "5d"]
+    assert [amt for _, amt in found] == \
+        [obol.Khremata("50t"), obol.Khremata("2t 1970d"),
+         obol.Khremata("1t 813d 1½b"), obol.Khremata("5d")]
+
+
+def test_scan_amounts_ignores_words_and_numbers():
+    # Capitals in a word are not numerals, bare numbers are not amounts
+    assert list(obol.scan_amounts("ΤΟΚΟΣ ΤΟΥΤΟΝ 1397")) == []
+
+
+def test_scan_amounts_offset():
+    assert [span for span, _ in obol.scan_amounts("x 5d", 10)] == [(12, 14)]
+
+
+def test_scan_stream():
+    expected = list(obol.scan_amounts(LINE))
+
+    # Amounts split across chunk boundaries should be found
+    for size in range(1, len(LINE) + 1):
+        chunks = [LINE[i:i + size] for i in range(0, len(LINE), size)]
+        assert list(obol.scan_stream(chunks)) == expected
@@ -0,0 +1,74 @@
+import akrophonobolos as obol
+from fractions import Fraction
+import pytest
+
+
+def test_single_loan_matches_interest():
+    sched = obol.AccrualSchedule([(0, obol.Event.DISBURSEMENT, "𐅊")])
+
+    assert sched.interest_at(1397) == obol.interest("𐅊", 1397)
+    assert sched.principal_at(1397) == obol.Khremata("𐅊")
+
+    sched = obol.AccrualSchedule(
+        [(0, obol.Event.DISBURSEMENT, "ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι")], roundup=False)
+    assert sched.interest_at(17).b == \
+        obol.Khremata("ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι").b * obol.interest_rate() * 17
+
+
+def test_before_first_event():
+    sched = obol.AccrualSchedule([(10, obol.Event.DISBURSEMENT, "5t")])
+
+    assert sched.balance(0) == (obol.Khremata(0), obol.Khremata(0))
+    assert sched.balance(10) == (obol.Khremata("5t"), obol.Khremata(0))
+
+
+def test_events():
+    sched = obol.AccrualSchedule([
+        (0, obol.Event.DISBURSEMENT, "5t"),
+        # Out of order
+        (20, obol.Event.RATE, obol.interest_rate("5t", 1, "2d")),
+        (10, obol.Event.DISBURSEMENT, "5t"),
+        (10, obol.Event.REPAYMENT, "2t 3000d"),
+    ])
+
+    assert sched.days == [0, 10, 20]
+
+    # 10 days of 5t at 1d per day
+    assert sched.balance(10) == (obol.Khremata("7t 3000d"),
+                                 obol.Khremata("10d"))
+    # 10 more days of 7½t at 1½d per day
+    assert sched.balance(20) == (obol.Khremata("7t 3000d"),
+                                 obol.Khremata("25d"))
+    # At the new rate, 3d per day
+    assert sched.interest_at(30) == obol.Khremata("55d")
+
+
+def test_rounding_once():
+    loan = [(0, obol.Event.DISBURSEMENT, 10)]
+    no_op = loan + [(1, obol.Event.DISBURSEMENT, 0),
+                    (1, obol.Event.REPAYMENT, 0),
+                    (2, obol.Event.RATE, obol.interest_rate())]
+
+    for events in (loan, no_op):
+        assert obol.AccrualSchedule(events).interest_at(3) == 0.25
+        assert obol.AccrualSchedule(events, roundup=False).interest_at(3) \
+            == Fraction(1, 1000)
+
+    # Each period would round up to ¼ obolós on its own
+    sched = obol.AccrualSchedule(loan + [(1, obol.Event.DISBURSEMENT, 10),
+                                         (2, obol.Event.REPAYMENT, 10)])
+    assert sched.interest_at(3) == 0.25
+
+
+def test_repayment_exceeds_principal():
+    with pytest.raises(ValueError):
+        obol.AccrualSchedule([(0, obol.Event.DISBURSEMENT, "1t"),
+                              (5, obol.Event.REPAYMENT, "2t")])
+
+
+def test_rounding_policy():
+    events = [(0, obol.Event.DISBURSEMENT, "ΧΧΧΗΗΗΗΔ𐅃𐅂𐅂𐅂Ι")]
+
+    assert obol.AccrualSchedule(events).interest_at(17) == 11.75
+    assert obol.AccrualSchedule(
+        events, rounding=obol.Rounding.NEAREST).interest_at(17) == 11.5
@@ -0,0 +1,78 @@
+import akrophonobolos as obol
+from fractions import Fraction
+import pytest
+
+
+def test_get_standard():
+    assert obol.get_standard("attic").name == "attic"
+    assert obol.get_standard(obol.AEGINETAN) is obol.AEGINETAN
+
+    with pytest.raises(obol.UnknownMonetaryStandard):
+        obol.get_standard("lydian")
+
+
+def test_attic_matches_format_amount():
+    attic = obol.get_standard("attic")
+
+    for amt in (36_007, 40_879.5, 72_013.25, 83_820):
+        assert attic.format(amt) == obol.format_amount(amt)
+        assert attic.format(amt, obol.Fmt.GREEK) == \
+            obol.format_amount(amt, obol.Fmt.GREEK)
+        assert attic.format(amt, obol.Fmt.ENGLISH | obol.Fmt.DECIMAL) == \
+            obol.format_amount(amt, obol.Fmt.ENGLISH | obol.Fmt.DECIMAL)
+
+    assert attic.parse("Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁") == Fraction(81759, 2)
+    assert attic.parse("1t 813d 1½b") == Fraction(81759, 2)
+
+
+def test_attic_minae():
+    minae = obol.get_standard("attic-minae")
+
+    assert minae.format(Fraction(81759, 2)) == "1t 8m 13d 1½b"
+    assert minae.format(Fraction(81759, 2), obol.Fmt.ENGLISH) == \
+        "1 talent, 8 minae, 13 drachmas, 1½ obols"
+    assert minae.parse("1t 8m 13d 1½b") == Fraction(81759, 2)
+    assert minae.valid("5m")
+    assert not obol.get_standard("attic").valid("5m")
+
+    # 𐅗 (ten minae) is parsed but Χ is used for formatting
+    assert minae.parse("𐅗") == 6_000
+    assert minae.format(6_000, obol.Fmt.GREEK) == "Χ"
+
+
+def test_aeginetan():
+    aeginetan = obol.get_standard("aeginetan")
+
+    assert aeginetan.format(aeginetan.parse("1t 3m 1s 1d 2b"),
+                            obol.Fmt.ENGLISH) == \
+        "1 talent, 3 minae, 1 stater, 1 drachma, 2 obols"
+
+    # Conversions are exact
+    assert aeginetan.convert(42, "attic") == 60
+    assert obol.ATTIC.convert(60, aeginetan) == 42
+    assert obol.ATTIC.convert(1, aeginetan) == Fraction(7, 10)
+    assert aeginetan.to_khremata("7d") == obol.Khremata("10d")
+    assert aeginetan.from_khremata(obol.Khremata("10d")) == 42
+
+
+def test_local_numerals():
+    troezenian = obol.get_standard("troezenian")
+
+    assert troezenian.parse("𐅦𐅠𐅟") == 390
+    assert troezenian.parse("𐅄Δ𐅃") == 390
+    assert troezenian.format(390, obol.Fmt.GREEK) == "𐅦𐅠𐅟"
+
+    with pytest.raises(obol.UnparseableMonetaryString):
+        obol.get_standard("naxian").parse("𐅦")
+
+
+def test_register_standard():
+    units = (("m", "mina", "minae", 600), ("b", "obol", "obols", 1))
+    std = obol.register_standard(
+        obol.MonetaryStandard("test-minae", units, obol.NUMERALS))
+
+    assert obol.get_standard("test-minae") is std
+    assert std.format(1_201) == "2m 1b"
+
+    with pytest.raises(ValueError):
+        obol.MonetaryStandard("bad", units[:1], obol.NUMERALS)
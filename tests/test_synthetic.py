@@ -0,0 +1,63 @@
+import akrophonobolos as obol
+from akrophonobolos import synthetic
+
+
+def test_seeded():
+    a = synthetic.CorpusGenerator(45, ocr_rate=0.1, lacuna_rate=0.1)
+    b = synthetic.CorpusGenerator(45, ocr_rate=0.1, lacuna_rate=0.1)
+
+    assert list(a.numerals(100)) == list(b.numerals(100))
+    assert list(a.accounts(10)) == list(b.accounts(10))
+
+
+def test_well_formed():
+    gen = synthetic.CorpusGenerator(1, lo="1d", hi="10t", step="1d")
+
+    for numeral in gen.numerals(200):
+        amt = obol.Khremata(numeral)
+        assert obol.Khremata("1d") <= amt <= obol.Khremata("10t")
+        assert amt.b % 6 == 0
+
+    for abbr in gen.abbreviations(200):
+        assert obol.valid_amount_str(abbr)
+
+
+def test_distributions():
+    uniform = synthetic.CorpusGenerator(
+        2, lo="1t", hi="2t", distribution=synthetic.Distribution.UNIFORM)
+    assert all(obol.Khremata("1t") <= amt <= obol.Khremata("2t")
+               for amt in uniform.amounts(100))
+
+    fixed = synthetic.CorpusGenerator(distribution=lambda rng: 10)
+    assert set(fixed.amounts(5)) == {obol.Khremata("2½b")}
+
+
+def test_noise():
+    gen = synthetic.CorpusGenerator(3, ocr_rate=1, lacuna_rate=1)
+    for numeral in gen.numerals(50):
+        assert "[" in numeral
+        assert not obol.valid_greek_amount(numeral)
+
+
+def test_accounts(tmp_path):
+    gen = synthetic.CorpusGenerator(4)
+    for loan in gen.accounts(20):
+        assert obol.interest(loan["principal"], loan["days"]) == \
+            loan["interest"]
+
+    path = tmp_path / "loans.csv"
+    assert synthetic.CorpusGenerator(5).write(str(path), 25, "accounts") == 26
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "principal,days,interest"
+    assert all(line.count(",") == 2 and ",," in f",{line},"
+               for line in lines[1:])
+
+
+def test_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(obol.synthetic, "WRITE_LINES", 7)
+    path = tmp_path / "numerals.txt"
+
+    assert synthetic.CorpusGenerator(6).write(str(path), 30) == 30
+    assert path.read_text(encoding="utf-8").splitlines() == \
+        list(synthetic.CorpusGenerator(6).numerals(30))
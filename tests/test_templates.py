@@ -0,0 +1,56 @@
+import akrophonobolos as obol
+from fractions import Fraction
+import pytest
+
+
+def test_compile_format():
+    fmt = obol.compile_format("{t}T {d}D {b:frac}b")
+
+    assert fmt.format(obol.Khremata("1t 813d 1½b")) == "1T 813D 1½b"
+    assert fmt(Fraction(81759, 2)) == "1T 813D 1½b"
+    assert fmt(36_000) == "1T 0D 0b"
+
+
+def test_padded_columns():
+    fmt = obol.compile_format("{t:>3}|{d:04}|{b:5.2f}")
+
+    assert fmt("1t 813d 1½b") == "  1|0813| 1.50"
+    assert fmt(obol.Khremata("12t 5d 0.25b")) == " 12|0005| 0.25"
+
+
+def test_obols():
+    assert obol.compile_format("{b:dec}")(72_013.25) == "1.25"
+    assert obol.compile_format("{obols:dec}")(72_013.25) == "72013.25"
+    assert obol.compile_format("{obols}")(72_013.25) == "72013¼"
+
+
+def test_greek():
+    assert obol.compile_format("{greek}")(40_879.5) == \
+        obol.format_amount(40_879.5, obol.Fmt.GREEK)
+    assert obol.compile_format("{greek:sep=·}")(40_879.5) == \
+        "Τ·𐅅ΗΗΗΔ𐅂𐅂𐅂·Ι𐅁"
+    assert obol.compile_format("{greek:sep=·}")(83_820) == "ΤΤ·Χ𐅅ΗΗΗΗ𐅄ΔΔ"
+
+    # Rounding up can carry into the next unit
+    assert obol.compile_format("{greek:sep=·}")(35_999.9) == "Τ"
+
+
+def test_literal_braces():
+    assert obol.compile_format("{{{t}}}")(36_000) == "{1}"
+
+
+def test_format_many():
+    fmt = obol.compile_format("{t}t {d}d")
+    assert fmt.format_many(["1t", 36_000, obol.Khremata("2t 1d")]) == \
+        ["1t 0d", "1t 0d", "2t 1d"]
+
+
+def test_bad_template():
+    with pytest.raises(ValueError):
+        obol.compile_format("{x}")
+
+    with pytest.raises(ValueError):
+        obol.compile_format("{greek:frac}")
+
+    with pytest.raises(ValueError):
+        obol.compile_format("{t!r}")
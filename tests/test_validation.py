@@ -0,0 +1,37 @@
+import akrophonobolos as obol
+from fractions import Fraction
+
+
+def test_try_parse():
+    assert obol.try_parse("Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁") == \
+        (obol.Khremata("1t 813d 1½b"), obol.ParseError.OK)
+    assert obol.try_parse("1t 813d 1½b") == \
+        (obol.Khremata("1t 813d 1½b"), obol.ParseError.OK)
+    assert obol.try_parse(Fraction(81759, 2)).value == \
+        obol.Khremata("1t 813d 1½b")
+    assert obol.try_parse(6).value == obol.Khremata("1d")
+
+    money = obol.Khremata("1t")
+    assert obol.try_parse(money).value is money
+
+
+def test_try_parse_errors():
+    assert obol.try_parse("1Z") == (None, obol.ParseError.UNPARSEABLE)
+    assert obol.try_parse("Τ𐅅x") == (None, obol.ParseError.UNPARSEABLE)
+    assert obol.try_parse("  ") == (None, obol.ParseError.EMPTY)
+    assert obol.try_parse(float("nan")) == \
+        (None, obol.ParseError.UNPARSEABLE)
+    assert obol.try_parse(None) == \
+        (None, obol.ParseError.UNSUPPORTED_TYPE)
+
+
+def test_classify_amounts():
+    types, valid, values = obol.classify_amounts(
+        ["Τ𐅅ΗΗΗΔ𐅂𐅂𐅂Ι𐅁", "1t 813d", "+", "Τ𐅅 junk", "junk", ""])
+
+    assert types == [obol.AmountType.GREEK, obol.AmountType.ABBR,
+                     obol.AmountType.OP, obol.AmountType.GREEK,
+                     obol.AmountType.UNKNOWN, obol.AmountType.UNKNOWN]
+    assert valid == [True, True, False, False, False, False]
+    assert values == [obol.Khremata("1t 813d 1½b"), obol.Khremata("1t 813d"),
+                      None, None, None, None]